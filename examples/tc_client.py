@@ -1,16 +1,239 @@
 """Taskcluster API client wrapper."""
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 import taskcluster
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps the example runnable without orjson
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    import httpx
+except ImportError:  # GraphQL calls fall back to the pooled requests session
+    httpx = None
+
+# Transport errors from whichever client carried a GraphQL request
+_HTTP_ERRORS: tuple[type[Exception], ...] = (requests.exceptions.RequestException,)
+# Errors raised by raise_for_status(); both carry the failed response as .response
+_HTTP_STATUS_ERRORS: tuple[type[Exception], ...] = (requests.exceptions.HTTPError,)
+if httpx is not None:
+    _HTTP_ERRORS += (httpx.HTTPError,)
+    _HTTP_STATUS_ERRORS += (httpx.HTTPStatusError,)
+
 logger = logging.getLogger(__name__)
 
+# Sized to cover the GraphQL fan-out in list_quarantined_workers
+HTTP_POOL_SIZE = 32
+
+# Cap on concurrent GraphQL requests, and how often a throttled one is retried
+GRAPHQL_MAX_CONCURRENCY = 24
+GRAPHQL_MAX_RETRIES = 3
+# Back-off used when a 429/503 arrives without a usable Retry-After header
+GRAPHQL_DEFAULT_BACKOFF = 1.0
+# Longest wait honoured from a Retry-After header before retrying anyway
+GRAPHQL_MAX_RETRY_AFTER_S = 30.0
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Quarantine state changes slowly, so short-lived cached lookups are safe
+QUARANTINE_CACHE_TTL = 30.0
+QUARANTINE_CACHE_SIZE = 4096
+
+# Largest page the queue's listWorkers endpoint will return
+LIST_WORKERS_PAGE_LIMIT = 1000
+
+# Worker groups are effectively fixed for a worker's lifetime
+WORKER_GROUP_CACHE_SIZE = 16384
+
+_MISSING = object()
+
+_VIEW_WORKER_OP = "ViewWorker"
+_VIEW_WORKER_ARGS = """
+query ViewWorker($provisionerId: String!, $workerType: String!, $workerGroup: String!, $workerId: ID!) {
+  worker(
+    provisionerId: $provisionerId
+    workerType: $workerType
+    workerGroup: $workerGroup
+    workerId: $workerId
+  )"""
+# Only the fields callers read: the latest entry's reason and when it was set
+_VIEW_WORKER_QUERY = (
+    _VIEW_WORKER_ARGS
+    + """ {
+    quarantineDetails {
+      quarantineInfo
+      updatedAt
+    }
+  }
+}
+"""
+)
+# Full quarantine history, for callers that want who/when/until per entry
+_VIEW_WORKER_FULL_QUERY = (
+    _VIEW_WORKER_ARGS
+    + """ {
+    workerId
+    workerGroup
+    quarantineUntil
+    quarantineDetails {
+      updatedAt
+      clientId
+      quarantineUntil
+      quarantineInfo
+    }
+  }
+}
+"""
+)
+# One round-trip for "is this worker quarantined, and why": the workers
+# connection filtered down to a single workerId
+_VIEW_QUARANTINED_WORKER_BY_ID_OP = "ViewQuarantinedWorkerById"
+_VIEW_QUARANTINED_WORKER_BY_ID_QUERY = """
+query ViewQuarantinedWorkerById($provisionerId: String!, $workerType: String!, $filter: JSON) {
+  workers(
+    provisionerId: $provisionerId
+    workerType: $workerType
+    isQuarantined: true
+    filter: $filter
+  ) {
+    pageInfo {
+      hasNextPage
+    }
+    edges {
+      node {
+        workerGroup
+        quarantineDetails {
+          quarantineInfo
+          updatedAt
+        }
+      }
+    }
+  }
+}
+"""
+_QUERY_HASHES = {
+    query: hashlib.sha256(query.encode()).hexdigest()
+    for query in (_VIEW_WORKER_QUERY, _VIEW_WORKER_FULL_QUERY)
+}
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSON request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _retry_after_seconds(value: str | None, attempt: int) -> float:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into a delay.
+
+    The delay is capped at GRAPHQL_MAX_RETRY_AFTER_S so one oversized or
+    far-future header cannot stall the caller.
+    """
+    return min(_parse_retry_after(value, attempt), GRAPHQL_MAX_RETRY_AFTER_S)
+
+
+def _parse_retry_after(value: str | None, attempt: int) -> float:
+    """Parse a Retry-After header, falling back to exponential back-off."""
+    fallback = GRAPHQL_DEFAULT_BACKOFF * (2**attempt)
+    if not value:
+        return fallback
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return fallback
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@functools.cache
+def _view_worker_body_prefix(query: str, send_query: bool, send_hash: bool) -> bytes:
+    """Encode the constant head of a ViewWorker request body, up to "variables"."""
+    head: dict[str, Any] = {"operationName": _VIEW_WORKER_OP}
+    if send_query:
+        head["query"] = query
+    if send_hash:
+        head["extensions"] = {"persistedQuery": {"version": 1, "sha256Hash": _QUERY_HASHES[query]}}
+    return _json_dumps(head)[:-1] + b',"variables":'
+
+
+def _encode_view_worker(
+    payload: dict[str, Any], send_query: bool = True, send_hash: bool = False
+) -> bytes:
+    """Encode a ViewWorker payload, serialising only its variables per call."""
+    prefix = _view_worker_body_prefix(payload["query"], send_query, send_hash)
+    return prefix + _json_dumps(payload["variables"]) + b"}"
+
+
+class _LRUCache:
+    """Thread-safe bounded LRU mapping with an optional per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or _MISSING if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_if(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
 
 class TaskclusterClient:
     """Wrapper for Taskcluster API operations."""
@@ -33,6 +256,115 @@ class TaskclusterClient:
                 "credentials": self.credentials,
             }
         )
+        self._session = self._build_session()
+        self._graphql_client = self._build_graphql_client()
+        self._gql_semaphore = threading.BoundedSemaphore(GRAPHQL_MAX_CONCURRENCY)
+        # (provisioner, worker_type, worker_group, worker_id) -> quarantineDetails
+        self._qd_cache = _LRUCache(QUARANTINE_CACHE_SIZE, ttl=QUARANTINE_CACHE_TTL)
+        # (provisioner, worker_type, worker_id) -> workerGroup
+        self._worker_group_cache = _LRUCache(WORKER_GROUP_CACHE_SIZE)
+        # (provisioner, worker_type, worker_id, fetch_message) -> (is_quarantined, message)
+        self._quarantine_info_cache = _LRUCache(QUARANTINE_CACHE_SIZE, ttl=QUARANTINE_CACHE_TTL)
+        # Automatic persisted queries: None until the server tells us whether it
+        # accepts hash-only ViewWorker requests.
+        self._apq_supported: bool | None = None
+        # None until the first quarantined listWorkers page shows whether the
+        # REST response already carries quarantineDetails.
+        self._listworkers_has_qd: bool | None = None
+        # None until the first workers(filter: ...) query shows whether the
+        # server filters by workerId.
+        self._worker_filter_supported: bool | None = None
+        # None until the first batched GraphQL request tells us whether the
+        # server accepts an array of operations in one POST.
+        self._graphql_batch_supported: bool | None = None
+
+    def __enter__(self) -> "TaskclusterClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._session.close()
+        if self._graphql_client is not None:
+            self._graphql_client.close()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create a keep-alive session shared by all REST and GraphQL calls."""
+        session = requests.Session()
+        # Advertise every encoding urllib3 can decode here (gzip/deflate, plus
+        # br and zstd when brotli/zstandard are installed)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            # POSTs (GraphQL) are throttled and retried by _post_graphql instead
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _build_graphql_client() -> "httpx.Client | None":
+        """
+        Create an HTTP/2 client for the GraphQL endpoint, if httpx[http2] is installed.
+
+        All GraphQL traffic goes to one origin, so HTTP/2 multiplexes the
+        concurrent ViewWorker lookups over a single TLS connection.
+        """
+        if httpx is None:
+            return None
+        return httpx.Client(
+            http2=True,
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE
+            ),
+            timeout=30.0,
+        )
+
+    def _post_graphql(self, body: bytes) -> Any:
+        """
+        POST an encoded GraphQL body, preferring the HTTP/2 client.
+
+        At most GRAPHQL_MAX_CONCURRENCY requests are in flight across all
+        threads. A 429/503 response is retried after the server's Retry-After
+        delay, capped at GRAPHQL_MAX_RETRY_AFTER_S (up to GRAPHQL_MAX_RETRIES
+        times); the last response is returned as-is. The wait happens outside
+        the concurrency slot so other callers keep running.
+        """
+        headers = {"content-type": "application/json"}
+        for attempt in range(GRAPHQL_MAX_RETRIES + 1):
+            with self._gql_semaphore:
+                if self._graphql_client is not None:
+                    response = self._graphql_client.post(
+                        self.graphql_url, headers=headers, content=body
+                    )
+                else:
+                    response = self._session.post(self.graphql_url, headers=headers, data=body)
+            throttled = response.status_code in _THROTTLE_STATUSES
+            if not throttled or attempt == GRAPHQL_MAX_RETRIES:
+                return response
+            delay = _retry_after_seconds(response.headers.get("Retry-After"), attempt)
+            logger.debug(f"GraphQL throttled ({response.status_code}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return response
+
+    def invalidate_quarantine(self, worker_id: str) -> None:
+        """Drop cached quarantine details and state for a worker."""
+        self._qd_cache.discard_if(lambda key: key[3] == worker_id)
+        self._quarantine_info_cache.discard_if(lambda key: key[2] == worker_id)
+
+    def invalidate_worker_group(self, worker_id: str) -> None:
+        """Drop the cached workerGroup for a worker (e.g. after it is re-provisioned)."""
+        self._worker_group_cache.discard_if(lambda key: key[2] == worker_id)
 
     def _load_credentials(self, credentials_path: str) -> dict[str, str]:
         """Load Taskcluster credentials from file."""
@@ -51,12 +383,148 @@ class TaskclusterClient:
 
         return creds
 
+    def _view_worker_payload(
+        self,
+        provisioner_id: str,
+        worker_type: str,
+        worker_group: str,
+        worker_id: str,
+        full_details: bool = False,
+    ) -> dict[str, Any]:
+        """Build the ViewWorker GraphQL operation for a single worker."""
+        variables = {
+            "provisionerId": provisioner_id,
+            "workerType": worker_type,
+            "workerGroup": worker_group,
+            "workerId": worker_id,
+        }
+        # Remove None values from variables (rare: all four are normally set)
+        if None in variables.values():
+            variables = {k: v for k, v in variables.items() if v is not None}
+
+        return {
+            "operationName": _VIEW_WORKER_OP,
+            "variables": variables,
+            "query": _VIEW_WORKER_FULL_QUERY if full_details else _VIEW_WORKER_QUERY,
+        }
+
+    def _graphql_batch(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """
+        POST several GraphQL operations as one JSON array.
+
+        Support is detected once: the first response that clearly rejects
+        arrays (a 4xx other than 429, or a 2xx body that is not a matching
+        list) turns batching off. Transient failures (5xx, a 429 that outlasts
+        _post_graphql's retries, transport errors) only skip batching for this
+        chunk.
+
+        Returns:
+            List of responses in the same order as payloads, or None if this
+            chunk must be fetched with single requests
+        """
+        if self._graphql_batch_supported is False:
+            return None
+
+        try:
+            body = b"[" + b",".join(_encode_view_worker(p) for p in payloads) + b"]"
+            response = self._post_graphql(body)
+            status = response.status_code
+            data = _json_loads(response.content) if 200 <= status < 300 else None
+        except _HTTP_ERRORS as e:
+            logger.debug(f"Batched GraphQL request failed: {e}")
+            return None
+        except ValueError as e:
+            logger.debug(f"Batched GraphQL response was not JSON: {e}")
+            data = None
+
+        if 200 <= status < 300 and isinstance(data, list) and len(data) == len(payloads):
+            self._graphql_batch_supported = True
+            return data
+
+        rejected = 200 <= status < 300 or (400 <= status < 500 and status != 429)
+        if rejected and self._graphql_batch_supported is None:
+            logger.debug("GraphQL endpoint does not support batching, using single requests")
+            self._graphql_batch_supported = False
+        else:
+            logger.debug(f"Batched GraphQL request failed ({status}), using single requests")
+        return None
+
+    def _fetch_quarantine_details_batch(
+        self,
+        provisioner_id: str,
+        worker_type: str,
+        workers: list[dict[str, Any]],
+        full_details: bool = False,
+    ) -> list[Any]:
+        """Fetch quarantineDetails for a chunk of workers, batching when supported."""
+        keys = [
+            (provisioner_id, worker_type, w.get("workerGroup"), w.get("workerId"), full_details)
+            for w in workers
+        ]
+        details = [self._qd_cache.get(key) for key in keys]
+        missing = [i for i, d in enumerate(details) if d is _MISSING]
+        if not missing:
+            return details
+
+        payloads = [self._view_worker_payload(*keys[i]) for i in missing]
+        responses = self._graphql_batch(payloads)
+        if responses is None:
+            for i in missing:
+                details[i] = self.get_quarantine_details_graphql(*keys[i])
+            return details
+
+        for i, resp in zip(missing, responses):
+            worker_data = ((resp or {}).get("data") or {}).get("worker") or {}
+            details[i] = worker_data.get("quarantineDetails")
+            self._qd_cache.put(keys[i], details[i])
+        return details
+
+    def _post_view_worker(self, payload: dict[str, Any]) -> tuple[Any, Any]:
+        """
+        POST a ViewWorker operation, using an automatic persisted query when possible.
+
+        The query text is replaced by its sha256 hash. If the server has not
+        seen the hash yet, the full query is sent once to register it; if it
+        does not support persisted queries, the client stops trying.
+
+        Returns:
+            Tuple of (response, decoded JSON body)
+
+        Raises:
+            requests.exceptions.HTTPError / httpx.HTTPStatusError: If the final request fails
+        """
+        send_hash = False
+        if self._apq_supported is not False:
+            response = self._post_graphql(
+                _encode_view_worker(payload, send_query=False, send_hash=True)
+            )
+            try:
+                data = _json_loads(response.content)
+            except ValueError:
+                data = None
+            errors = (data or {}).get("errors") or []
+            messages = {err.get("message") for err in errors if isinstance(err, dict)}
+            if "PersistedQueryNotFound" in messages:
+                # Send the full query alongside the hash so the server registers it
+                send_hash = True
+            elif "PersistedQueryNotSupported" in messages or 400 <= response.status_code < 500:
+                logger.debug("GraphQL endpoint does not support persisted queries")
+                self._apq_supported = False
+            elif 200 <= response.status_code < 300 and data is not None:
+                self._apq_supported = True
+                return response, data
+
+        response = self._post_graphql(_encode_view_worker(payload, send_hash=send_hash))
+        response.raise_for_status()
+        return response, _json_loads(response.content)
+
     def get_quarantine_details_graphql(
         self,
         provisioner_id: str,
         worker_type: str,
         worker_group: str,
         worker_id: str,
+        full_details: bool = False,
     ) -> dict[str, Any] | None:
         """
         Get quarantine details for a worker using GraphQL API.
@@ -66,77 +534,50 @@ class TaskclusterClient:
             worker_type: Worker type
             worker_group: Worker group
             worker_id: Worker ID
+            full_details: Also select clientId and quarantineUntil for each entry
 
         Returns:
-            Quarantine details dict with updatedAt, clientId, quarantineUntil, quarantineInfo
+            Quarantine details with quarantineInfo and updatedAt (plus clientId and
+            quarantineUntil when full_details is set)
             Returns None if worker not found or not quarantined
         """
-        worker_pool_id = f"{provisioner_id}/{worker_type}"
-
-        headers = {"content-type": "application/json"}
-
-        payload = {
-            "operationName": "ViewWorker",
-            "variables": {
-                "provisionerId": provisioner_id,
-                "workerType": worker_type,
-                "workerGroup": worker_group,
-                "workerId": worker_id,
-            },
-            "query": """
-                query ViewWorker($provisionerId: String!, $workerType: String!, $workerGroup: String!, $workerId: ID!) {
-                  worker(
-                    provisionerId: $provisionerId
-                    workerType: $workerType
-                    workerGroup: $workerGroup
-                    workerId: $workerId
-                  ) {
-                    workerId
-                    workerGroup
-                    quarantineUntil
-                    quarantineDetails {
-                      updatedAt
-                      clientId
-                      quarantineUntil
-                      quarantineInfo
-                      __typename
-                    }
-                    __typename
-                  }
-                }
-            """,
-        }
+        key = (provisioner_id, worker_type, worker_group, worker_id, full_details)
+        cached = self._qd_cache.get(key)
+        if cached is not _MISSING:
+            return cached
 
-        # Remove None values from variables
-        variables = payload.get("variables")
-        if isinstance(variables, dict):
-            payload["variables"] = {k: v for k, v in variables.items() if v is not None}
+        payload = self._view_worker_payload(*key)
 
         try:
-            response = requests.post(self.graphql_url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            _response, data = self._post_view_worker(payload)
 
+            quarantine_details = None
             if "data" in data and "worker" in data["data"]:
                 worker_data = data["data"]["worker"]
                 quarantine_details = worker_data.get("quarantineDetails")
-                return quarantine_details
-            return None
-        except requests.exceptions.HTTPError as e:
+            self._qd_cache.put(key, quarantine_details)
+            return quarantine_details
+        except _HTTP_STATUS_ERRORS as e:
+            logger.warning(f"Failed to fetch quarantine details for {worker_id}: {e}")
             # Log the actual error response for debugging
-            try:
-                error_data = response.json()
-                logger.warning(f"Failed to fetch quarantine details for {worker_id}: {e}")
-                logger.debug(f"GraphQL error response: {error_data}")
-            except:
-                logger.warning(f"Failed to fetch quarantine details for {worker_id}: {e}")
+            if e.response is not None:
+                try:
+                    logger.debug(f"GraphQL error response: {_json_loads(e.response.content)}")
+                except ValueError:
+                    pass
             return None
         except Exception as e:
             logger.warning(f"Failed to fetch quarantine details for {worker_id}: {e}")
             return None
 
     def list_quarantined_workers(
-        self, provisioner_id: str, worker_type: str, fetch_details: bool = False
+        self,
+        provisioner_id: str,
+        worker_type: str,
+        fetch_details: bool = False,
+        max_workers: int = 16,
+        batch_size: int = 50,
+        full_details: bool = False,
     ) -> list[dict[str, Any]]:
         """
         List all quarantined workers for a worker type.
@@ -145,84 +586,248 @@ class TaskclusterClient:
             provisioner_id: Provisioner ID
             worker_type: Worker type
             fetch_details: If True, fetch detailed worker info including quarantine reason
+            max_workers: Number of concurrent GraphQL requests when fetching details
+            batch_size: Number of ViewWorker operations sent per GraphQL POST
+            full_details: Fetch clientId and quarantineUntil for each history entry
 
         Returns:
             List of worker objects with workerId, workerGroup, quarantineDetails, etc.
         """
-        workers = []
-        continuation_token = None
+        query = {"quarantined": "true"}
+        if not fetch_details:
+            return list(self._iter_workers(provisioner_id, worker_type, query))
+
+        # If listWorkers already includes quarantineDetails they are used as-is.
+        # Otherwise they are fetched via GraphQL while pagination is still
+        # running: each batch of workers is submitted as soon as its page
+        # arrives, so detail round-trips overlap the remaining listWorkers pages.
+        # The semaphore caps in-flight batches so a huge pool cannot queue
+        # unbounded work.
+        batch_size = max(1, batch_size)
+        workers: list[dict[str, Any]] = []
+        pending: list[tuple[Future, list[dict[str, Any]]]] = []
+        in_flight = threading.BoundedSemaphore(max(1, max_workers) * 2)
+
+        def fetch(chunk: list[dict[str, Any]]) -> list[Any]:
+            try:
+                return self._fetch_quarantine_details_batch(
+                    provisioner_id, worker_type, chunk, full_details
+                )
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as ex:
+
+            def submit(chunk: list[dict[str, Any]]) -> None:
+                if self._graphql_batch_supported is False:
+                    # Batching is unavailable, so parallelise per worker instead
+                    for worker in chunk:
+                        in_flight.acquire()
+                        pending.append((ex.submit(fetch, [worker]), [worker]))
+                    return
+                in_flight.acquire()
+                future = ex.submit(fetch, chunk)
+                pending.append((future, chunk))
+                if self._graphql_batch_supported is None:
+                    # Let the first batch settle whether batching works before fanning out
+                    wait([future])
+
+            chunk: list[dict[str, Any]] = []
+            for worker in self._iter_workers(provisioner_id, worker_type, query):
+                workers.append(worker)
+                if self._listworkers_has_qd is None:
+                    self._listworkers_has_qd = "quarantineDetails" in worker
+                if self._listworkers_has_qd:
+                    # Newer queue deployments return the history inline; no GraphQL needed
+                    self._apply_quarantine_details(worker, worker.get("quarantineDetails"))
+                    continue
+                chunk.append(worker)
+                if len(chunk) >= batch_size:
+                    submit(chunk)
+                    chunk = []
+            if chunk:
+                submit(chunk)
+
+            for future, chunk in pending:
+                for worker, quarantine_details_list in zip(chunk, future.result()):
+                    self._apply_quarantine_details(worker, quarantine_details_list)
 
-        while True:
-            query = {"quarantined": "true"}
-            if continuation_token:
-                query["continuationToken"] = continuation_token
+        return workers
 
-            response = self.queue.listWorkers(provisioner_id, worker_type, query=query)
+    @staticmethod
+    def _apply_quarantine_details(worker: dict[str, Any], quarantine_details_list: Any) -> None:
+        """Populate quarantine fields on a worker dict from a quarantineDetails history."""
+        if quarantine_details_list and isinstance(quarantine_details_list, list):
+            # quarantineDetails is an array of history entries
+            # Get the most recent entry (last in the list)
+            latest_details = quarantine_details_list[-1]
+            # Store the full quarantine details history
+            worker["quarantineDetailsHistory"] = quarantine_details_list
+            # Store the latest entry for convenience
+            worker["quarantineDetails"] = latest_details
+            # Extract the quarantineInfo (the reason) for easy access
+            worker["quarantineInfo"] = latest_details.get("quarantineInfo", "")
+        else:
+            worker["quarantineInfo"] = ""
+
+    async def aget_quarantine_details_graphql(
+        self,
+        session: aiohttp.ClientSession,
+        provisioner_id: str,
+        worker_type: str,
+        worker_group: str,
+        worker_id: str,
+    ) -> dict[str, Any] | None:
+        """
+        Async twin of get_quarantine_details_graphql using a caller-owned aiohttp session.
 
-            workers.extend(response.get("workers", []))
+        Returns:
+            Quarantine details, or None if worker not found or the request failed
+        """
+        key = (provisioner_id, worker_type, worker_group, worker_id, False)
+        cached = self._qd_cache.get(key)
+        if cached is not _MISSING:
+            return cached
 
-            continuation_token = response.get("continuationToken")
-            if not continuation_token:
-                break
+        body = _encode_view_worker(self._view_worker_payload(*key))
+        try:
+            for attempt in range(GRAPHQL_MAX_RETRIES + 1):
+                async with session.post(
+                    self.graphql_url,
+                    data=body,
+                    headers={"content-type": "application/json"},
+                ) as response:
+                    if (
+                        response.status in _THROTTLE_STATUSES
+                        and attempt < GRAPHQL_MAX_RETRIES
+                    ):
+                        retry_after = response.headers.get("Retry-After")
+                        await asyncio.sleep(_retry_after_seconds(retry_after, attempt))
+                        continue
+                    response.raise_for_status()
+                    data = _json_loads(await response.read())
+                    break
+        except Exception as e:
+            logger.warning(f"Failed to fetch quarantine details for {worker_id}: {e}")
+            return None
 
-        # If fetch_details is True, get quarantine details via GraphQL
-        if fetch_details:
-            for worker in workers:
-                worker_id = worker.get("workerId")
-                worker_group = worker.get("workerGroup")
+        worker_data = (data.get("data") or {}).get("worker") or {}
+        quarantine_details = worker_data.get("quarantineDetails")
+        self._qd_cache.put(key, quarantine_details)
+        return quarantine_details
 
-                # Fetch quarantine details via GraphQL
-                quarantine_details_list = self.get_quarantine_details_graphql(
-                    provisioner_id, worker_type, worker_group, worker_id
-                )
+    async def alist_quarantined_workers(
+        self,
+        provisioner_id: str,
+        worker_type: str,
+        fetch_details: bool = False,
+        max_workers: int = 64,
+    ) -> list[dict[str, Any]]:
+        """
+        Async twin of list_quarantined_workers.
 
-                if quarantine_details_list and isinstance(quarantine_details_list, list):
-                    # quarantineDetails is an array of history entries
-                    # Get the most recent entry (last in the list)
-                    if len(quarantine_details_list) > 0:
-                        latest_details = quarantine_details_list[-1]
-                        # Store the full quarantine details history
-                        worker["quarantineDetailsHistory"] = quarantine_details_list
-                        # Store the latest entry for convenience
-                        worker["quarantineDetails"] = latest_details
-                        # Extract the quarantineInfo (the reason) for easy access
-                        worker["quarantineInfo"] = latest_details.get("quarantineInfo", "")
-                    else:
-                        worker["quarantineInfo"] = ""
-                else:
-                    worker["quarantineInfo"] = ""
+        Pagination still goes through the sync SDK (in a worker thread); the
+        per-worker GraphQL lookups are overlapped on one aiohttp connection pool.
+
+        Args:
+            provisioner_id: Provisioner ID
+            worker_type: Worker type
+            fetch_details: If True, fetch detailed worker info including quarantine reason
+            max_workers: Maximum number of in-flight GraphQL requests
 
+        Returns:
+            List of worker objects with workerId, workerGroup, quarantineDetails, etc.
+        """
+        workers = await asyncio.to_thread(
+            self.list_quarantined_workers, provisioner_id, worker_type
+        )
+        if not fetch_details or not workers:
+            return workers
+        if "quarantineDetails" in workers[0]:
+            # Newer queue deployments return the history inline; no GraphQL needed
+            for worker in workers:
+                self._apply_quarantine_details(worker, worker.get("quarantineDetails"))
+            return workers
+
+        connector = aiohttp.TCPConnector(limit=max_workers)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            details = await asyncio.gather(
+                *[
+                    self.aget_quarantine_details_graphql(
+                        session,
+                        provisioner_id,
+                        worker_type,
+                        w.get("workerGroup"),
+                        w.get("workerId"),
+                    )
+                    for w in workers
+                ]
+            )
+
+        for worker, quarantine_details_list in zip(workers, details):
+            self._apply_quarantine_details(worker, quarantine_details_list)
         return workers
 
-    def list_all_workers(self, provisioner_id: str, worker_type: str) -> list[dict[str, Any]]:
+    def _list_workers_page(
+        self, provisioner_id: str, worker_type: str, query: dict[str, str]
+    ) -> dict[str, Any]:
         """
-        List all workers for a worker type.
+        Fetch one listWorkers page straight from the queue REST API.
 
-        Returns:
-            List of worker objects with workerId, workerGroup, etc.
+        listWorkers needs no credentials, so this skips the SDK's request
+        signing and goes through the pooled session. self.queue is kept for the
+        authenticated quarantine mutations.
+        """
+        url = (
+            f"{self.queue_v1_base}/provisioners/{provisioner_id}"
+            f"/worker-types/{worker_type}/workers"
+        )
+        response = self._session.get(url, params=query, timeout=30)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _iter_workers(
+        self, provisioner_id: str, worker_type: str, query: dict[str, str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield workers page by page so callers can stop paginating early.
+
+        Pages are requested at the server's maximum size. Continuation tokens
+        are opaque and each comes from the previous page, so pages cannot be
+        prefetched in parallel; fewer, larger pages are the only way to cut
+        round-trips.
         """
-        workers = []
         continuation_token = None
 
         while True:
-            query = {}
+            page_query = {"limit": str(LIST_WORKERS_PAGE_LIMIT), **(query or {})}
             if continuation_token:
-                query["continuationToken"] = continuation_token
+                page_query["continuationToken"] = continuation_token
 
-            response = self.queue.listWorkers(provisioner_id, worker_type, query=query)
+            response = self._list_workers_page(provisioner_id, worker_type, page_query)
 
-            workers.extend(response.get("workers", []))
+            yield from response.get("workers", [])
 
             continuation_token = response.get("continuationToken")
             if not continuation_token:
                 break
 
-        return workers
+    def list_all_workers(self, provisioner_id: str, worker_type: str) -> list[dict[str, Any]]:
+        """
+        List all workers for a worker type.
+
+        Returns:
+            List of worker objects with workerId, workerGroup, etc.
+        """
+        return list(self._iter_workers(provisioner_id, worker_type))
 
     def get_worker_group(self, provisioner_id: str, worker_type: str, worker_id: str) -> str:
         """
         Determine worker group for a specific worker.
 
+        Results are cached per client. Pagination stops at the page containing
+        the worker, so only a miss walks the whole pool.
+
         Args:
             provisioner_id: Provisioner ID
             worker_type: Worker type
@@ -234,25 +839,26 @@ class TaskclusterClient:
         Raises:
             ValueError: If worker not found or multiple worker groups exist
         """
-        # Try to find the worker in the list
-        workers = self.list_all_workers(provisioner_id, worker_type)
-
-        for worker in workers:
-            if worker.get("workerId") == worker_id:
-                worker_group = worker.get("workerGroup")
-                if worker_group:
-                    return worker_group
-                raise ValueError(f"Worker {worker_id} found but has no workerGroup set")
+        key = (provisioner_id, worker_type, worker_id)
+        cached = self._worker_group_cache.get(key)
+        if cached is not _MISSING:
+            return cached
 
-        # Fallback: enumerate worker groups
+        # Try to find the worker, remembering groups seen for the fallback
         worker_groups = set()
-        for worker in workers:
+        for worker in self._iter_workers(provisioner_id, worker_type):
             wg = worker.get("workerGroup")
+            if worker.get("workerId") == worker_id:
+                if wg:
+                    self._worker_group_cache.put(key, wg)
+                    return wg
+                raise ValueError(f"Worker {worker_id} found but has no workerGroup set")
             if wg:
                 worker_groups.add(wg)
 
+        # Fallback: enumerate worker groups
         if len(worker_groups) == 1:
-            return list(worker_groups)[0]
+            return next(iter(worker_groups))
         if len(worker_groups) == 0:
             raise ValueError(f"Cannot determine workerGroup for {worker_id}: no workers found")
         raise ValueError(
@@ -283,6 +889,7 @@ class TaskclusterClient:
             "quarantineInfo": quarantine_message,
         }
         self.queue.quarantineWorker(provisioner_id, worker_type, worker_group, worker_id, payload)
+        self.invalidate_quarantine(worker_id)
 
     def unquarantine_worker(
         self,
@@ -307,6 +914,7 @@ class TaskclusterClient:
             "quarantineInfo": reason,
         }
         self.queue.quarantineWorker(provisioner_id, worker_type, worker_group, worker_id, payload)
+        self.invalidate_quarantine(worker_id)
 
     def get_worker_details(
         self,
@@ -332,9 +940,26 @@ class TaskclusterClient:
             f"/worker-types/{worker_type}/workers/{worker_group}/{worker_id}"
         )
 
-        response = requests.get(url)
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
+
+    async def aget_worker_details(
+        self,
+        session: aiohttp.ClientSession,
+        provisioner_id: str,
+        worker_type: str,
+        worker_group: str,
+        worker_id: str,
+    ) -> dict[str, Any]:
+        """Async twin of get_worker_details using a caller-owned aiohttp session."""
+        url = (
+            f"{self.queue_v1_base}/provisioners/{provisioner_id}"
+            f"/worker-types/{worker_type}/workers/{worker_group}/{worker_id}"
+        )
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
 
     def get_pending_queue_count(
         self,
@@ -354,9 +979,9 @@ class TaskclusterClient:
         url = f"{self.queue_v1_base}/pending/{provisioner_id}/{worker_type}"
 
         try:
-            response = requests.get(url)
+            response = self._session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             return data.get("pendingTasks", 0)
         except Exception as e:
             logger.warning(f"Failed to fetch pending queue count: {e}")
@@ -375,11 +1000,11 @@ class TaskclusterClient:
         url = f"{self.queue_v1_base}/task/{task_id}/status"
 
         try:
-            response = requests.get(url)
+            response = self._session.get(url)
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException:
             return None
 
@@ -398,34 +1023,134 @@ class TaskclusterClient:
         provisioner_id: str,
         worker_type: str,
         worker_id: str,
+        fetch_message: bool = True,
     ) -> tuple[bool, str | None]:
         """
         Get current quarantine state and message for a worker.
 
+        Only currently quarantined workers count: a worker whose quarantine
+        has expired is reported as not quarantined even if it still has
+        quarantineDetails history. When the message is wanted, one GraphQL
+        workers query filtered by workerId answers both questions. Otherwise
+        (or if the server cannot filter) the quarantined listWorkers view is
+        scanned until the worker is found, and GraphQL is only queried for the
+        message. Results are cached for QUARANTINE_CACHE_TTL seconds and
+        dropped when this client quarantines or unquarantines the worker.
+
         Args:
             provisioner_id: Provisioner ID
             worker_type: Worker type
             worker_id: Worker ID
+            fetch_message: If False, skip the GraphQL lookup and return None
+                as the message for quarantined workers
 
         Returns:
             Tuple of (is_quarantined, quarantine_message)
         """
-        # First, get worker_group
+        key = (provisioner_id, worker_type, worker_id, fetch_message)
+        cached = self._quarantine_info_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+        result = self._fetch_worker_quarantine_info(
+            provisioner_id, worker_type, worker_id, fetch_message
+        )
+        self._quarantine_info_cache.put(key, result)
+        return result
+
+    def _query_quarantined_worker_by_id(
+        self, provisioner_id: str, worker_type: str, worker_id: str
+    ) -> tuple[bool, str | None] | None:
+        """
+        Resolve quarantine state and message with one filtered GraphQL workers query.
+
+        Returns:
+            Tuple of (is_quarantined, quarantine_message), or None when the
+            answer is inconclusive (filter unsupported, request failed, or the
+            server filtered only the first page) and the caller should fall
+            back to the listWorkers scan
+        """
+        body = _json_dumps(
+            {
+                "operationName": _VIEW_QUARANTINED_WORKER_BY_ID_OP,
+                "variables": {
+                    "provisionerId": provisioner_id,
+                    "workerType": worker_type,
+                    "filter": {"workerId": worker_id},
+                },
+                "query": _VIEW_QUARANTINED_WORKER_BY_ID_QUERY,
+            }
+        )
         try:
-            worker_group = self.get_worker_group(provisioner_id, worker_type, worker_id)
-        except ValueError as e:
-            logger.debug(f"Worker {worker_id} not found: {e}")
+            response = self._post_graphql(body)
+            data = _json_loads(response.content)
+        except (*_HTTP_ERRORS, ValueError) as e:
+            logger.debug(f"Filtered workers query failed for {worker_id}: {e}")
+            return None
+
+        workers_data = (data.get("data") or {}).get("workers")
+        if data.get("errors") and workers_data is None:
+            logger.debug("GraphQL workers connection does not accept a filter")
+            self._worker_filter_supported = False
+            return None
+        if not 200 <= response.status_code < 300 or workers_data is None:
+            return None
+        self._worker_filter_supported = True
+
+        nodes = [edge.get("node") or {} for edge in workers_data.get("edges") or []]
+        if not nodes:
+            if (workers_data.get("pageInfo") or {}).get("hasNextPage"):
+                # Filter applied per page only; a later page may hold the worker
+                return None
             return False, None
 
+        node = nodes[0]
+        worker_group = node.get("workerGroup")
+        if worker_group:
+            self._worker_group_cache.put((provisioner_id, worker_type, worker_id), worker_group)
+        quarantine_details = node.get("quarantineDetails")
+        message = ""
+        if isinstance(quarantine_details, list) and quarantine_details:
+            message = quarantine_details[-1].get("quarantineInfo", "")
+        logger.debug(f"Worker {worker_id}: quarantine_message='{message}'")
+        return True, message
+
+    def _fetch_worker_quarantine_info(
+        self,
+        provisioner_id: str,
+        worker_type: str,
+        worker_id: str,
+        fetch_message: bool,
+    ) -> tuple[bool, str | None]:
+        """Uncached body of get_worker_quarantine_info."""
+        if fetch_message and self._worker_filter_supported is not False:
+            found = self._query_quarantined_worker_by_id(provisioner_id, worker_type, worker_id)
+            if found is not None:
+                return found
+
+        worker_group = None
+        for worker in self._iter_workers(provisioner_id, worker_type, {"quarantined": "true"}):
+            if worker.get("workerId") == worker_id:
+                worker_group = worker.get("workerGroup")
+                break
+        else:
+            logger.debug(f"Worker {worker_id} is not quarantined")
+            return False, None
+
+        if worker_group:
+            self._worker_group_cache.put((provisioner_id, worker_type, worker_id), worker_group)
+
+        if not fetch_message:
+            return True, None
+
+        if not worker_group:
+            logger.debug(f"Worker {worker_id} has no workerGroup, cannot fetch message")
+            return True, ""
+
         # Fetch detailed quarantine info using GraphQL
         quarantine_details = self.get_quarantine_details_graphql(
             provisioner_id, worker_type, worker_group, worker_id
         )
 
-        if not quarantine_details:
-            # No quarantine details means not quarantined
-            return False, None
-
         # Extract quarantine message from details
         message = ""
         if isinstance(quarantine_details, list) and len(quarantine_details) > 0:
@@ -438,5 +1163,4 @@ class TaskclusterClient:
 
         logger.debug(f"Worker {worker_id}: quarantine_message='{message}'")
 
-        # Worker is quarantined if we got quarantine details
         return True, message
@@ -9,10 +9,14 @@ Design goals:
 
 from __future__ import annotations
 
-from .cli import main
+from typing import TYPE_CHECKING, Any
+
 from .constants import DEFAULT_OVERRIDE_PATH, DEFAULT_ROLE_PATH
 from .exceptions import FleetRollError, UserError
 
+if TYPE_CHECKING:
+    from .cli import main
+
 __all__ = [
     "DEFAULT_OVERRIDE_PATH",
     "DEFAULT_ROLE_PATH",
@@ -20,3 +24,13 @@ __all__ = [
     "UserError",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The click command tree is only built when the CLI entry point is used,
+    # not when library code imports fleetroll.audit, fleetroll.db, etc.
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
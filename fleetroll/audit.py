@@ -3,51 +3,126 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import contextlib
 import datetime
+import functools
+import itertools
 import json
 import os
 import sqlite3
-import tempfile
 import threading
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any
-
-from .constants import CONTENT_PREFIX_LEN, CONTENT_PREFIX_STEP, CONTENT_SENTINEL
+from typing import TYPE_CHECKING, Any
+
+from .constants import (
+    CONTENT_PREFIX_LEN,
+    CONTENT_PREFIX_STEP,
+    CONTENT_SENTINEL,
+    JSONL_READ_BUFFER_SIZE,
+)
 from .exceptions import FleetRollError
 from .utils import ensure_parent_dir, parse_kv_lines, sha256_hex, utc_now_iso
 
+if TYPE_CHECKING:
+    from .db import ObservationWriter
+
+try:  # optional: orjson is much faster than stdlib json on the audit write path
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+_temp_counter = itertools.count()
+
+
+def _dumps_jsonl(record: dict[str, Any]) -> bytes:
+    """Serialize a record as one sorted-key, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+
+
+def _dumps_json(record: dict[str, Any]) -> str:
+    """Serialize a record to compact JSON text (unsorted)."""
+    if orjson is not None:
+        return orjson.dumps(record).decode("utf-8")
+    return json.dumps(record)
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse a JSON document (e.g. one JSONL line) directly from raw bytes.
+
+    Raises:
+        ValueError: If data is not valid UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def append_jsonl(path: Path, record: dict[str, Any]) -> None:
     """Append a JSON record to a JSONL file."""
     ensure_parent_dir(path)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, sort_keys=True) + "\n")
+    line = _dumps_jsonl(record)
+    with path.open("ab") as f:
+        f.write(line)
 
 
 def iter_audit_records(path: Path) -> Iterable[dict[str, Any]]:
     """Yield JSONL records from the audit log, skipping invalid lines."""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
+        with path.open("rb", buffering=JSONL_READ_BUFFER_SIZE) as f:
+            for raw in f:
+                line = raw.strip()
                 if not line:
                     continue
                 try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
+                    yield _loads_json(line)
+                except ValueError:
                     continue
     except FileNotFoundError:
         return
 
 
-def store_content_file(content: str, sha256: str, target_dir: Path) -> Path:
+def _write_atomic(target_path: Path, data: bytes) -> None:
+    """Write data to target_path via an exclusive hidden temp file and os.replace().
+
+    Temp names come from the pid and a process-wide counter instead of
+    tempfile's random names; O_EXCL guards against a stale file of the same name.
+    """
+    while True:
+        temp_path = target_path.with_name(
+            f".tmp.{target_path.name}.{os.getpid()}.{next(_temp_counter)}"
+        )
+        try:
+            # 0o600 matches the mkstemp permissions these files have always had
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            continue
+        break
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        # Clean up temp file on error
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def store_content_file(content_bytes: bytes, sha256: str, target_dir: Path) -> Path:
     """
     Store content to file named by SHA prefix (no extension).
     Returns path to stored file.
     Handles collisions by extending prefix length.
-    Thread-safe via atomic write-then-rename.
+    Thread-safe via atomic write-then-replace.
+    Callers pass the bytes they already hashed, so nothing is re-encoded.
     """
     ensure_parent_dir(target_dir / "dummy")  # Ensure target_dir exists
 
@@ -58,9 +133,11 @@ def store_content_file(content: str, sha256: str, target_dir: Path) -> Path:
 
         # Check if file already exists
         if target_path.exists():
-            # Read and compare content
-            existing_content = target_path.read_text(encoding="utf-8", errors="replace")
-            if existing_content == content:
+            # A full-length name already identifies the content
+            if prefix_len == 64:
+                return target_path
+            # Compare raw bytes; no need to decode the existing file
+            if target_path.read_bytes() == content_bytes:
                 # Same content, return existing path (idempotent)
                 return target_path
             # Collision: different content, extend prefix
@@ -68,40 +145,39 @@ def store_content_file(content: str, sha256: str, target_dir: Path) -> Path:
             continue
 
         # File doesn't exist, write it atomically
-        # Create temp file in same directory for atomic rename
-        fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix=".tmp_", text=True)
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-            # Atomic rename
-            Path(temp_path).rename(target_path)
-            return target_path
-        except Exception:
-            # Clean up temp file on error
-            Path(temp_path).unlink(missing_ok=True)
-            raise
+        _write_atomic(target_path, content_bytes)
+        return target_path
 
     # Should never reach here (would need 64-char collision)
     raise FleetRollError(f"Unable to store content file: too many collisions for SHA {sha256}")
 
 
-def store_override_file(content: str, sha256: str, overrides_dir: Path) -> Path:
+def store_override_file(content_bytes: bytes, sha256: str, overrides_dir: Path) -> Path:
     """Store override content to file named by SHA prefix (no extension)."""
-    return store_content_file(content, sha256, overrides_dir)
+    return store_content_file(content_bytes, sha256, overrides_dir)
+
 
+def _scan_vault_checksums(path: Path, *, start: int = 0) -> tuple[dict[str, tuple[str, str]], int]:
+    """Scan the audit log from byte offset start for the latest (sha256, ts) per host.
 
-def load_latest_vault_checksums(path: Path) -> dict[str, str]:
-    """Return latest vault sha256 per host from audit log."""
-    latest: dict[str, str] = {}
+    Returns the scanned checksums and the offset just past the last complete
+    line, so a record still being written is picked up by the next scan.
+    """
+    latest: dict[str, tuple[str, str]] = {}
+    offset = start
     try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
+        with path.open("rb", buffering=JSONL_READ_BUFFER_SIZE) as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                line = raw.strip()
                 if not line:
                     continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    record = _loads_json(line)
+                except ValueError:
                     continue
                 if record.get("action") != "host.set_vault":
                     continue
@@ -111,31 +187,97 @@ def load_latest_vault_checksums(path: Path) -> dict[str, str]:
                 params = record.get("parameters") or {}
                 sha = params.get("sha256")
                 if host and sha:
-                    latest[host] = sha
+                    latest[host] = (sha, record.get("ts") or "")
+    except FileNotFoundError:
+        return {}, 0
+    return latest, offset
+
+
+def sync_vault_checksums_from_jsonl(conn: sqlite3.Connection, path: Path) -> dict[str, str]:
+    """Bring the vault_checksums rows for an audit log up to date and return them.
+
+    Only bytes appended since the last sync are scanned. A log that was replaced
+    (new inode), truncated, or never indexed is rescanned from the start.
+    """
+    from .db import (
+        clear_vault_checksums,
+        get_vault_checksum_source,
+        get_vault_checksums,
+        set_vault_checksum_source,
+        update_vault_checksum,
+    )
+
+    try:
+        st = path.stat()
     except FileNotFoundError:
+        clear_vault_checksums(conn, path)
+        conn.commit()
         return {}
-    return latest
+    source = get_vault_checksum_source(conn, path)
+    start = 0
+    if source is not None and source[0] == st.st_ino and source[1] <= st.st_size:
+        start = source[1]
+    else:
+        clear_vault_checksums(conn, path)
+    scanned, offset = _scan_vault_checksums(path, start=start)
+    for host, (sha, ts) in scanned.items():
+        update_vault_checksum(conn, path, host, sha, ts)
+    set_vault_checksum_source(conn, path, st.st_ino, offset)
+    conn.commit()
+    return get_vault_checksums(conn, path)
+
+
+def load_latest_vault_checksums(
+    path: Path, *, conn: sqlite3.Connection | None = None
+) -> dict[str, str]:
+    """Return latest vault sha256 per host.
+
+    With ``conn``, checksums are served from the vault_checksums rows for this
+    audit log after indexing whatever was appended since the last call. Without
+    it, or if the tables do not exist, the audit log is scanned.
+    """
+    if conn is not None:
+        try:
+            return sync_vault_checksums_from_jsonl(conn, path)
+        except sqlite3.OperationalError:
+            conn.rollback()
+    scanned, _offset = _scan_vault_checksums(path)
+    return {host: sha for host, (sha, _ts) in scanned.items()}
 
 
 def has_content_file(sha256: str, target_dir: Path) -> bool:
-    """Return True if target_dir contains content matching sha256."""
-    if not target_dir.exists():
-        return False
-    prefix = sha256[:12]
-    for entry in target_dir.iterdir():
-        if not entry.is_file():
-            continue
-        name = entry.name
-        if len(name) < 12 or not sha256.startswith(name):
-            continue
-        if not name.startswith(prefix):
+    """Return True if target_dir contains content matching sha256.
+
+    Probes the same prefix sequence store_content_file() writes, so only
+    candidates named by this sha are read and hashed. store_content_file()
+    always takes the first free prefix, so a missing name ends the search.
+    """
+    for prefix_len in range(CONTENT_PREFIX_LEN, 65, CONTENT_PREFIX_STEP):
+        candidate = target_dir / sha256[:prefix_len]
+        try:
+            content = candidate.read_bytes()
+        except FileNotFoundError:
+            return False
+        except IsADirectoryError:
             continue
-        content = entry.read_bytes()
         if sha256_hex(content) == sha256:
             return True
     return False
 
 
+@functools.lru_cache(maxsize=4096)
+def _iso_to_epoch(ts: str) -> int | None:
+    """Convert an ISO timestamp to integer epoch seconds, or None if unparseable.
+
+    Memoized because hosts audited in the same window often share a puppet
+    run timestamp.
+    """
+    try:
+        return int(datetime.datetime.fromisoformat(ts).timestamp())
+    except ValueError:
+        return None
+
+
 def _normalize_na(value: Any) -> Any:
     """Convert 'NA' string values to None (used to normalize Windows JSON fields)."""
     if value == "NA":
@@ -143,21 +285,64 @@ def _normalize_na(value: Any) -> Any:
     return value
 
 
+def _kv_flag(value: str) -> bool:
+    return value == "1"
+
+
+# (observed field, PP_STATE_JSON key); puppet_last_run_epoch is derived from ts
+_PUPPET_JSON_FIELDS: tuple[tuple[str, str], ...] = (
+    ("puppet_state_ts", "ts"),
+    ("puppet_success", "success"),
+    ("puppet_git_sha", "git_sha"),
+    ("puppet_git_repo", "git_repo"),
+    ("puppet_git_branch", "git_branch"),
+    ("puppet_git_dirty", "git_dirty"),
+    ("puppet_override_sha_applied", "override_sha"),
+    ("puppet_vault_sha_applied", "vault_sha"),
+    ("puppet_role", "role"),
+    ("puppet_exit_code", "exit_code"),
+    ("puppet_duration_s", "duration_s"),
+)
+
+# (observed field, legacy KV header key, parser), used when the JSON state left
+# the field unset. Order is the order the fields appear in "observed".
+_PUPPET_KV_FALLBACKS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("puppet_state_ts", "PP_STATE_TS", str),
+    ("puppet_last_run_epoch", "PP_LAST_RUN_EPOCH", int),
+    ("puppet_success", "PP_SUCCESS", _kv_flag),
+    ("puppet_git_sha", "PP_GIT_SHA", str),
+    ("puppet_git_repo", "PP_GIT_REPO", str),
+    ("puppet_git_branch", "PP_GIT_BRANCH", str),
+    ("puppet_git_dirty", "PP_GIT_DIRTY", _kv_flag),
+    ("puppet_override_sha_applied", "PP_OVERRIDE_SHA_APPLIED", str),
+    ("puppet_vault_sha_applied", "PP_VAULT_SHA_APPLIED", str),
+    ("puppet_role", "PP_ROLE", str),
+    ("puppet_exit_code", "PP_EXIT_CODE", int),
+    ("puppet_duration_s", "PP_DURATION_S", int),
+)
+_PUPPET_FIELDS = tuple(field for field, _key, _parse in _PUPPET_KV_FALLBACKS)
+
+
 def process_audit_result(
     host: str,
     *,
     rc: int,
     out: str,
     err: str,
-    db_conn: sqlite3.Connection,
+    db_conn: sqlite3.Connection | None = None,
     actor: str,
     overrides_dir: Path | None = None,
     vault_sha256: str | None = None,
     vault_present: bool | None = None,
     vault_meta: dict[str, str] | None = None,
     log_lock: threading.Lock | None = None,
+    writer: ObservationWriter | None = None,
 ) -> dict[str, Any]:
-    """Process audit SSH result into structured dict."""
+    """Process audit SSH result into structured dict.
+
+    The observation is handed to ``writer`` when given (batched commits from a
+    single writer thread); otherwise it is inserted and committed on ``db_conn``.
+    """
     # Split content if present
     sentinel = CONTENT_SENTINEL
     content = ""
@@ -166,12 +351,15 @@ def process_audit_result(
         header, content = out.split(sentinel + "\n", 1)
 
     info = parse_kv_lines(header)
-    override_present = info.get("OVERRIDE_PRESENT") == "1"
-    vault_present = info.get("VLT_PRESENT") == "1" if "VLT_PRESENT" in info else vault_present
-    role_present = info.get("ROLE_PRESENT") == "1"
-    os_type = info.get("OS_TYPE")
+    info_get = info.get
+    override_present = info_get("OVERRIDE_PRESENT") == "1"
+    vlt_present_raw = info_get("VLT_PRESENT")
+    if vlt_present_raw is not None:
+        vault_present = vlt_present_raw == "1"
+    role_present = info_get("ROLE_PRESENT") == "1"
+    os_type = info_get("OS_TYPE")
     uptime_s = None
-    uptime_raw = info.get("UPTIME_S")
+    uptime_raw = info_get("UPTIME_S")
     if uptime_raw:
         try:
             uptime_s = int(uptime_raw)
@@ -179,174 +367,120 @@ def process_audit_result(
             uptime_s = None
 
     # Parse puppet state from base64-encoded JSON
-    puppet_state_ts = None
-    puppet_git_sha = None
-    puppet_git_repo = None
-    puppet_git_branch = None
-    puppet_override_sha_applied = None
-    puppet_vault_sha_applied = None
-    puppet_role = None
-    puppet_last_run_epoch = None
-    puppet_exit_code = None
-    puppet_duration_s = None
-    puppet_success = None
-    puppet_git_dirty = None
-
-    pp_state_json_b64 = info.get("PP_STATE_JSON")
+    pp: dict[str, Any] = dict.fromkeys(_PUPPET_FIELDS)
+    pp_state_json_b64 = info_get("PP_STATE_JSON")
     if pp_state_json_b64:
         try:
-            # Decode base64 and parse JSON
-            pp_state_json = base64.b64decode(pp_state_json_b64).decode("utf-8")
-            pp_state = json.loads(pp_state_json)
-
+            # Decode base64 and parse the JSON bytes without a str intermediate
+            pp_state = _loads_json(base64.b64decode(pp_state_json_b64))
+        except (ValueError, binascii.Error):
+            # If parsing fails, leave all fields as None
+            pp_state = None
+        if pp_state is not None:
             # Extract fields from JSON; normalize "NA" strings to None
-            puppet_state_ts = _normalize_na(pp_state.get("ts"))
-            puppet_git_sha = _normalize_na(pp_state.get("git_sha"))
-            puppet_git_repo = _normalize_na(pp_state.get("git_repo"))
-            puppet_git_branch = _normalize_na(pp_state.get("git_branch"))
-            puppet_override_sha_applied = _normalize_na(pp_state.get("override_sha"))
-            puppet_vault_sha_applied = _normalize_na(pp_state.get("vault_sha"))
-            puppet_role = _normalize_na(pp_state.get("role"))
-            puppet_exit_code = _normalize_na(pp_state.get("exit_code"))
-            puppet_duration_s = _normalize_na(pp_state.get("duration_s"))
-            puppet_success = _normalize_na(pp_state.get("success"))
-            puppet_git_dirty = _normalize_na(pp_state.get("git_dirty"))
+            for field, json_key in _PUPPET_JSON_FIELDS:
+                pp[field] = _normalize_na(pp_state.get(json_key))
 
             # Convert timestamp to epoch
-            if puppet_state_ts:
-                try:
-                    ts_dt = datetime.datetime.fromisoformat(puppet_state_ts)
-                    puppet_last_run_epoch = int(ts_dt.timestamp())
-                except (ValueError, AttributeError):
-                    pass
-
-        except (ValueError, json.JSONDecodeError, UnicodeDecodeError):
-            # If parsing fails, leave all fields as None
-            pass
+            state_ts = pp["puppet_state_ts"]
+            if state_ts and isinstance(state_ts, str):
+                pp["puppet_last_run_epoch"] = _iso_to_epoch(state_ts)
 
     # Backward compatibility: Fall back to old format fields if new format not present
-    if puppet_state_ts is None and "PP_STATE_TS" in info:
-        puppet_state_ts = info["PP_STATE_TS"]
-
-    if puppet_last_run_epoch is None and "PP_LAST_RUN_EPOCH" in info:
-        with contextlib.suppress(ValueError, TypeError):
-            puppet_last_run_epoch = int(info["PP_LAST_RUN_EPOCH"])
-
-    if puppet_success is None and "PP_SUCCESS" in info:
-        with contextlib.suppress(ValueError, TypeError):
-            puppet_success = info["PP_SUCCESS"] == "1"
-
-    if puppet_git_sha is None and "PP_GIT_SHA" in info:
-        puppet_git_sha = info["PP_GIT_SHA"]
-
-    if puppet_git_repo is None and "PP_GIT_REPO" in info:
-        puppet_git_repo = info["PP_GIT_REPO"]
-
-    if puppet_git_branch is None and "PP_GIT_BRANCH" in info:
-        puppet_git_branch = info["PP_GIT_BRANCH"]
-
-    if puppet_git_dirty is None and "PP_GIT_DIRTY" in info:
-        with contextlib.suppress(ValueError, TypeError):
-            puppet_git_dirty = info["PP_GIT_DIRTY"] == "1"
-
-    if puppet_override_sha_applied is None and "PP_OVERRIDE_SHA_APPLIED" in info:
-        puppet_override_sha_applied = info["PP_OVERRIDE_SHA_APPLIED"]
-
-    if puppet_vault_sha_applied is None and "PP_VAULT_SHA_APPLIED" in info:
-        puppet_vault_sha_applied = info["PP_VAULT_SHA_APPLIED"]
-
-    if puppet_role is None and "PP_ROLE" in info:
-        puppet_role = info["PP_ROLE"]
-
-    if puppet_exit_code is None and "PP_EXIT_CODE" in info:
-        with contextlib.suppress(ValueError, TypeError):
-            puppet_exit_code = int(info["PP_EXIT_CODE"])
-
-    if puppet_duration_s is None and "PP_DURATION_S" in info:
-        with contextlib.suppress(ValueError, TypeError):
-            puppet_duration_s = int(info["PP_DURATION_S"])
+    for field, kv_key, parse in _PUPPET_KV_FALLBACKS:
+        if pp[field] is None:
+            raw = info_get(kv_key)
+            if raw is not None:
+                with contextlib.suppress(ValueError, TypeError):
+                    pp[field] = parse(raw)
 
     # Compute content hash if we got content
-    content_bytes = content.encode("utf-8", "replace")
-    content_hash = sha256_hex(content_bytes) if content and override_present else None
-
-    # Store override file if requested
+    content_hash = None
     stored_path = None
-    if content and override_present and overrides_dir and content_hash:
-        stored_path = store_override_file(content, content_hash, overrides_dir)
+    if content and override_present:
+        content_bytes = content.encode("utf-8", "replace")
+        content_hash = sha256_hex(content_bytes)
+        # Store override file if requested; the hashed bytes are written as-is
+        if overrides_dir:
+            stored_path = store_override_file(content_bytes, content_hash, overrides_dir)
 
     if vault_present is None:
-        vault_present = info.get("VLT_PRESENT") == "1"
+        vault_present = False
 
     if vault_meta is None and vault_present:
         vault_meta = {
-            "mode": info.get("VLT_MODE") or "",
-            "owner": info.get("VLT_OWNER") or "",
-            "group": info.get("VLT_GROUP") or "",
-            "size": info.get("VLT_SIZE") or "",
-            "mtime_epoch": info.get("VLT_MTIME") or "",
+            "mode": info_get("VLT_MODE") or "",
+            "owner": info_get("VLT_OWNER") or "",
+            "group": info_get("VLT_GROUP") or "",
+            "size": info_get("VLT_SIZE") or "",
+            "mtime_epoch": info_get("VLT_MTIME") or "",
         }
 
-    result: dict[str, Any] = {
-        "ts": utc_now_iso(),
+    # Overrides are absent on most hosts; only build the meta dict when present
+    override_meta = (
+        {
+            "mode": info_get("OVERRIDE_MODE"),
+            "owner": info_get("OVERRIDE_OWNER"),
+            "group": info_get("OVERRIDE_GROUP"),
+            "size": info_get("OVERRIDE_SIZE"),
+            "mtime_epoch": info_get("OVERRIDE_MTIME"),
+        }
+        if override_present
+        else None
+    )
+    role = info_get("ROLE") if role_present else None
+    observed_vault_sha256 = info_get("VLT_SHA256") or vault_sha256
+
+    observed: dict[str, Any] = {
+        "role_present": role_present,
+        "role": role,
+        "os_type": os_type,
+        "override_present": override_present,
+        "override_meta": override_meta,
+        "override_sha256": content_hash,
+        "vault_present": vault_present,
+        "vault_meta": vault_meta,
+        "vault_sha256": observed_vault_sha256,
+        "uptime_s": uptime_s,
+        **pp,
+    }
+
+    # Add stored file path if we stored the file
+    if stored_path:
+        observed["override_file_path"] = str(stored_path)
+
+    ts = utc_now_iso()
+    ok = rc == 0
+    log_record: dict[str, Any] = {
+        "ts": ts,
         "actor": actor,
         "action": "host.audit",
         "host": host,
-        "ok": (rc == 0),
+        "ok": ok,
         "ssh_rc": rc,
         "stderr": err.strip(),
-        "observed": {
-            "role_present": role_present,
-            "role": info.get("ROLE") if role_present else None,
-            "os_type": os_type,
-            "override_present": override_present,
-            "override_meta": (
-                {
-                    "mode": info.get("OVERRIDE_MODE"),
-                    "owner": info.get("OVERRIDE_OWNER"),
-                    "group": info.get("OVERRIDE_GROUP"),
-                    "size": info.get("OVERRIDE_SIZE"),
-                    "mtime_epoch": info.get("OVERRIDE_MTIME"),
-                }
-                if override_present
-                else None
-            ),
-            "override_sha256": content_hash,
-            "vault_present": vault_present,
-            "vault_meta": vault_meta,
-            "vault_sha256": info.get("VLT_SHA256") or vault_sha256,
-            "uptime_s": uptime_s,
-            "puppet_state_ts": puppet_state_ts,
-            "puppet_last_run_epoch": puppet_last_run_epoch,
-            "puppet_success": puppet_success,
-            "puppet_git_sha": puppet_git_sha,
-            "puppet_git_repo": puppet_git_repo,
-            "puppet_git_branch": puppet_git_branch,
-            "puppet_git_dirty": puppet_git_dirty,
-            "puppet_override_sha_applied": puppet_override_sha_applied,
-            "puppet_vault_sha_applied": puppet_vault_sha_applied,
-            "puppet_role": puppet_role,
-            "puppet_exit_code": puppet_exit_code,
-            "puppet_duration_s": puppet_duration_s,
-        },
+        "observed": observed,
     }
 
-    # Store contents in result dict for display purposes (not persisted to audit log).
+    # Contents go only in the returned dict, for display (never persisted).
+    # Without them the log record is returned as-is, with no copy.
+    result = log_record
     if content and override_present:
-        result["observed"]["override_contents_for_display"] = content
-
-    # Add stored file path if we stored the file
-    if stored_path:
-        result["observed"]["override_file_path"] = str(stored_path)
-
-    log_record = dict(result)
-    log_record["observed"] = dict(result["observed"])
-    log_record["observed"].pop("override_contents_for_display", None)
-    log_record["observed"].pop("override_contents", None)
+        result = {
+            **log_record,
+            "observed": {**observed, "override_contents_for_display": content},
+        }
 
     # Write observation to SQLite
+    if writer is not None:
+        # Row in HOST_OBSERVATION_COLUMNS order, built from locals
+        writer.enqueue_row((host, ts, ok, _dumps_json(log_record)))
+        return result
+
     from .db import insert_host_observation
 
+    if db_conn is None:
+        raise ValueError("process_audit_result requires db_conn or writer")
     if log_lock:
         with log_lock:
             insert_host_observation(db_conn, log_record)
@@ -2,105 +2,145 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
-import shlex
+import logging.handlers
+import os
 import sys
-from importlib.metadata import version
+from collections.abc import Callable
+from typing import Any
 
 import click
 
-from .cli_types import (
-    DataFreshnessArgs,
-    HostAuditArgs,
-    HostMonitorArgs,
-    HostRunPuppetArgs,
-    HostSetOverrideArgs,
-    HostSetVaultArgs,
-    HostUnsetOverrideArgs,
-    MaintainArgs,
-    OverrideShowArgs,
-    TcFetchArgs,
-    VaultShowArgs,
-    WebArgs,
-)
-from .commands import (
-    cmd_data_freshness,
-    cmd_gh_fetch,
-    cmd_host_audit,
-    cmd_host_monitor,
-    cmd_host_run_puppet,
-    cmd_host_set,
-    cmd_host_set_vault,
-    cmd_host_unset,
-    cmd_maintain,
-    cmd_note_add,
-    cmd_note_clear,
-    cmd_override_show,
-    cmd_show_notes,
-    cmd_tc_fetch,
-    cmd_vault_show,
-    cmd_web,
-)
+from .constants import LOG_BUFFER_CAPACITY, SSHD_MAX_STARTUPS
 from .exceptions import CommandFailureError, FleetRollError, UserError
-from .ssh import audit_script_body, remote_windows_audit_script, windows_audit_script_body
-from .utils import resolve_host_args
 
 # Module logger
 logger = logging.getLogger("fleetroll")
 
 
-def setup_logging(debug: bool = False) -> None:
-    """Configure logging for the CLI."""
-    level = logging.DEBUG if debug else logging.WARNING
-    logger.setLevel(level)
-    if any(
-        isinstance(h, logging.StreamHandler) and getattr(h, "stream", None) is sys.stderr
-        for h in logger.handlers
-    ):
-        return
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-    logger.addHandler(handler)
+# SSH fan-out is I/O bound, so default to several workers per core, never
+# fewer than the historical 10 and capped at 32.
+_DEFAULT_WORKERS = min(max((os.cpu_count() or 1) * 4, 10), 32)
 
+# Single stderr handler shared by every setup_logging() call. Records reach it
+# through a MemoryHandler so verbose runs write to stderr in blocks rather than
+# one write+flush per record; errors still flush immediately.
+_STDERR_HANDLER = logging.StreamHandler(sys.stderr)
+_STDERR_HANDLER.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+_LOG_BUFFER = logging.handlers.MemoryHandler(
+    capacity=1,
+    flushLevel=logging.ERROR,
+    target=_STDERR_HANDLER,
+    flushOnClose=True,
+)
+atexit.register(_LOG_BUFFER.flush)
 
-# Common options that apply to all commands
-def common_options(_func=None, *, timeout_default: int = 10):
-    """Decorator to add common options to all commands.
 
-    Can be used as @common_options or @common_options(timeout_default=600).
+def setup_logging(debug: bool = False) -> None:
+    """Configure logging for the CLI.
+
+    Idempotent: the shared handler is installed at most once, and later calls
+    only adjust the level (and re-point the handler if sys.stderr was swapped,
+    e.g. by a test runner). Debug output is buffered; otherwise every record is
+    written as soon as it is logged so warnings stay realtime.
     """
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    _LOG_BUFFER.flush()
+    _LOG_BUFFER.capacity = LOG_BUFFER_CAPACITY if debug else 1
+    if _STDERR_HANDLER.stream is not sys.stderr:
+        _STDERR_HANDLER.setStream(sys.stderr)
+    if _LOG_BUFFER not in logger.handlers:
+        logger.addHandler(_LOG_BUFFER)
+        logger.propagate = False
 
-    def decorator(func):
-        func = click.option(
+
+def flush_logging() -> None:
+    """Write any buffered log records to stderr."""
+    _LOG_BUFFER.flush()
+
+
+@functools.cache
+def _common_option_decorators(timeout_default: int) -> tuple[Callable, ...]:
+    """Build the shared option decorators once per timeout default.
+
+    Decorators are listed innermost first, i.e. in the order they are applied.
+    """
+    return (
+        click.option(
             "--ssh-option",
             multiple=True,
             help="Extra ssh options, e.g. '--ssh-option \"-J bastion\"' (repeatable).",
-        )(func)
-        func = click.option(
+        ),
+        click.option(
             "--connect-timeout",
             type=int,
             default=10,
             show_default=True,
             help="SSH connect timeout seconds.",
-        )(func)
-        func = click.option(
+        ),
+        click.option(
             "--timeout",
             type=int,
             default=timeout_default,
             show_default=True,
             help="Overall ssh command timeout seconds.",
-        )(func)
-        func = click.option(
+        ),
+        click.option(
             "--audit-log",
             type=click.Path(),
             help="Path to local JSONL audit log (default: ~/.fleetroll/audit.jsonl).",
-        )(func)
-        func = click.option(
+        ),
+        click.option(
             "--json",
             "json_output",
             is_flag=True,
             help="Emit machine-readable JSON to stdout.",
-        )(func)
+        ),
+        click.option(
+            "--ssh-mux/--no-ssh-mux",
+            default=True,
+            show_default=True,
+            help="Reuse one SSH connection per host (OpenSSH ControlMaster).",
+        ),
+    )
+
+
+def _ssh_options(ssh_option: tuple[str, ...], ssh_mux: bool) -> tuple[str, ...] | None:
+    """Combine --ssh-option values with the multiplexing options when enabled.
+
+    User-supplied options come first: ssh keeps the first value it sees for a
+    setting, so an explicit '-o ControlMaster=no' still wins.
+    """
+    if not ssh_mux:
+        return ssh_option or None
+    from .ssh import ssh_mux_options
+
+    return ssh_option + ssh_mux_options()
+
+
+def _warn_unmuxed_workers(workers: int, ssh_option: tuple[str, ...] | None) -> None:
+    """Warn when unmultiplexed batch fan-out may exceed sshd's MaxStartups."""
+    if workers > SSHD_MAX_STARTUPS and "ControlMaster" not in " ".join(ssh_option or ()):
+        logger.warning(
+            "--workers %d exceeds sshd's default MaxStartups (%d) without --ssh-mux; "
+            "connections through a shared bastion may be throttled",
+            workers,
+            SSHD_MAX_STARTUPS,
+        )
+
+
+# Common options that apply to all commands
+def common_options(_func=None, *, timeout_default: int = 10):
+    """Decorator to add common options to all commands.
+
+    Can be used as @common_options or @common_options(timeout_default=600).
+    """
+
+    def decorator(func):
+        for option in _common_option_decorators(timeout_default):
+            func = option(func)
         return func
 
     if _func is not None:
@@ -109,7 +149,7 @@ def common_options(_func=None, *, timeout_default: int = 10):
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
-@click.version_option(version=version("fleetroll"), prog_name="fleetroll")
+@click.version_option(package_name="fleetroll", prog_name="fleetroll")
 @click.option(
     "--debug",
     "-d",
@@ -135,7 +175,7 @@ def cli(ctx: click.Context, debug: bool):
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for batch mode.",
 )
@@ -164,6 +204,7 @@ def gather_host(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     no_content: bool,
     workers: int,
     batch_timeout: int,
@@ -175,12 +216,15 @@ def gather_host(
     HOST_OR_FILE can be a hostname, user@hostname, or a file containing hosts
     (one per line for batch mode).
     """
+    from .cli_types import HostAuditArgs
+    from .commands import cmd_host_audit
+
     if verbose and quiet:
         raise click.UsageError("--verbose and --quiet are mutually exclusive")
 
     args = HostAuditArgs(
         host=host,
-        ssh_option=list(ssh_option) if ssh_option else None,
+        ssh_option=_ssh_options(ssh_option, ssh_mux),
         connect_timeout=connect_timeout,
         timeout=timeout,
         audit_log=audit_log,
@@ -191,6 +235,7 @@ def gather_host(
         verbose=verbose,
         quiet=quiet,
     )
+    _warn_unmuxed_workers(args.workers, args.ssh_option)
     cmd_host_audit(args)
 
 
@@ -249,6 +294,9 @@ def host_monitor(
     """Monitor the latest audit record for a host (follows the audit log)."""
     import yaml
 
+    from .cli_types import HostMonitorArgs
+    from .commands import cmd_host_monitor
+
     if filter_query and filter_file:
         raise click.UsageError("--filter and --filter-file are mutually exclusive")
     if filter_file:
@@ -284,6 +332,9 @@ def host_monitor(
 )
 def override_show(sha_prefix: str, audit_log: str | None):
     """Show stored override contents by SHA prefix."""
+    from .cli_types import OverrideShowArgs
+    from .commands import cmd_override_show
+
     args = OverrideShowArgs(
         sha_prefix=sha_prefix,
         audit_log=audit_log,
@@ -300,6 +351,9 @@ def override_show(sha_prefix: str, audit_log: str | None):
 )
 def vault_show(sha_prefix: str, audit_log: str | None):
     """Show stored vault contents by SHA prefix or humanhash."""
+    from .cli_types import VaultShowArgs
+    from .commands import cmd_vault_show
+
     args = VaultShowArgs(
         sha_prefix=sha_prefix,
         audit_log=audit_log,
@@ -329,17 +383,22 @@ def debug_host_script(
     windows: bool,
 ):
     """Print the remote host audit script used by gather-host."""
+    from .ssh import (
+        audit_script_body,
+        remote_audit_script,
+        remote_windows_audit_script,
+        windows_audit_script_body,
+    )
+
     if windows:
         if wrap:
             print(remote_windows_audit_script())
         else:
             print(windows_audit_script_body())
+    elif wrap:
+        print(remote_audit_script(include_content=not no_content))
     else:
-        body = audit_script_body(include_content=not no_content)
-        if wrap:
-            print("sh -c " + shlex.quote(body))
-        else:
-            print(body)
+        print(audit_script_body(include_content=not no_content))
 
 
 @cli.command("host-set-override")
@@ -348,7 +407,7 @@ def debug_host_script(
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for batch mode.",
 )
@@ -418,6 +477,7 @@ def host_set_override(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     workers: int,
     from_file: str | None,
     no_validate: bool,
@@ -436,11 +496,15 @@ def host_set_override(
     HOST_OR_FILE can be one or more hostnames, user@hostname values, or a file
     containing hosts (one per line). Contents must be provided via --from-file.
     """
+    from .cli_types import HostSetOverrideArgs
+    from .commands import cmd_host_set
+    from .utils import resolve_host_args
+
     hosts, host_file = resolve_host_args(host)
     args = HostSetOverrideArgs(
         hosts=hosts,
         host_file=host_file,
-        ssh_option=list(ssh_option) if ssh_option else None,
+        ssh_option=_ssh_options(ssh_option, ssh_mux),
         connect_timeout=connect_timeout,
         timeout=timeout,
         audit_log=audit_log,
@@ -458,6 +522,7 @@ def host_set_override(
         force=force,
         no_audit=no_audit,
     )
+    _warn_unmuxed_workers(args.workers, args.ssh_option)
     cmd_host_set(args)
 
 
@@ -467,7 +532,7 @@ def host_set_override(
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for batch mode.",
 )
@@ -537,6 +602,7 @@ def host_set_vault(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     workers: int,
     from_file: str | None,
     no_validate: bool,
@@ -555,11 +621,15 @@ def host_set_vault(
     HOST_OR_FILE can be one or more hostnames, user@hostname values, or a file
     containing hosts (one per line).
     """
+    from .cli_types import HostSetVaultArgs
+    from .commands import cmd_host_set_vault
+    from .utils import resolve_host_args
+
     hosts, host_file = resolve_host_args(host)
     args = HostSetVaultArgs(
         hosts=hosts,
         host_file=host_file,
-        ssh_option=list(ssh_option) if ssh_option else None,
+        ssh_option=_ssh_options(ssh_option, ssh_mux),
         connect_timeout=connect_timeout,
         timeout=timeout,
         audit_log=audit_log,
@@ -577,6 +647,7 @@ def host_set_vault(
         force=force,
         no_audit=no_audit,
     )
+    _warn_unmuxed_workers(args.workers, args.ssh_option)
     cmd_host_set_vault(args)
 
 
@@ -586,7 +657,7 @@ def host_set_vault(
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for batch mode.",
 )
@@ -616,6 +687,7 @@ def host_unset_override(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     workers: int,
     no_backup: bool,
     reason: str | None,
@@ -627,11 +699,15 @@ def host_unset_override(
     HOST_OR_FILE can be one or more hostnames, user@hostname values, or a file
     containing hosts (one per line).
     """
+    from .cli_types import HostUnsetOverrideArgs
+    from .commands import cmd_host_unset
+    from .utils import resolve_host_args
+
     hosts, host_file = resolve_host_args(host)
     args = HostUnsetOverrideArgs(
         hosts=hosts,
         host_file=host_file,
-        ssh_option=list(ssh_option) if ssh_option else None,
+        ssh_option=_ssh_options(ssh_option, ssh_mux),
         connect_timeout=connect_timeout,
         timeout=timeout,
         audit_log=audit_log,
@@ -642,6 +718,7 @@ def host_unset_override(
         confirm=confirm,
         no_audit=no_audit,
     )
+    _warn_unmuxed_workers(args.workers, args.ssh_option)
     cmd_host_unset(args)
 
 
@@ -651,7 +728,7 @@ def host_unset_override(
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for batch mode.",
 )
@@ -682,6 +759,7 @@ def host_run_puppet(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     workers: int,
     reason: str | None,
     confirm: bool,
@@ -693,11 +771,15 @@ def host_run_puppet(
     HOST_OR_FILE can be one or more hostnames, user@hostname values, or a file
     containing hosts (one per line).
     """
+    from .cli_types import HostRunPuppetArgs
+    from .commands import cmd_host_run_puppet
+    from .utils import resolve_host_args
+
     hosts, host_file = resolve_host_args(host)
     args = HostRunPuppetArgs(
         hosts=hosts,
         host_file=host_file,
-        ssh_option=list(ssh_option) if ssh_option else None,
+        ssh_option=_ssh_options(ssh_option, ssh_mux),
         connect_timeout=connect_timeout,
         timeout=timeout,
         audit_log=audit_log,
@@ -708,6 +790,7 @@ def host_run_puppet(
         no_audit=no_audit,
         quiet=quiet,
     )
+    _warn_unmuxed_workers(args.workers, args.ssh_option)
     cmd_host_run_puppet(args)
 
 
@@ -727,6 +810,9 @@ def host_run_puppet(
 )
 def gather_tc(host: str, verbose: int, quiet: bool):
     """Fetch TaskCluster worker data for hosts."""
+    from .cli_types import TcFetchArgs
+    from .commands import cmd_tc_fetch
+
     if verbose and quiet:
         raise click.UsageError("--verbose and --quiet are mutually exclusive")
 
@@ -748,6 +834,8 @@ def gather_tc(host: str, verbose: int, quiet: bool):
 )
 def gather_gh(override_delay: bool, quiet: bool):
     """Fetch GitHub branch refs for puppet repos."""
+    from .commands import cmd_gh_fetch
+
     cmd_gh_fetch(override_delay=override_delay, quiet=quiet)
 
 
@@ -757,7 +845,7 @@ def gather_gh(override_delay: bool, quiet: bool):
 @click.option(
     "--workers",
     type=int,
-    default=10,
+    default=_DEFAULT_WORKERS,
     show_default=True,
     help="Number of parallel workers for gather-host batch mode.",
 )
@@ -802,6 +890,7 @@ def gather(
     timeout: int,
     audit_log: str | None,
     json_output: bool,
+    ssh_mux: bool,
     workers: int,
     batch_timeout: int,
     verbose: int,
@@ -818,10 +907,13 @@ def gather(
 
     Use --skip-host / --skip-tc / --skip-gh to omit individual steps.
     """
+    from .cli_types import HostAuditArgs, TcFetchArgs
+    from .commands import cmd_gh_fetch, cmd_host_audit, cmd_tc_fetch
+
     if not skip_host:
         host_args = HostAuditArgs(
             host=host,
-            ssh_option=list(ssh_option) if ssh_option else None,
+            ssh_option=_ssh_options(ssh_option, ssh_mux),
             connect_timeout=connect_timeout,
             timeout=timeout,
             audit_log=audit_log,
@@ -832,6 +924,7 @@ def gather(
             verbose=verbose >= 1,
             quiet=quiet,
         )
+        _warn_unmuxed_workers(host_args.workers, host_args.ssh_option)
         cmd_host_audit(host_args)
 
     if not skip_tc:
@@ -866,6 +959,9 @@ def maintain(audit_log: str | None, confirm: bool, force: bool):
     Does NOT backfill - new logs start empty on next write.
     Only rotates files >= 100 MB threshold (unless --force is used).
     """
+    from .cli_types import MaintainArgs
+    from .commands import cmd_maintain
+
     args = MaintainArgs(audit_log=audit_log, confirm=confirm, force=force)
     try:
         cmd_maintain(args)
@@ -919,6 +1015,9 @@ def data_freshness(
     Specify either HOSTS_FILE (a list of expected hosts) or --all (every host
     in the database). Exactly one is required.
     """
+    from .cli_types import DataFreshnessArgs
+    from .commands import cmd_data_freshness
+
     if hosts_file and all_hosts:
         raise click.UsageError("HOSTS_FILE and --all are mutually exclusive.")
     if not hosts_file and not all_hosts:
@@ -949,6 +1048,8 @@ def data_freshness(
 )
 def note_add(hostname: str, note_text: str, notes_file: str | None, json_output: bool):
     """Add a note for a host."""
+    from .commands import cmd_note_add
+
     cmd_note_add(hostname, note_text, notes_file=notes_file, json_output=json_output)
 
 
@@ -971,6 +1072,8 @@ def note_add(hostname: str, note_text: str, notes_file: str | None, json_output:
 )
 def note_clear(hostname: str, reason: str | None, notes_file: str | None, json_output: bool):
     """Clear notes for a host (appends a tombstone record)."""
+    from .commands import cmd_note_clear
+
     cmd_note_clear(hostname, reason=reason, notes_file=notes_file, json_output=json_output)
 
 
@@ -1007,6 +1110,8 @@ def show_notes(
     include_cleared: bool,
 ):
     """Show notes for a host."""
+    from .commands import cmd_show_notes
+
     cmd_show_notes(
         hostname,
         limit=limit,
@@ -1022,23 +1127,32 @@ def show_notes(
 @click.option("--dev", is_flag=True, help="Enable CORS for Vite dev server.")
 def web(host: str, port: int, dev: bool) -> None:
     """Start the fleetroll web interface."""
+    from .cli_types import WebArgs
+    from .commands import cmd_web
+
     args = WebArgs(host=host, port=port, dev=dev)
     cmd_web(host=args.host, port=args.port, dev=args.dev)
 
 
+# Exit status for each exception type main() handles: (exit code, message or
+# None when the command already reported the error). Looked up along the MRO,
+# so subclasses resolve to their nearest listed base.
+_EXIT_STATUS: dict[type[BaseException], Callable[[Any], tuple[int, str | None]]] = {
+    CommandFailureError: lambda e: (e.rc, None),
+    UserError: lambda e: (e.rc, f"ERROR: {e}"),
+    FleetRollError: lambda e: (2, f"ERROR: {e}"),
+    KeyboardInterrupt: lambda e: (130, "ERROR: Interrupted"),
+}
+
+
 def main():
     """Main entry point for the CLI."""
     try:
         cli()
-    except CommandFailureError as e:
-        # Command already printed its error message, just exit
-        sys.exit(e.rc)
-    except UserError as e:
-        click.echo(f"ERROR: {e}", err=True)
-        sys.exit(e.rc)
-    except FleetRollError as e:
-        click.echo(f"ERROR: {e}", err=True)
-        sys.exit(2)
-    except KeyboardInterrupt:
-        click.echo("ERROR: Interrupted", err=True)
-        sys.exit(130)
+    except (FleetRollError, KeyboardInterrupt) as e:
+        status = next(_EXIT_STATUS[cls] for cls in type(e).__mro__ if cls in _EXIT_STATUS)
+        rc, message = status(e)
+        flush_logging()
+        if message is not None:
+            sys.stderr.write(message + "\n")
+        sys.exit(rc)
@@ -7,12 +7,12 @@ from pathlib import Path
 from typing import Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class HostAuditArgs:
     """Arguments for gather-host command."""
 
     host: str
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     audit_log: str | None
@@ -24,7 +24,7 @@ class HostAuditArgs:
     quiet: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class HostMonitorArgs:
     """Arguments for host-monitor command."""
 
@@ -37,7 +37,7 @@ class HostMonitorArgs:
     hostname_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideShowArgs:
     """Arguments for show-override command."""
 
@@ -45,7 +45,7 @@ class OverrideShowArgs:
     audit_log: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class VaultShowArgs:
     """Arguments for show-vault command."""
 
@@ -53,13 +53,13 @@ class VaultShowArgs:
     audit_log: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class HostSetOverrideArgs:
     """Arguments for host-set-override command."""
 
     hosts: list[str]
     host_file: Path | None
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     audit_log: str | None
@@ -78,13 +78,13 @@ class HostSetOverrideArgs:
     no_audit: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HostSetVaultArgs:
     """Arguments for host-set-vault command."""
 
     hosts: list[str]
     host_file: Path | None
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     audit_log: str | None
@@ -103,13 +103,13 @@ class HostSetVaultArgs:
     no_audit: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HostUnsetOverrideArgs:
     """Arguments for host-unset-override command."""
 
     hosts: list[str]
     host_file: Path | None
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     audit_log: str | None
@@ -121,13 +121,13 @@ class HostUnsetOverrideArgs:
     no_audit: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HostRunPuppetArgs:
     """Arguments for host-run-puppet command."""
 
     hosts: list[str]
     host_file: Path | None
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     audit_log: str | None
@@ -139,7 +139,7 @@ class HostRunPuppetArgs:
     quiet: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TcFetchArgs:
     """Arguments for gather-tc command."""
 
@@ -148,7 +148,7 @@ class TcFetchArgs:
     quiet: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintainArgs:
     """Arguments for maintain command."""
 
@@ -157,7 +157,7 @@ class MaintainArgs:
     force: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFreshnessArgs:
     """Arguments for data-freshness command."""
 
@@ -168,7 +168,7 @@ class DataFreshnessArgs:
     json: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class WebArgs:
     """Arguments for web command."""
 
@@ -181,4 +181,4 @@ class HasSshOptions(Protocol):
     """Protocol for args that contain SSH connection options."""
 
     connect_timeout: int
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
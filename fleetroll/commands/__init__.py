@@ -1,20 +1,49 @@
-"""FleetRoll command implementations."""
+"""FleetRoll command implementations.
+
+Command entry points are resolved lazily on first attribute access so that
+importing one command (e.g. from a CLI handler) does not pull in the SSH,
+SQLite, TaskCluster and GitHub dependencies of every other command.
+"""
 
 from __future__ import annotations
 
-from .data_freshness import cmd_data_freshness
-from .gather_gh import cmd_gh_fetch
-from .gather_host import cmd_host_audit
-from .gather_tc import cmd_tc_fetch
-from .maintain import cmd_maintain
-from .monitor import cmd_host_monitor
-from .note import cmd_note_add, cmd_note_clear, cmd_show_notes
-from .override import cmd_override_show
-from .run_puppet import cmd_host_run_puppet
-from .set import cmd_host_set
-from .unset import cmd_host_unset
-from .vault import cmd_host_set_vault, cmd_vault_show
-from .web import cmd_web
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .data_freshness import cmd_data_freshness
+    from .gather_gh import cmd_gh_fetch
+    from .gather_host import cmd_host_audit
+    from .gather_tc import cmd_tc_fetch
+    from .maintain import cmd_maintain
+    from .monitor import cmd_host_monitor
+    from .note import cmd_note_add, cmd_note_clear, cmd_show_notes
+    from .override import cmd_override_show
+    from .run_puppet import cmd_host_run_puppet
+    from .set import cmd_host_set
+    from .unset import cmd_host_unset
+    from .vault import cmd_host_set_vault, cmd_vault_show
+    from .web import cmd_web
+
+# Public command name -> submodule that defines it
+_COMMAND_MODULES = {
+    "cmd_data_freshness": "data_freshness",
+    "cmd_gh_fetch": "gather_gh",
+    "cmd_host_audit": "gather_host",
+    "cmd_host_monitor": "monitor",
+    "cmd_host_run_puppet": "run_puppet",
+    "cmd_host_set": "set",
+    "cmd_host_set_vault": "vault",
+    "cmd_host_unset": "unset",
+    "cmd_maintain": "maintain",
+    "cmd_note_add": "note",
+    "cmd_note_clear": "note",
+    "cmd_override_show": "override",
+    "cmd_show_notes": "note",
+    "cmd_tc_fetch": "gather_tc",
+    "cmd_vault_show": "vault",
+    "cmd_web": "web",
+}
 
 __all__ = [
     "cmd_data_freshness",
@@ -34,3 +63,16 @@ __all__ = [
     "cmd_vault_show",
     "cmd_web",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 class HasAutoAuditArgs(Protocol):
     """Protocol for args objects that support auto-audit."""
 
-    ssh_option: list[str] | None
+    ssh_option: tuple[str, ...] | None
     connect_timeout: int
     timeout: int
     workers: int
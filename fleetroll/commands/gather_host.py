@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 import logging
+import re
+import sqlite3
 import sys
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import nullcontext
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -24,10 +29,14 @@ from ..constants import (
     AUDIT_DIR_NAME,
     AUDIT_MAX_RETRIES,
     AUDIT_RETRY_DELAY_S,
+    CONTENT_SENTINEL,
     OVERRIDES_DIR_NAME,
+    PROGRESS_LABEL_INTERVAL_S,
+    VAULT_CONTENT_KEY,
+    VAULT_KNOWN_SHAS_MAX,
     VAULT_YAMLS_DIR_NAME,
 )
-from ..exceptions import CommandFailureError
+from ..exceptions import CommandFailureError, FleetRollError
 from ..ssh import (
     build_ssh_options,
     is_windows_host,
@@ -44,14 +53,22 @@ from ..utils import (
     infer_actor,
     is_host_file,
     parse_host_list,
+    sha256_hex,
     utc_now_iso,
 )
 
 if TYPE_CHECKING:
     from ..cli_types import HostAuditArgs
+    from ..db import ObservationWriter
 
 logger = logging.getLogger("fleetroll")
 
+# ssh stderr messages for connection failures worth retrying, matched in one scan
+_RETRYABLE_SSH_ERROR_RE = re.compile(
+    "Connection refused|Connection timed out|Could not resolve hostname"
+    "|Network is unreachable|No route to host"
+)
+
 
 def format_status_indicator(emoji: str, status: str, color: str) -> str:
     """Format colored emoji + status text.
@@ -139,87 +156,131 @@ def aggregate_audit_summary(results: list[dict[str, Any]], hosts: list[str]) ->
     Returns:
         Summary dictionary with results, counts, and unique overrides
     """
-    # Collect unique overrides by SHA256
+    # Count successes and collect unique overrides by SHA256 in a single pass
     unique_overrides: dict[str, tuple[str, list[str]]] = {}
+    successful = 0
     for r in results:
-        if r.get("ok") and r.get("observed", {}).get("override_present"):
-            sha = r["observed"].get("override_sha256")
-            content = r["observed"].get("override_contents_for_display", "")
-            host = r["host"]
+        if not r.get("ok"):
+            continue
+        successful += 1
+        observed = r.get("observed", {})
+        if observed.get("override_present"):
+            sha = observed.get("override_sha256")
+            content = observed.get("override_contents_for_display", "")
             if sha and content:
                 if sha not in unique_overrides:
                     unique_overrides[sha] = (content, [])
-                unique_overrides[sha][1].append(host)
+                shared_content, override_hosts = unique_overrides[sha]
+                override_hosts.append(r["host"])
+                # Point every host at one copy so duplicate contents can be freed
+                observed["override_contents_for_display"] = shared_content
 
     return {
         "results": results,
         "total": len(hosts),
-        "successful": sum(1 for r in results if r.get("ok")),
-        "failed": sum(1 for r in results if not r.get("ok")),
+        "successful": successful,
+        "failed": len(results) - successful,
         "unique_overrides": unique_overrides,
     }
 
 
+def mark_unwritten_hosts_failed(
+    results: list[dict[str, Any]], dropped_hosts: list[str], error: sqlite3.Error
+) -> None:
+    """Mark hosts whose observations never reached the database as failed.
+
+    Args:
+        results: Audit result dictionaries, updated in place
+        dropped_hosts: Hosts reported by ObservationWriter.dropped_hosts
+        error: The write error that caused the observations to be dropped
+    """
+    dropped = set(dropped_hosts)
+    for r in results:
+        if r["host"] in dropped and r.get("ok"):
+            r["ok"] = False
+            r["error"] = f"failed to record observation: {error}"
+
+
 def execute_audits_parallel(
     hosts: list[str],
     *,
     args: HostAuditArgs,
     ssh_opts: list[str],
     include_content: bool,
-    db_path: Path,
+    writer: ObservationWriter,
     actor: str,
-    retry_budget: dict[str, float],
-    lock: threading.Lock,
-    log_lock: threading.Lock,
+    deadline: float,
     overrides_dir: Path,
     vault_checksums: dict[str, str],
     vault_dir: Path,
     show_progress: bool,
+    known_vault_shas: tuple[str, ...] = (),
 ) -> list[dict[str, Any]]:
     """Execute audits for multiple hosts in parallel with optional progress bar.
 
+    A single host is audited directly on the calling thread.
+
     Args:
         hosts: List of hostnames to audit
         args: Audit command arguments
         ssh_opts: SSH options list
         include_content: Whether to include override file content in audit
-        db_path: Path to SQLite database file
+        writer: Batching writer for host observations
         actor: Username performing the audit
-        retry_budget: Dictionary with deadline for retries
-        lock: Lock for results list
-        log_lock: Lock for audit log writes
+        deadline: time.monotonic() value after which no new attempts start
         overrides_dir: Directory for storing override files
         vault_checksums: Existing vault checksums
         vault_dir: Directory for storing vault files
         show_progress: Whether to show progress bar
+        known_vault_shas: Stored vault shas hosts need not send inline
 
     Returns:
         List of audit result dictionaries
     """
-    results = []
-    completed = 0
-    progress_start = time.monotonic()
-    progress_label = format_progress_label(len(hosts), elapsed_s=0)
 
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        future_to_host = {
-            executor.submit(
-                audit_single_host_with_retry,
+    def audit_host(host: str) -> dict[str, Any]:
+        try:
+            return audit_single_host_with_retry(
                 host,
                 args=args,
                 ssh_opts=ssh_opts,
                 include_content=include_content,
-                db_path=db_path,
+                writer=writer,
                 actor=actor,
-                retry_budget=retry_budget,
-                lock=lock,
-                log_lock=log_lock,
+                deadline=deadline,
                 overrides_dir=overrides_dir,
                 vault_checksums=vault_checksums,
                 vault_dir=vault_dir,
-            ): host
-            for host in hosts
-        }
+                known_vault_shas=known_vault_shas,
+            )
+        except Exception as e:
+            return {"host": host, "ok": False, "error": str(e), "ts": utc_now_iso()}
+
+    # A single host gains nothing from a thread pool or a progress bar
+    if len(hosts) == 1:
+        return [audit_host(hosts[0])]
+
+    results = []
+    completed = 0
+    progress_start = label_time = time.monotonic()
+    progress_label = format_progress_label(len(hosts), elapsed_s=0)
+    # Never start more threads than there are hosts to audit.
+    workers = max(min(args.workers, len(hosts)), 1)
+    # Keep a bounded window of submissions in flight instead of creating a
+    # future (and its argument closure) for every host up front.
+    max_in_flight = workers * 2
+    host_iter = iter(hosts)
+    pending: set[Future[dict[str, Any]]] = set()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fleetroll-audit") as executor:
+
+        def submit_next() -> None:
+            host = next(host_iter, None)
+            if host is not None:
+                pending.add(executor.submit(audit_host, host))
+
+        for _ in range(max_in_flight):
+            submit_next()
 
         # Use click.progressbar in batch mode, nullcontext in JSON mode
         with (
@@ -233,52 +294,85 @@ def execute_audits_parallel(
             if show_progress
             else nullcontext()
         ) as bar:
-            for future in as_completed(future_to_host):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    host = future_to_host[future]
-                    results.append(
-                        {
-                            "host": host,
-                            "ok": False,
-                            "error": str(e),
-                            "ts": utc_now_iso(),
-                        }
-                    )
-
-                # Update progress bar (only if showing)
-                if show_progress:
-                    completed += 1
-                    remaining = len(hosts) - completed
-                    # Click progressbar type not fully understood by type checker
-                    bar.label = format_progress_label(  # type: ignore[invalid-assignment]
-                        remaining, elapsed_s=time.monotonic() - progress_start
-                    )
-                    bar.update(1)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    submit_next()
+                    results.append(future.result())
+
+                    # Update progress bar (only if showing)
+                    if show_progress:
+                        completed += 1
+                        remaining = len(hosts) - completed
+                        now = time.monotonic()
+                        # Rebuild the label at most once per interval, and for the last host
+                        if remaining == 0 or now - label_time >= PROGRESS_LABEL_INTERVAL_S:
+                            label_time = now
+                            # Click progressbar type not fully understood by type checker
+                            bar.label = format_progress_label(  # type: ignore[invalid-assignment]
+                                remaining, elapsed_s=now - progress_start
+                            )
+                        bar.update(1)
 
     return results
 
 
+def select_known_vault_shas(vault_checksums: dict[str, str], vault_dir: Path) -> tuple[str, ...]:
+    """Return the most widely deployed vault shas whose content is already stored.
+
+    Hosts told about these skip sending matching vault.yaml content inline.
+    At most VAULT_KNOWN_SHAS_MAX are returned to keep the command line short.
+    """
+    known: list[str] = []
+    for sha, _count in Counter(vault_checksums.values()).most_common():
+        if len(known) >= VAULT_KNOWN_SHAS_MAX:
+            break
+        if has_content_file(sha, vault_dir):
+            known.append(sha)
+    return tuple(known)
+
+
+def split_vault_content(out: str) -> tuple[str, bytes | None]:
+    """Remove the inline vault line from audit output.
+
+    Returns the output without that line and the decoded vault.yaml bytes, or
+    the output unchanged and None if the host did not send (valid) content.
+    Only the header is searched, so override content cannot spoof the line.
+    """
+    marker = "\n" + VAULT_CONTENT_KEY + "="
+    header_end = out.find(CONTENT_SENTINEL)
+    start = out.find(marker, 0, len(out) if header_end < 0 else header_end)
+    if start < 0:
+        return out, None
+    end = out.find("\n", start + 1)
+    if end < 0:
+        end = len(out)
+    try:
+        content = base64.b64decode(out[start + len(marker) : end], validate=True)
+    except binascii.Error:
+        return out, None
+    return out[:start] + out[end:], content
+
+
 def audit_single_host_with_retry(
     host: str,
     *,
     args: HostAuditArgs,
     ssh_opts: list[str],
     include_content: bool,
-    db_path: Path,
+    writer: ObservationWriter,
     actor: str,
-    retry_budget: dict[str, Any],
-    lock: threading.Lock,
-    log_lock: threading.Lock,
+    deadline: float,
     overrides_dir: Path | None = None,
     vault_checksums: dict[str, str] | None = None,
     vault_dir: Path | None = None,
+    known_vault_shas: tuple[str, ...] = (),
 ) -> dict[str, Any]:
     """Audit single host with retry for connection failures.
 
-    Each thread creates its own SQLite connection to avoid threading issues.
+    Observations are queued on the shared writer, which owns the only SQLite
+    connection, so worker threads never touch the database directly.
     """
     max_retries = AUDIT_MAX_RETRIES
     retry_delay = AUDIT_RETRY_DELAY_S  # Exponential backoff base
@@ -287,7 +381,17 @@ def audit_single_host_with_retry(
         remote_cmd = remote_windows_audit_script()
         ssh_host = windows_ssh_host(host)
     else:
-        remote_cmd = remote_audit_script(include_content=include_content)
+        # Ship vault.yaml inline unless the host's last seen vault is already
+        # stored; a changed vault still falls back to a separate fetch below.
+        known_vault_sha = vault_checksums.get(host) if vault_checksums else None
+        include_vault_content = vault_dir is not None and not (
+            known_vault_sha and has_content_file(known_vault_sha, vault_dir)
+        )
+        remote_cmd = remote_audit_script(
+            include_content=include_content,
+            include_vault_content=include_vault_content,
+            known_vault_shas=known_vault_shas if include_vault_content else (),
+        )
         ssh_host = host
 
     # All managed hosts reimage periodically, changing their host keys.
@@ -304,18 +408,17 @@ def audit_single_host_with_retry(
     err = ""  # Initialize for type checker
     for attempt in range(max_retries):
         # Check batch timeout
-        with lock:
-            if time.time() > retry_budget["deadline"]:
-                logger.debug("Batch timeout exceeded for %s", host)
-                return {
-                    "ts": utc_now_iso(),
-                    "actor": actor,
-                    "action": "host.audit",
-                    "host": host,
-                    "ok": False,
-                    "error": "batch_timeout_exceeded",
-                    "attempts": attempt,
-                }
+        if time.monotonic() > deadline:
+            logger.debug("Batch timeout exceeded for %s", host)
+            return {
+                "ts": utc_now_iso(),
+                "actor": actor,
+                "action": "host.audit",
+                "host": host,
+                "ok": False,
+                "error": "batch_timeout_exceeded",
+                "attempts": attempt,
+            }
 
         if attempt > 0:
             logger.debug("Retry attempt %d/%d for %s", attempt + 1, max_retries, host)
@@ -325,56 +428,55 @@ def audit_single_host_with_retry(
         )
 
         # Check if retryable (connection errors)
-        is_connection_error = rc != 0 and (
-            "Connection refused" in err
-            or "Connection timed out" in err
-            or "Could not resolve hostname" in err
-            or "Network is unreachable" in err
-            or "No route to host" in err
-        )
+        is_connection_error = rc != 0 and _RETRYABLE_SSH_ERROR_RE.search(err) is not None
 
         if rc == 0 or not is_connection_error:
             # Success or non-retryable error
-            # Create thread-local database connection
-            from ..db import get_connection
-
-            db_conn = get_connection(db_path)
-            try:
-                if rc == 0:
-                    logger.debug("Host %s: audit successful", host)
-                else:
-                    logger.debug("Host %s: non-retryable error (rc=%d)", host, rc)
-                result = process_audit_result(
-                    host,
-                    rc=rc,
-                    out=out,
-                    err=err,
-                    db_conn=db_conn,
-                    actor=actor,
-                    overrides_dir=overrides_dir,
-                    vault_sha256=(vault_checksums.get(host) if vault_checksums else None),
-                    log_lock=log_lock,
-                )
-                vault_sha = result.get("observed", {}).get("vault_sha256")
-                vault_present = result.get("observed", {}).get("vault_present")
-                if vault_present and vault_sha and vault_dir:
-                    if not has_content_file(vault_sha, vault_dir):
-                        vault_cmd = remote_read_vault_script()
-                        v_rc, v_out, v_err = run_ssh(
-                            ssh_host,
-                            vault_cmd,
-                            ssh_options=host_ssh_opts,
-                            timeout_s=args.timeout,
+            if rc == 0:
+                logger.debug("Host %s: audit successful", host)
+            else:
+                logger.debug("Host %s: non-retryable error (rc=%d)", host, rc)
+            out, vault_content = split_vault_content(out)
+            result = process_audit_result(
+                host,
+                rc=rc,
+                out=out,
+                err=err,
+                actor=actor,
+                overrides_dir=overrides_dir,
+                vault_sha256=(vault_checksums.get(host) if vault_checksums else None),
+                writer=writer,
+            )
+            vault_sha = result.get("observed", {}).get("vault_sha256")
+            vault_present = result.get("observed", {}).get("vault_present")
+            if vault_present and vault_sha and vault_dir:
+                if vault_content is not None and sha256_hex(vault_content) != vault_sha:
+                    # vault.yaml changed between the remote sha256sum and base64 reads;
+                    # never file content under a sha it does not hash to
+                    logger.debug("Host %s: inline vault.yaml does not match its sha256", host)
+                    result["observed"]["vault_fetch_error"] = (
+                        "vault.yaml changed during audit (sha256 mismatch)"
+                    )
+                elif vault_content is not None:
+                    stored_path = store_content_file(vault_content, vault_sha, vault_dir)
+                    result["observed"]["vault_file_path"] = str(stored_path)
+                elif not has_content_file(vault_sha, vault_dir):
+                    vault_cmd = remote_read_vault_script()
+                    v_rc, v_out, v_err = run_ssh(
+                        ssh_host,
+                        vault_cmd,
+                        ssh_options=host_ssh_opts,
+                        timeout_s=args.timeout,
+                    )
+                    if v_rc == 0:
+                        stored_path = store_content_file(
+                            v_out.encode("utf-8", "replace"), vault_sha, vault_dir
                         )
-                        if v_rc == 0:
-                            stored_path = store_content_file(v_out, vault_sha, vault_dir)
-                            result["observed"]["vault_file_path"] = str(stored_path)
-                        else:
-                            result["observed"]["vault_fetch_error"] = v_err.strip()
-                result["attempts"] = attempt + 1
-                return result
-            finally:
-                db_conn.close()
+                        result["observed"]["vault_file_path"] = str(stored_path)
+                    else:
+                        result["observed"]["vault_fetch_error"] = v_err.strip()
+            result["attempts"] = attempt + 1
+            return result
 
         # Retry with exponential backoff
         if attempt < max_retries - 1:
@@ -425,7 +527,7 @@ def format_summary_table(summary: dict[str, Any], verbose: bool = False) -> str:
     lines.append("\nStatus by Host:")
     lines.append("-" * 60)
 
-    for result in sorted(results, key=lambda r: r["host"]):
+    for result in sorted(results, key=itemgetter("host")):
         host = result["host"]
         if result.get("ok"):
             obs = result.get("observed", {})
@@ -491,40 +593,52 @@ def format_summary_table(summary: dict[str, Any], verbose: bool = False) -> str:
 
 def cmd_host_audit_batch(hosts: list[str], args: HostAuditArgs) -> dict[str, Any]:
     """Audit multiple hosts in parallel."""
-    from ..db import get_db_path, init_db
+    from ..db import ObservationWriter, get_connection, get_db_path, init_db
 
     actor = infer_actor()
     ssh_opts = build_ssh_options(args)
     audit_log = Path(args.audit_log) if args.audit_log else default_audit_log_path()
     overrides_dir = audit_log.parent / OVERRIDES_DIR_NAME
-    vault_checksums = load_latest_vault_checksums(audit_log)
     vault_dir = audit_log.parent / VAULT_YAMLS_DIR_NAME
 
     # Initialize SQLite database for host observations
     db_path = get_db_path()
     init_db(db_path)
+    db_conn = get_connection(db_path)
+    try:
+        vault_checksums = load_latest_vault_checksums(audit_log, conn=db_conn)
+    finally:
+        db_conn.close()
 
     include_content = not args.no_content
-    lock = threading.Lock()
-    log_lock = threading.Lock()
-    retry_budget = {"deadline": time.time() + args.batch_timeout}
+    known_vault_shas = select_known_vault_shas(vault_checksums, vault_dir)
+    # Set once and only read by workers, so no lock is needed
+    deadline = time.monotonic() + args.batch_timeout
     show_progress = not args.json and not getattr(args, "quiet", False)
 
-    results = execute_audits_parallel(
-        hosts,
-        args=args,
-        ssh_opts=ssh_opts,
-        include_content=include_content,
-        db_path=db_path,
-        actor=actor,
-        retry_budget=retry_budget,
-        lock=lock,
-        log_lock=log_lock,
-        overrides_dir=overrides_dir,
-        vault_checksums=vault_checksums,
-        vault_dir=vault_dir,
-        show_progress=show_progress,
-    )
+    # One writer thread batches observation commits for the whole audit
+    results: list[dict[str, Any]] | None = None
+    writer = ObservationWriter(db_path)
+    try:
+        with writer:
+            results = execute_audits_parallel(
+                hosts,
+                args=args,
+                ssh_opts=ssh_opts,
+                include_content=include_content,
+                writer=writer,
+                actor=actor,
+                deadline=deadline,
+                overrides_dir=overrides_dir,
+                vault_checksums=vault_checksums,
+                vault_dir=vault_dir,
+                show_progress=show_progress,
+                known_vault_shas=known_vault_shas,
+            )
+    except sqlite3.Error as e:
+        if results is None:
+            raise FleetRollError(f"Failed to write host observations to {db_path}: {e}") from e
+        mark_unwritten_hosts_failed(results, writer.dropped_hosts, e)
 
     return aggregate_audit_summary(results, hosts)
 
@@ -630,7 +744,9 @@ def cmd_host_audit(args: HostAuditArgs) -> None:
     if args.json:
         # JSON output: single host returns just the result, batch returns summary
         if is_batch:
-            print(json.dumps(summary, indent=2, sort_keys=True))
+            # Encode straight to stdout; the batch summary can be large
+            json.dump(summary, sys.stdout, indent=2, sort_keys=True)
+            sys.stdout.write("\n")
             if summary["failed"] > 0:
                 raise CommandFailureError
         else:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import shutil
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -31,11 +30,11 @@ def rotate_log_file(
     Returns:
         Tuple of (rotated, message) where rotated is True if file was/would be rotated
     """
-    if not log_path.exists():
+    try:
+        size_mb = log_path.stat().st_size / (1024 * 1024)
+    except FileNotFoundError:
         return (False, f"SKIP {log_path.name}: file does not exist")
 
-    size_mb = log_path.stat().st_size / (1024 * 1024)
-
     if not force and size_mb < threshold_mb:
         return (
             False,
@@ -53,7 +52,7 @@ def rotate_log_file(
         )
 
     try:
-        shutil.move(str(log_path), str(archive_path))
+        log_path.replace(archive_path)
         return (True, f"OK {log_path.name} ({size_mb:.1f} MB) -> {archive_path.name}")
     except Exception as e:
         return (False, f"FAIL {log_path.name}: {e}")
@@ -88,7 +87,11 @@ def cmd_maintain(args: MaintainArgs) -> None:
 
     # Compact database
     db_path = fleetroll_dir / DB_FILE_NAME
-    if db_path.exists():
+    try:
+        db_size = db_path.stat().st_size
+    except FileNotFoundError:
+        db_size = None
+    if db_size is not None:
         if args.confirm:
             size_before, size_after = compact_database(db_path)
             size_before_mb = size_before / (1024 * 1024)
@@ -101,7 +104,7 @@ def cmd_maintain(args: MaintainArgs) -> None:
                 f"(freed {reduction_mb:.1f} MB, {pct:.1f}%)"
             )
         else:
-            size_mb = db_path.stat().st_size / (1024 * 1024)
+            size_mb = db_size / (1024 * 1024)
             click.echo(f"DRY RUN: Would compact {DB_FILE_NAME} (currently {size_mb:.1f} MB)")
     else:
         click.echo(f"SKIP {DB_FILE_NAME}: file does not exist")
@@ -49,6 +49,7 @@ from .formatting import (
     clip_cell,
     compute_columns_and_widths,
     format_monitor_row,
+    format_monitor_row_from_values,
     render_cell_text,
     render_monitor_lines,
     render_row_cells,
@@ -74,6 +75,7 @@ __all__ = [
     "compute_visible_columns",
     "detect_common_fqdn_suffix",
     "format_monitor_row",
+    "format_monitor_row_from_values",
     "format_ts_with_age",
     "humanize_age",
     "humanize_duration",
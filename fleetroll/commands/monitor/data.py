@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
 import datetime as dt
+import functools
 import re
 import sqlite3
 import time
+from collections import deque
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
@@ -131,6 +134,53 @@ def detect_common_fqdn_suffix(hosts: list[str]) -> str | None:
     return "." + ".".join(common_parts)
 
 
+# humanize_age buckets: an age below _AGE_LIMITS_S[i] seconds gets _AGE_LABELS[i].
+_AGE_LIMITS_S: tuple[int, ...] = (
+    60,
+    3 * 60,
+    5 * 60,
+    15 * 60,
+    30 * 60,
+    45 * 60,
+    60 * 60,
+    2 * 60 * 60,
+    4 * 60 * 60,
+    8 * 60 * 60,
+    12 * 60 * 60,
+    24 * 60 * 60,
+    2 * 24 * 60 * 60,
+    3 * 24 * 60 * 60,
+    7 * 24 * 60 * 60,
+    14 * 24 * 60 * 60,
+    30 * 24 * 60 * 60,
+    90 * 24 * 60 * 60,
+    180 * 24 * 60 * 60,
+    365 * 24 * 60 * 60,
+)
+_AGE_LABELS: tuple[str, ...] = (
+    "<1m ago",
+    "<3m ago",
+    "<5m ago",
+    "<15m ago",
+    "<30m ago",
+    "<45m ago",
+    "<1h ago",
+    "<2h ago",
+    "<4h ago",
+    "<8h ago",
+    "<12h ago",
+    "<1d ago",
+    "<2d ago",
+    "<3d ago",
+    "<1w ago",
+    "<2w ago",
+    "<1mo ago",
+    "<3mo ago",
+    "<6mo ago",
+    "<1y ago",
+)
+
+
 def humanize_age(ts_value: str) -> str:
     """Return a humanized age string for an ISO timestamp."""
     if not ts_value or ts_value == "?":
@@ -139,32 +189,8 @@ def humanize_age(ts_value: str) -> str:
         delta_s = age_seconds(ts_value)
         if delta_s is None:
             return ts_value
-        buckets = [
-            (60, "<1m ago"),
-            (3 * 60, "<3m ago"),
-            (5 * 60, "<5m ago"),
-            (15 * 60, "<15m ago"),
-            (30 * 60, "<30m ago"),
-            (45 * 60, "<45m ago"),
-            (60 * 60, "<1h ago"),
-            (2 * 60 * 60, "<2h ago"),
-            (4 * 60 * 60, "<4h ago"),
-            (8 * 60 * 60, "<8h ago"),
-            (12 * 60 * 60, "<12h ago"),
-            (24 * 60 * 60, "<1d ago"),
-            (2 * 24 * 60 * 60, "<2d ago"),
-            (3 * 24 * 60 * 60, "<3d ago"),
-            (7 * 24 * 60 * 60, "<1w ago"),
-            (14 * 24 * 60 * 60, "<2w ago"),
-            (30 * 24 * 60 * 60, "<1mo ago"),
-            (90 * 24 * 60 * 60, "<3mo ago"),
-            (180 * 24 * 60 * 60, "<6mo ago"),
-            (365 * 24 * 60 * 60, "<1y ago"),
-        ]
-        for limit_s, label in buckets:
-            if delta_s < limit_s:
-                return label
-        return ">=1y ago"
+        idx = bisect.bisect_right(_AGE_LIMITS_S, delta_s)
+        return _AGE_LABELS[idx] if idx < len(_AGE_LABELS) else ">=1y ago"
     except ValueError:
         return ts_value
 
@@ -175,18 +201,39 @@ def most_recent_ok_ts(latest_ok: dict[str, dict]) -> str | None:
     return max(timestamps, default=None) if timestamps else None
 
 
-def age_seconds(ts_value: str) -> int | None:
-    """Return age in seconds for an ISO timestamp."""
-    if not ts_value or ts_value == "?":
+def _parse_aware_ts(ts_value: Any) -> dt.datetime | None:
+    """Parse an ISO timestamp, treating naive values as UTC; None if unparseable."""
+    if not ts_value:
         return None
     try:
         parsed = dt.datetime.fromisoformat(ts_value)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt.UTC)
-        now = dt.datetime.now(dt.UTC)
-        return max(int((now - parsed).total_seconds()), 0)
-    except ValueError:
+    except (TypeError, ValueError):
         return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.UTC)
+
+
+def _seconds_between(later: dt.datetime | None, earlier: dt.datetime | None) -> int | None:
+    """Return whole seconds from earlier to later (clamped at 0), or None if either is missing."""
+    if later is None or earlier is None:
+        return None
+    return max(int((later - earlier).total_seconds()), 0)
+
+
+def age_seconds(ts_value: str, *, now: dt.datetime | None = None) -> int | None:
+    """Return age in seconds for an ISO timestamp, relative to now (default: current time)."""
+    if not ts_value or ts_value == "?":
+        return None
+    parsed = _parse_aware_ts(ts_value)
+    if parsed is None:
+        return None
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
+    return _seconds_between(now, parsed)
+
+
+# Sub-minute and sub-hour durations are the common cases; format them once.
+_SECONDS_TEXT: tuple[str, ...] = tuple(f"{i}s" for i in range(60))
+_MINUTES_TEXT: tuple[str, ...] = tuple(f"{i}m" for i in range(60))
 
 
 def humanize_duration(seconds_value: int | None, *, min_unit: str = "s") -> str:
@@ -199,14 +246,13 @@ def humanize_duration(seconds_value: int | None, *, min_unit: str = "s") -> str:
     """
     if seconds_value is None:
         return "-"
-    seconds_value = max(seconds_value, 0)
     if seconds_value < 60:
         if min_unit == "m":
             return "<1m"
-        return f"{seconds_value}s"
-    minutes, seconds = divmod(seconds_value, 60)
+        return _SECONDS_TEXT[max(seconds_value, 0)]
+    minutes = seconds_value // 60
     if minutes < 60:
-        return f"{minutes}m"
+        return _MINUTES_TEXT[minutes]
     hours, minutes = divmod(minutes, 60)
     if hours < 24:
         return f"{hours}h {minutes:02d}m"
@@ -263,6 +309,16 @@ def format_ts_with_age(ts_value: str) -> str:
     return f"{ts_value} ({humanize_age(ts_value)})"
 
 
+@functools.lru_cache(maxsize=4096)
+def _sha_mnemonic(sha_hex: str) -> str:
+    """Return the two-word humanhash for a SHA256.
+
+    Memoized because a fleet shares a handful of vault SHAs and every row is
+    rebuilt on each refresh.
+    """
+    return humanize(sha_hex, words=2)
+
+
 def build_ok_row_values(
     host: str,
     record: dict[str, Any],
@@ -273,12 +329,33 @@ def build_ok_row_values(
     github_refs: dict[str, dict[str, Any]] | None = None,
     windows_pools: dict[str, dict[str, Any]] | None = None,
     notes_data: dict[str, str] | None = None,
+    now: dt.datetime | None = None,
+    display_host: str | None = None,
 ) -> dict[str, str]:
-    """Build string values for an OK monitor row."""
-    # Strip common FQDN suffix if provided
-    display_host = host
-    if fqdn_suffix and host.endswith(fqdn_suffix):
-        display_host = host[: -len(fqdn_suffix)]
+    """Build string values for an OK monitor row.
+
+    All ages are measured against now, so callers rendering many rows can pass
+    one timestamp for a consistent snapshot; it defaults to the current time.
+    display_host, if given, is used as-is instead of stripping fqdn_suffix from
+    host, so callers that render the same hosts repeatedly can strip them once.
+    """
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
+    # Strip common FQDN suffix if provided (callers may pass it precomputed)
+    if display_host is None:
+        display_host = host
+        if fqdn_suffix and host.endswith(fqdn_suffix):
+            display_host = host[: -len(fqdn_suffix)]
+
+    # Parse each timestamp once; the column branches below share these.
+    audit_dt = _parse_aware_ts(record.get("ts"))
+    tc_fields = tc_data or {}
+    scan_dt = _parse_aware_ts(tc_fields.get("ts"))
+    last_active_dt = _parse_aware_ts(tc_fields.get("last_date_active"))
+    quarantine_dt = _parse_aware_ts(tc_fields.get("quarantine_until"))
+    task_started_dt = _parse_aware_ts(tc_fields.get("task_started"))
+    task_resolved = tc_fields.get("task_resolved")
+    task_resolved_dt = _parse_aware_ts(task_resolved)
 
     observed = record.get("observed") or {}
     role_present = observed.get("role_present")
@@ -301,13 +378,13 @@ def build_ok_row_values(
     vault_sha_full = observed.get("vault_sha256") or ""
     sha = sha_full[:8] if sha_full else "-"
     vault_sha = vault_sha_full[:8] if vault_sha_full else "-"
+    vlt_mnemonic = _sha_mnemonic(vault_sha_full) if vault_sha_full else ""
     if vault_sha_full:
-        vault_sha = f"{vault_sha} {humanize(vault_sha_full, words=2)}"
+        vault_sha = f"{vault_sha} {vlt_mnemonic}"
 
     # Structured sub-fields for web UI popover (TUI uses the formatted strings below)
     ovr_branch = ""
     vlt_symlink = ""
-    vlt_mnemonic = humanize(vault_sha_full, words=2) if vault_sha_full else ""
 
     # Append human-readable info to SHA columns
     if sha_cache:
@@ -354,29 +431,16 @@ def build_ok_row_values(
 
     if puppet_state_ts:
         # New path: use puppet_state_ts
-        audit_ts = record.get("ts")
-        if audit_ts:
-            try:
-                audit_dt = dt.datetime.fromisoformat(audit_ts)
-                puppet_dt = dt.datetime.fromisoformat(puppet_state_ts)
-                if puppet_dt.tzinfo is None:
-                    puppet_dt = puppet_dt.replace(tzinfo=dt.UTC)
-                if audit_dt.tzinfo is None:
-                    audit_dt = audit_dt.replace(tzinfo=dt.UTC)
-                pp_age_s = max(int((audit_dt - puppet_dt).total_seconds()), 0)
-                pp_last = humanize_duration(pp_age_s)
-            except (ValueError, AttributeError):
-                pp_last = "--"
+        pp_age_s = _seconds_between(audit_dt, _parse_aware_ts(puppet_state_ts))
+        if pp_age_s is not None:
+            pp_last = humanize_duration(pp_age_s)
     elif puppet_last_run_epoch is not None:
         # Fallback path: use puppet_last_run_epoch
-        audit_ts = record.get("ts")
-        if audit_ts:
+        if audit_dt is not None:
             try:
-                audit_dt = dt.datetime.fromisoformat(audit_ts)
-                audit_epoch = int(audit_dt.timestamp())
-                pp_age_s = max(audit_epoch - puppet_last_run_epoch, 0)
+                pp_age_s = max(int(audit_dt.timestamp()) - puppet_last_run_epoch, 0)
                 pp_last = humanize_duration(pp_age_s)
-            except (ValueError, AttributeError):
+            except TypeError:
                 pp_last = "--"
 
     if puppet_success is False and pp_last != "--":
@@ -414,17 +478,7 @@ def build_ok_row_values(
 
     # HEALTHY: pp_match AND TC_ACT < 1 hour
     healthy = "-"
-    tc_act_s = None
-    if tc_data:
-        last_date_active = tc_data.get("last_date_active")
-        if last_date_active:
-            try:
-                last_active_dt = dt.datetime.fromisoformat(last_date_active)
-                if last_active_dt.tzinfo is None:
-                    last_active_dt = last_active_dt.replace(tzinfo=dt.UTC)
-                tc_act_s = max(int((dt.datetime.now(dt.UTC) - last_active_dt).total_seconds()), 0)
-            except (ValueError, AttributeError):
-                pass
+    tc_act_s = _seconds_between(now, last_active_dt)
 
     # HEALTHY: PP_MATCH=Y AND TC_ACT < 1 hour
     # (Now applies to both override and non-override hosts since PP_MATCH can be computed for both)
@@ -477,67 +531,31 @@ def build_ok_row_values(
 
     if tc_data:
         # TC data scan age (for combined DATA column)
-        tc_scan_ts = tc_data.get("ts")
-        if tc_scan_ts:
-            tc_ts_age = age_seconds(tc_scan_ts)
+        tc_ts_age = _seconds_between(now, scan_dt)
 
         # TC_QUAR: Quarantine status (only if quarantine time is in the future)
-        quarantine_until = tc_data.get("quarantine_until")
-        if quarantine_until:
-            try:
-                parsed = dt.datetime.fromisoformat(quarantine_until)
-                if parsed.tzinfo is None:
-                    parsed = parsed.replace(tzinfo=dt.UTC)
-                now = dt.datetime.now(dt.UTC)
-                if parsed > now:
-                    tc_quar = "YES"
-            except (ValueError, AttributeError):
-                pass
-
-        # Calculate ages relative to scan time, not current time
-        scan_ts = tc_data.get("ts")
+        if quarantine_dt is not None and quarantine_dt > now:
+            tc_quar = "YES"
 
         # TC_ACT: Last date active (relative to now, so it ages continuously)
-        last_date_active = tc_data.get("last_date_active")
-        if last_date_active:
-            try:
-                last_active_dt = dt.datetime.fromisoformat(last_date_active)
-                if last_active_dt.tzinfo is None:
-                    last_active_dt = last_active_dt.replace(tzinfo=dt.UTC)
-                now = dt.datetime.now(dt.UTC)
-                delta_s = max(int((now - last_active_dt).total_seconds()), 0)
-                tc_act = humanize_duration(delta_s)
-            except (ValueError, AttributeError):
-                pass
-
-        # TC_T_DUR: Task duration (completed) or time since start (in progress)
-        task_started = tc_data.get("task_started")
-        task_resolved = tc_data.get("task_resolved")
-        if task_started and scan_ts:
-            try:
-                scan_dt = dt.datetime.fromisoformat(scan_ts)
-                if scan_dt.tzinfo is None:
-                    scan_dt = scan_dt.replace(tzinfo=dt.UTC)
-                task_started_dt = dt.datetime.fromisoformat(task_started)
-                if task_started_dt.tzinfo is None:
-                    task_started_dt = task_started_dt.replace(tzinfo=dt.UTC)
-
-                if task_resolved:
-                    # Completed: show duration (resolved - started)
-                    task_resolved_dt = dt.datetime.fromisoformat(task_resolved)
-                    if task_resolved_dt.tzinfo is None:
-                        task_resolved_dt = task_resolved_dt.replace(tzinfo=dt.UTC)
-                    duration_s = max(int((task_resolved_dt - task_started_dt).total_seconds()), 0)
+        if tc_act_s is not None:
+            tc_act = humanize_duration(tc_act_s)
+
+        # TC_T_DUR: Task duration (completed) or time since start (in progress).
+        # In-progress ages are relative to scan time, not current time.
+        if task_started_dt is not None and scan_dt is not None:
+            if task_resolved:
+                # Completed: show duration (resolved - started)
+                duration_s = _seconds_between(task_resolved_dt, task_started_dt)
+                if duration_s is not None:
                     tc_j_sf = humanize_duration(duration_s)
-                else:
-                    # In progress: show time since start with trailing dash
-                    start_age_s = max(int((scan_dt - task_started_dt).total_seconds()), 0)
-                    tc_j_sf = f"{humanize_duration(start_age_s)} -"
-            except (ValueError, AttributeError):
-                pass
+            else:
+                # In progress: show time since start with trailing dash
+                start_age_s = _seconds_between(scan_dt, task_started_dt)
+                tc_j_sf = f"{humanize_duration(start_age_s)} -"
 
     # DATA: Combined audit/tc ages (use minutes as minimum unit)
-    audit_age = age_seconds(record.get("ts", "?"))
+    audit_age = _seconds_between(now, audit_dt)
     audit_str = humanize_duration(audit_age, min_unit="m") if audit_age is not None else "-"
     tc_str = humanize_duration(tc_ts_age, min_unit="m") if tc_ts_age is not None else "-"
     data = f"{audit_str}/{tc_str}"
@@ -591,12 +609,17 @@ def build_row_values(
     github_refs: dict[str, dict[str, Any]] | None = None,
     windows_pools: dict[str, dict[str, Any]] | None = None,
     notes_data: dict[str, str] | None = None,
+    now: dt.datetime | None = None,
+    display_host: str | None = None,
 ) -> dict[str, str]:
-    """Build string values for a monitor row."""
-    # Strip common FQDN suffix if provided
-    display_host = host
-    if fqdn_suffix and host.endswith(fqdn_suffix):
-        display_host = host[: -len(fqdn_suffix)]
+    """Build string values for a monitor row; see build_ok_row_values for now/display_host."""
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
+    # Strip common FQDN suffix if provided (callers may pass it precomputed)
+    if display_host is None:
+        display_host = host
+        if fqdn_suffix and host.endswith(fqdn_suffix):
+            display_host = host[: -len(fqdn_suffix)]
 
     note = notes_data.get(host, "-") if notes_data else "-"
 
@@ -606,7 +629,7 @@ def build_row_values(
         if tc_data:
             tc_ts = tc_data.get("ts")
             if tc_ts and isinstance(tc_ts, str):
-                tc_str = humanize_duration(age_seconds(tc_ts), min_unit="m")
+                tc_str = humanize_duration(age_seconds(tc_ts, now=now), min_unit="m")
             pool = tc_data.get("worker_type") or "-"
         return {
             "status": "UNK",
@@ -650,6 +673,8 @@ def build_row_values(
                 github_refs=github_refs,
                 windows_pools=windows_pools,
                 notes_data=notes_data,
+                now=now,
+                display_host=display_host,
             )
             values["status"] = "FAIL"
             values["err"] = err
@@ -659,7 +684,7 @@ def build_row_values(
         if tc_data:
             tc_ts = tc_data.get("ts")
             if tc_ts and isinstance(tc_ts, str):
-                tc_str = humanize_duration(age_seconds(tc_ts), min_unit="m")
+                tc_str = humanize_duration(age_seconds(tc_ts, now=now), min_unit="m")
             pool = tc_data.get("worker_type") or "-"
         audit_str = "-"
         return {
@@ -701,6 +726,8 @@ def build_row_values(
         github_refs=github_refs,
         windows_pools=windows_pools,
         notes_data=notes_data,
+        now=now,
+        display_host=display_host,
     )
 
 
@@ -820,7 +847,8 @@ class AuditLogTailer:
     ) -> None:
         self.conn = conn
         self.hosts = hosts
-        self._buffer: list[tuple[int, dict[str, Any]]] = []
+        # popleft() keeps draining a large batch linear; list.pop(0) shifts every entry
+        self._buffer: deque[tuple[int, dict[str, Any]]] = deque()
 
         # Initialize high-water mark using max rowid for these hosts
         from ...db import get_max_observation_rowid
@@ -834,13 +862,15 @@ class AuditLogTailer:
 
             # Commit to end any stale read transaction and see latest writes
             self.conn.commit()
-            self._buffer = get_observations_since_rowid(
-                self.conn, hosts=self.hosts, after_rowid=self._last_rowid
+            self._buffer.extend(
+                get_observations_since_rowid(
+                    self.conn, hosts=self.hosts, after_rowid=self._last_rowid
+                )
             )
 
         if not self._buffer:
             return None
 
-        rowid, record = self._buffer.pop(0)
+        rowid, record = self._buffer.popleft()
         self._last_rowid = rowid
         return record
@@ -38,6 +38,7 @@ from .filters_popup import (
     filter_rows,
     find_active_row_index,
 )
+from .formatting import COLUMN_LABELS
 from .header_renderer import HeaderInfo, HeaderRenderer
 from .help_popup import draw_help_popup
 from .named_filters import load_named_filters
@@ -180,6 +181,12 @@ class MonitorDisplay:
         timestamps = [r.get("ts") for r in latest.values() if r.get("ts")]
         self.last_updated = max(timestamps, default=None) if timestamps else None
         self.fqdn_suffix = detect_common_fqdn_suffix(hosts)
+        # The host list is fixed, so strip names once rather than on every redraw
+        self.short_hosts = {h: strip_fqdn(h) for h in hosts}
+        suffix = self.fqdn_suffix
+        self.display_hosts = {
+            h: h[: -len(suffix)] if suffix and h.endswith(suffix) else h for h in hosts
+        }
         self.show_help = False
         self._filters_configs_dir: Path | None = filters_configs_dir
         self.named_filters: list[NamedFilter] = []
@@ -710,24 +717,8 @@ class MonitorDisplay:
             "note",
         ]
 
-        labels = {
-            "host": "HOST",
-            "uptime": "UPTIME",
-            "role": "ROLE",
-            "os": "OS",
-            "sha": "OVR_BCH",
-            "vlt_sha": "VLT_SHA",
-            "note": "NOTE",
-            "tc_quar": "TC_QUAR",
-            "tc_act": "TC_ACT",
-            "tc_j_sf": "TC_T_DUR",
-            "pp_last": "PP_LAST",
-            "pp_exp": "PP_EXP",
-            "pp_sha": "PP_SHA",
-            "pp_match": "PP_MATCH",
-            "healthy": "HEALTHY",
-            "data": "DATA",
-        }
+        # Copy: the active sort column gets an indicator appended below.
+        labels = dict(COLUMN_LABELS)
 
         # Add sort indicator (↑/↓) to active column
         if self._query.has_sort():
@@ -746,19 +737,19 @@ class MonitorDisplay:
             labels[active_column] = labels[active_column] + sort_indicator
 
         widths = {col: len(labels[col]) for col in all_columns}
+        now = dt.datetime.now(dt.UTC)
         for host in sorted_hosts:
-            short_host = strip_fqdn(host)
-            tc_worker_data = self.tc_data.get(short_host)
             values = build_row_values(
                 host,
                 self.latest.get(host),
                 last_ok=self.latest_ok.get(host),
-                tc_data=tc_worker_data,
-                fqdn_suffix=self.fqdn_suffix,
+                tc_data=self.tc_data.get(self.short_hosts[host]),
+                display_host=self.display_hosts[host],
                 sha_cache=self.sha_cache,
                 github_refs=self.github_refs,
                 windows_pools=self.windows_pools,
                 notes_data=self.notes_data,
+                now=now,
             )
             for col in all_columns:
                 widths[col] = max(widths[col], len(values[col]))
@@ -804,14 +795,12 @@ class MonitorDisplay:
         Returns:
             True if host has overrides, False otherwise
         """
-        short_host = strip_fqdn(hostname)
-        tc_worker_data = self.tc_data.get(short_host)
         values = build_row_values(
             hostname,
             self.latest.get(hostname),
             last_ok=self.latest_ok.get(hostname),
-            tc_data=tc_worker_data,
-            fqdn_suffix=self.fqdn_suffix,
+            tc_data=self.tc_data.get(self.short_hosts[hostname]),
+            display_host=self.display_hosts[hostname],
             sha_cache=self.sha_cache,
             github_refs=self.github_refs,
             windows_pools=self.windows_pools,
@@ -828,14 +817,12 @@ class MonitorDisplay:
         Returns:
             OS abbreviation ("L", "M", "W", etc.)
         """
-        short_host = strip_fqdn(hostname)
-        tc_worker_data = self.tc_data.get(short_host)
         values = build_row_values(
             hostname,
             self.latest.get(hostname),
             last_ok=self.latest_ok.get(hostname),
-            tc_data=tc_worker_data,
-            fqdn_suffix=self.fqdn_suffix,
+            tc_data=self.tc_data.get(self.short_hosts[hostname]),
+            display_host=self.display_hosts[hostname],
             sha_cache=self.sha_cache,
             github_refs=self.github_refs,
             windows_pools=self.windows_pools,
@@ -856,17 +843,19 @@ class MonitorDisplay:
         # Apply /query filter and sort if active
         if not self._query.is_empty():
             row_dicts = []
+            now = dt.datetime.now(dt.UTC)
             for h in sorted_hosts:
                 values = build_row_values(
                     h,
                     self.latest.get(h),
                     last_ok=self.latest_ok.get(h),
-                    tc_data=self.tc_data.get(strip_fqdn(h)),
-                    fqdn_suffix=self.fqdn_suffix,
+                    tc_data=self.tc_data.get(self.short_hosts[h]),
+                    display_host=self.display_hosts[h],
                     sha_cache=self.sha_cache,
                     github_refs=self.github_refs,
                     windows_pools=self.windows_pools,
                     notes_data=self.notes_data,
+                    now=now,
                 )
                 values["_host"] = h
                 row_dicts.append(values)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import datetime as dt
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from .data import build_row_values, strip_fqdn
@@ -10,6 +13,87 @@ if TYPE_CHECKING:
     from .cache import ShaInfoCache
 
 
+# Column layout for the plain-text table. Built once at import; the width pass
+# copies what it needs to mutate.
+_COLUMNS: tuple[str, ...] = (
+    "host",
+    "os",
+    "role",
+    "vlt_sha",
+    "sha",
+    "uptime",
+    "pp_last",
+    "pp_exp",
+    "pp_sha",
+    "pp_match",
+    "tc_act",
+    "tc_j_sf",
+    "tc_quar",
+    "data",
+    "healthy",
+    "note",
+)
+
+COLUMN_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        "host": "HOST",
+        "uptime": "UPTIME",
+        "role": "ROLE",
+        "os": "OS",
+        "sha": "OVR_BCH",
+        "vlt_sha": "VLT_SHA",
+        "note": "NOTE",
+        "tc_quar": "TC_QUAR",
+        "tc_act": "TC_ACT",
+        "tc_j_sf": "TC_T_DUR",
+        "pp_last": "PP_LAST",
+        "pp_exp": "PP_EXP",
+        "pp_sha": "PP_SHA",
+        "pp_match": "PP_MATCH",
+        "healthy": "HEALTHY",
+        "data": "DATA",
+    }
+)
+_LABEL_WIDTHS: Mapping[str, int] = MappingProxyType(
+    {col: len(label) for col, label in COLUMN_LABELS.items()}
+)
+
+_CAPS: Mapping[str, int] = MappingProxyType(
+    {
+        "host": 80,
+        "uptime": 16,
+        "role": 40,
+        "os": 1,
+        "sha": 30,
+        "vlt_sha": 40,
+        "note": 20,
+        "tc_quar": 8,
+        "tc_act": 12,
+        "tc_j_sf": 20,
+        "pp_last": 12,
+        "pp_exp": 7,
+        "pp_sha": 7,
+        "pp_match": 8,
+        "healthy": 7,
+        "data": 12,
+    }
+)
+
+_DROP_ORDER: tuple[str, ...] = (
+    "note",
+    "vlt_sha",
+    "sha",
+    "role",
+    "os",
+    "uptime",
+    "pp_exp",
+    "tc_quar",
+    "tc_j_sf",
+    "tc_act",
+    "data",
+)
+
+
 def clip_cell(value: str, width: int) -> str:
     """Clip and pad a cell to width using ASCII ellipsis."""
     if width <= 0:
@@ -56,67 +140,22 @@ def compute_columns_and_widths(
     github_refs: dict[str, dict[str, Any]] | None = None,
     windows_pools: dict[str, dict[str, Any]] | None = None,
     notes_data: dict[str, str] | None = None,
+    now: dt.datetime | None = None,
+    row_values: dict[str, dict[str, str]] | None = None,
 ) -> tuple[list[str], dict[str, int]]:
-    """Compute columns and widths that fit within max_width."""
-    columns = [
-        "host",
-        "os",
-        "role",
-        "vlt_sha",
-        "sha",
-        "uptime",
-        "pp_last",
-        "pp_exp",
-        "pp_sha",
-        "pp_match",
-        "tc_act",
-        "tc_j_sf",
-        "tc_quar",
-        "data",
-        "healthy",
-        "note",
-    ]
-    labels = {
-        "host": "HOST",
-        "uptime": "UPTIME",
-        "role": "ROLE",
-        "os": "OS",
-        "sha": "OVR_BCH",
-        "vlt_sha": "VLT_SHA",
-        "note": "NOTE",
-        "tc_quar": "TC_QUAR",
-        "tc_act": "TC_ACT",
-        "tc_j_sf": "TC_T_DUR",
-        "pp_last": "PP_LAST",
-        "pp_exp": "PP_EXP",
-        "pp_sha": "PP_SHA",
-        "pp_match": "PP_MATCH",
-        "healthy": "HEALTHY",
-        "data": "DATA",
-    }
-    caps = {
-        "host": 80,
-        "uptime": 16,
-        "role": 40,
-        "os": 1,
-        "sha": 30,
-        "vlt_sha": 40,
-        "note": 20,
-        "tc_quar": 8,
-        "tc_act": 12,
-        "tc_j_sf": 20,
-        "pp_last": 12,
-        "pp_exp": 7,
-        "pp_sha": 7,
-        "pp_match": 8,
-        "healthy": 7,
-        "data": 12,
-    }
+    """Compute columns and widths that fit within max_width.
+
+    If row_values is given, each host's built values are stored in it so the
+    caller can render rows without building them a second time.
+    """
+    columns = list(_COLUMNS)
+    caps = _CAPS
     if cap_widths and max_width > 0:
-        caps["host"] = min(caps["host"], max_width)
-        caps["role"] = min(80, max_width)
-    widths = {col: len(labels[col]) for col in columns}
+        caps = {**_CAPS, "host": min(_CAPS["host"], max_width), "role": min(80, max_width)}
+    widths = dict(_LABEL_WIDTHS)
     tc_data = tc_data or {}
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
     for host in hosts:
         short_host = strip_fqdn(host)
         values = build_row_values(
@@ -129,7 +168,10 @@ def compute_columns_and_widths(
             github_refs=github_refs,
             windows_pools=windows_pools,
             notes_data=notes_data,
+            now=now,
         )
+        if row_values is not None:
+            row_values[host] = values
         for col in columns:
             widths[col] = max(widths[col], len(values[col]))
     if cap_widths:
@@ -139,25 +181,12 @@ def compute_columns_and_widths(
     if max_width <= 0:
         return columns, widths
 
-    drop_order = [
-        "note",
-        "vlt_sha",
-        "sha",
-        "role",
-        "os",
-        "uptime",
-        "pp_exp",
-        "tc_quar",
-        "tc_j_sf",
-        "tc_act",
-        "data",
-    ]
     while True:
         separators = (len(columns) - 1) * sep_len
         total = sum(widths[col] for col in columns) + separators
         if total <= max_width:
             return columns, widths
-        for drop in drop_order:
+        for drop in _DROP_ORDER:
             if drop in columns and len(columns) > 2:
                 columns.remove(drop)
                 widths.pop(drop, None)
@@ -190,6 +219,7 @@ def format_monitor_row(
     github_refs: dict[str, dict[str, Any]] | None = None,
     windows_pools: dict[str, dict[str, Any]] | None = None,
     notes_data: dict[str, str] | None = None,
+    now: dt.datetime | None = None,
 ) -> str:
     """Format a single table row for a host."""
     values = build_row_values(
@@ -202,7 +232,19 @@ def format_monitor_row(
         github_refs=github_refs,
         windows_pools=windows_pools,
         notes_data=notes_data,
+        now=now,
     )
+    return format_monitor_row_from_values(values, columns=columns, widths=widths, col_sep=col_sep)
+
+
+def format_monitor_row_from_values(
+    values: dict[str, str],
+    *,
+    columns: list[str],
+    widths: dict[str, int],
+    col_sep: str = " ",
+) -> str:
+    """Format a table row from already-built row values."""
     parts = [clip_cell(values[col], widths[col]) for col in columns]
     return col_sep.join(parts)
 
@@ -226,6 +268,10 @@ def render_monitor_lines(
 ) -> tuple[str, list[str]]:
     """Render monitor header + lines in the provided host order."""
     tc_data = tc_data or {}
+    # One timestamp for the whole table, so every row's ages share a snapshot
+    now = dt.datetime.now(dt.UTC)
+    # The width pass builds every row; keep the values so rows aren't built twice
+    row_values: dict[str, dict[str, str]] = {}
     columns, widths = compute_columns_and_widths(
         hosts=hosts,
         latest=latest,
@@ -239,26 +285,10 @@ def render_monitor_lines(
         github_refs=github_refs,
         windows_pools=windows_pools,
         notes_data=notes_data,
+        now=now,
+        row_values=row_values,
     )
-    labels = {
-        "host": "HOST",
-        "uptime": "UPTIME",
-        "role": "ROLE",
-        "os": "OS",
-        "sha": "OVR_BCH",
-        "vlt_sha": "VLT_SHA",
-        "note": "NOTE",
-        "tc_quar": "TC_QUAR",
-        "tc_act": "TC_ACT",
-        "tc_j_sf": "TC_T_DUR",
-        "pp_last": "PP_LAST",
-        "pp_exp": "PP_EXP",
-        "pp_sha": "PP_SHA",
-        "pp_match": "PP_MATCH",
-        "healthy": "HEALTHY",
-        "data": "DATA",
-    }
-    header_parts = [clip_cell(labels[col], widths[col]) for col in columns]
+    header_parts = [clip_cell(COLUMN_LABELS[col], widths[col]) for col in columns]
     header = col_sep.join(header_parts)
 
     if limit is None:
@@ -266,19 +296,8 @@ def render_monitor_lines(
     else:
         host_slice = hosts[start : start + limit]
     lines = [
-        format_monitor_row(
-            host,
-            latest.get(host),
-            last_ok=latest_ok.get(host) if latest_ok else None,
-            tc_data=tc_data.get(strip_fqdn(host)),
-            columns=columns,
-            widths=widths,
-            col_sep=col_sep,
-            fqdn_suffix=fqdn_suffix,
-            sha_cache=sha_cache,
-            github_refs=github_refs,
-            windows_pools=windows_pools,
-            notes_data=notes_data,
+        format_monitor_row_from_values(
+            row_values[host], columns=columns, widths=widths, col_sep=col_sep
         )
         for host in host_slice
     ]
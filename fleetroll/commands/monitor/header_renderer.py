@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from importlib.metadata import version as get_version
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .curses_colors import CursesColors
 
+from ...utils import fleetroll_version
 from .formatting import clip_cell, render_row_cells
 from .types import os_filter_label
 
@@ -254,7 +254,7 @@ class HeaderRenderer:
             Number of rows used by the header (1 or 2)
         """
         try:
-            ver = get_version("fleetroll")
+            ver = fleetroll_version()
         except Exception:
             ver = "?"
         # Fixed-position OVERRIDES badge right after "[? for help]" so it pops
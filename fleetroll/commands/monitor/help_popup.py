@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import contextlib
 from curses import error as curses_error
-from importlib.metadata import version as get_version
 
+from ...utils import fleetroll_version
 from .types import COLUMN_GUIDE_TEXT, FLEETROLL_MASCOT, HELP_COLUMNS, HELP_KEYBINDINGS
 
 
@@ -23,7 +23,7 @@ def draw_help_popup(stdscr, curses_mod, *, color_enabled: bool) -> None:
     height, width = stdscr.getmaxyx()
 
     try:
-        ver = get_version("fleetroll")
+        ver = fleetroll_version()
     except Exception:
         ver = "?"
     version_line = f"fleetroll v{ver}"
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import os
+import sqlite3
 import sys
 import threading
 import time
@@ -15,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 import click
 import yaml
 
-from ..audit import append_jsonl, store_content_file
+from ..audit import append_jsonl, load_latest_vault_checksums, store_content_file
 from ..constants import BACKUP_TIME_FORMAT, DRY_RUN_PREVIEW_LIMIT, VAULT_YAMLS_DIR_NAME
 from ..exceptions import CommandFailureError, UserError
 from ..humanhash import humanize
@@ -38,12 +40,13 @@ def resolve_vault_path(sha_prefix: str, *, vault_dir: Path) -> Path:
     if not vault_dir.exists():
         raise UserError(f"Vault directory not found: {vault_dir}")
 
-    matches: list[Path] = []
-    for entry in vault_dir.iterdir():
-        if entry.is_symlink():
-            continue
-        if entry.is_file() and entry.name.startswith(sha_prefix):
-            matches.append(entry)
+    # scandir entries carry d_type, so regular files are recognized without a stat
+    with os.scandir(vault_dir) as it:
+        matches = [
+            Path(entry.path)
+            for entry in it
+            if entry.name.startswith(sha_prefix) and entry.is_file(follow_symlinks=False)
+        ]
 
     if not matches:
         raise UserError(f"No vault file found for prefix: {sha_prefix}")
@@ -59,15 +62,14 @@ def resolve_vault_humanhash(human_hash: str, *, vault_dir: Path) -> Path:
         raise UserError(f"Vault directory not found: {vault_dir}")
 
     matches: list[tuple[Path, str]] = []
-    for entry in vault_dir.iterdir():
-        if entry.is_symlink():
-            continue
-        if not entry.is_file():
-            continue
-        content = entry.read_bytes()
-        sha = sha256_hex(content)
-        if humanize(sha, words=2) == human_hash:
-            matches.append((entry, sha))
+    with os.scandir(vault_dir) as it:
+        for entry in it:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            path = Path(entry.path)
+            sha = sha256_hex(path.read_bytes())
+            if humanize(sha, words=2) == human_hash:
+                matches.append((path, sha))
 
     if not matches:
         raise UserError(f"No vault file found for human-hash: {human_hash}")
@@ -147,9 +149,49 @@ def set_vault_for_host(
             append_jsonl(audit_log, result)
     else:
         append_jsonl(audit_log, result)
+    if result["ok"]:
+        _record_vault_checksum(audit_log, host, content_hash, result["ts"])
     return result
 
 
+def _seed_vault_checksums(audit_log: Path) -> None:
+    """Ensure the vault_checksums tables exist and are synced with the audit log.
+
+    Later loads only need to index what this run appends.
+    """
+    from ..db import get_connection, get_db_path, init_db
+
+    try:
+        db_path = get_db_path()
+        init_db(db_path)
+        conn = get_connection(db_path)
+        try:
+            load_latest_vault_checksums(audit_log, conn=conn)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        click.echo(f"Warning: could not update vault checksum index: {e}", err=True)
+
+
+def _record_vault_checksum(audit_log: Path, host: str, sha256: str, ts: str) -> None:
+    """Mirror a successful host.set_vault record into the vault_checksums table.
+
+    A failure here only delays the update: the next load indexes the record from
+    the audit log itself.
+    """
+    from ..db import get_connection, get_db_path, update_vault_checksum
+
+    try:
+        conn = get_connection(get_db_path())
+        try:
+            update_vault_checksum(conn, audit_log, host, sha256, ts)
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        click.echo(f"Warning: could not update vault checksum index: {e}", err=True)
+
+
 def format_set_line(result: dict[str, Any]) -> str:
     """Format a single-line status for batch set results."""
     host = result.get("host", "?")
@@ -309,8 +351,7 @@ def cmd_host_set_vault(args: HostSetVaultArgs) -> None:
 
     backup_suffix = dt.datetime.now(dt.UTC).strftime(BACKUP_TIME_FORMAT)
     vault_dir = audit_log.parent / VAULT_YAMLS_DIR_NAME
-    content_text = data.decode("utf-8", errors="replace")
-    stored_path = store_content_file(content_text, content_hash, vault_dir)
+    stored_path = store_content_file(data, content_hash, vault_dir)
 
     from ..ssh import remote_set_vault_script
 
@@ -322,6 +363,8 @@ def cmd_host_set_vault(args: HostSetVaultArgs) -> None:
         backup_suffix=backup_suffix,
     )
 
+    _seed_vault_checksums(audit_log)
+
     if not is_batch:
         host = hosts[0]
         result = set_vault_for_host(
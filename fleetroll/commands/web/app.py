@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from importlib.metadata import version
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from fleetroll.utils import fleetroll_version
+
 from .logging import RequestIDMiddleware, configure_structlog
 from .routes.filters import router as filters_router
 from .routes.health import router as health_router
@@ -23,7 +24,7 @@ def create_app(settings: WebSettings | None = None) -> FastAPI:
 
     configure_structlog()
 
-    app = FastAPI(title="fleetroll", version=version("fleetroll"))
+    app = FastAPI(title="fleetroll", version=fleetroll_version())
 
     app.add_middleware(RequestIDMiddleware)  # type: ignore[arg-type]
 
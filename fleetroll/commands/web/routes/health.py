@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from importlib.metadata import version
-
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
 from fleetroll.commands.web.schemas import HealthResponse
 from fleetroll.db import get_connection, get_db_path
+from fleetroll.utils import fleetroll_version
 
 router = APIRouter()
 
 
 @router.get("/api/health", response_model=HealthResponse)
 def health() -> JSONResponse:
-    fleetroll_version = version("fleetroll")
+    version = fleetroll_version()
     try:
         db_path = get_db_path()
         conn = get_connection(db_path)
@@ -25,6 +24,6 @@ def health() -> JSONResponse:
     except Exception:
         db_ok = False
 
-    payload = HealthResponse(ok=db_ok, db_ok=db_ok, version=fleetroll_version)
+    payload = HealthResponse(ok=db_ok, db_ok=db_ok, version=version)
     status_code = 200 if db_ok else 503
     return JSONResponse(content=payload.model_dump(), status_code=status_code)
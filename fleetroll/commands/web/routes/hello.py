@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-from importlib.metadata import version
-
 from fastapi import APIRouter
 
 from fleetroll.commands.web.schemas import HelloResponse
 from fleetroll.db import get_connection, get_db_path
+from fleetroll.utils import fleetroll_version
 
 router = APIRouter()
 
 
 @router.get("/api/hello", response_model=HelloResponse)
 def hello() -> HelloResponse:
-    fleetroll_version = version("fleetroll")
+    version = fleetroll_version()
     try:
         db_path = get_db_path()
         conn = get_connection(db_path)
@@ -24,4 +23,4 @@ def hello() -> HelloResponse:
     except Exception:
         db_ok = False
 
-    return HelloResponse(message="Hello, fleetroll", version=fleetroll_version, db_ok=db_ok)
+    return HelloResponse(message="Hello, fleetroll", version=version, db_ok=db_ok)
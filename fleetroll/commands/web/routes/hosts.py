@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from importlib.metadata import version as get_version
 from pathlib import Path
 from typing import Annotated
 
@@ -23,7 +22,7 @@ from fleetroll.constants import STALE_DATA_THRESHOLD_SECONDS
 from fleetroll.data_provider import LocalProvider
 from fleetroll.db import get_all_known_hosts, get_connection, get_db_path
 from fleetroll.notes import default_notes_path, load_latest_notes
-from fleetroll.utils import check_log_sizes
+from fleetroll.utils import check_log_sizes, fleetroll_version
 
 router = APIRouter()
 
@@ -55,6 +54,8 @@ def hosts(
 
     db_path = get_db_path()
     conn = get_connection(db_path)
+    # One timestamp for every row's ages and the response
+    now = datetime.now(UTC)
     try:
         conn.commit()
         all_hosts = get_all_known_hosts(conn)
@@ -81,6 +82,7 @@ def hosts(
                 github_refs=github_refs,
                 windows_pools=windows_pools,
                 notes_data=notes_data,
+                now=now,
             )
             for host in sorted(all_hosts)
         ]
@@ -88,11 +90,11 @@ def hosts(
         rows = [HostRow(**v) for v in values_list]
 
         most_recent_ok = most_recent_ok_ts(latest_ok)
-        ok_age = age_seconds(most_recent_ok) if most_recent_ok else None
+        ok_age = age_seconds(most_recent_ok, now=now) if most_recent_ok else None
         data_is_stale = ok_age is None or ok_age > STALE_DATA_THRESHOLD_SECONDS
 
         summary = HostsSummary(
-            version=get_version("fleetroll"),
+            version=fleetroll_version(),
             db_path=str(db_path),
             total_hosts=len(all_hosts),
             fqdn_suffix=detect_common_fqdn_suffix(list(all_hosts)),
@@ -102,4 +104,4 @@ def hosts(
     finally:
         conn.close()
 
-    return HostsResponse(rows=rows, generated_at=datetime.now(UTC), summary=summary)
+    return HostsResponse(rows=rows, generated_at=now, summary=summary)
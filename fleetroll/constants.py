@@ -25,6 +25,8 @@ WIN_COLLECT_SCRIPT_PATH = r"C:\management_scripts\fleetroll_mvp_collect.ps1"
 
 # Internal constants
 CONTENT_SENTINEL = "__FLEETROLL_OVERRIDE_CONTENT__"
+VAULT_CONTENT_KEY = "VLT_CONTENT_B64"  # Inline base64 vault.yaml line in audit output
+VAULT_KNOWN_SHAS_MAX = 32  # Stored vault shas sent to hosts so known content is not re-sent
 BACKUP_TIME_FORMAT = "%Y%m%dT%H%M%SZ"
 SSH_TIMEOUT_EXIT_CODE = 124
 # When force_tty=True, run_ssh allocates a local pty whose winsize ssh
@@ -33,15 +35,25 @@ SSH_TIMEOUT_EXIT_CODE = 124
 # pretty-printer emit absurd padding when run from a wide terminal.
 SSH_PTY_COLS = 200
 SSH_PTY_ROWS = 50
+# OpenSSH connection multiplexing (--ssh-mux): one control socket per
+# (user, host, port) under the FleetRoll dir, kept open between commands so
+# follow-up connections (vault fetch, post-set audit) skip TCP+KEX+auth.
+# Multiplexed sessions per host are capped by the remote sshd MaxSessions
+# (default 10).
+SSH_CONTROL_PATH_NAME = "cm-%C"
+SSH_CONTROL_PERSIST_S = 60
+SSHD_MAX_STARTUPS = 10  # OpenSSH default; unmultiplexed fan-out above this may be throttled
 AUDIT_MAX_RETRIES = 1
 AUDIT_RETRY_DELAY_S = 2
 CONTENT_PREFIX_LEN = 12
 CONTENT_PREFIX_STEP = 4
 AUDIT_DIR_NAME = ".fleetroll"
 AUDIT_FILE_NAME = "audit.jsonl"
+JSONL_READ_BUFFER_SIZE = 1024 * 1024  # Read buffer for scanning JSONL logs
 OVERRIDES_DIR_NAME = "overrides"
 VAULT_YAMLS_DIR_NAME = "vault_yamls"
 DRY_RUN_PREVIEW_LIMIT = 5
+LOG_BUFFER_CAPACITY = 512  # Debug log records buffered before a stderr write
 DEFAULT_GITHUB_REPO = "mozilla-platform-ops/ronin_puppet"
 
 CONFIG_FILE_NAME = "config.toml"
@@ -53,6 +65,12 @@ DATA_DIR_NAME = "data"
 # SQLite database settings
 DB_FILE_NAME = "fleetroll.db"
 DB_RETENTION_LIMIT = 10  # Keep latest N records per key in SQLite tables
+DB_WRITER_BATCH_SIZE = 200  # Max observations committed per writer transaction
+DB_WRITER_FLUSH_INTERVAL_S = 0.1  # Max time a writer batch waits to fill before commit
+PROGRESS_LABEL_INTERVAL_S = 1.0  # Min seconds between progress bar label rebuilds
+DB_WRITER_QUEUE_SIZE = 1000  # Bounded backlog; producers block when the writer falls behind
+DB_WRITER_BATCH_ATTEMPTS = 2  # Tries per writer batch before its records are dropped
+DB_WRITER_RETRY_DELAY_S = 0.5  # Pause between attempts at a failed writer batch
 
 # Monitor display settings
 STALE_DATA_THRESHOLD_SECONDS = 3600  # 1 hour — show [stale] if no ok checks within this window
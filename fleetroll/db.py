@@ -4,6 +4,8 @@ Provides storage for high-frequency data:
 - host_observations: Host audit records
 - tc_workers: TaskCluster worker data
 - github_refs: GitHub branch references
+- vault_checksums: Latest vault sha256 set per host, per audit log (index over the log)
+- vault_checksum_sources: How far each audit log has been indexed into vault_checksums
 
 All tables use hybrid schema (indexed columns + JSON blob) and automatic
 retention limiting to prevent unbounded growth.
@@ -11,13 +13,44 @@ retention limiting to prevent unbounded growth.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import itertools
 import json
+import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
-from .constants import AUDIT_DIR_NAME, DB_FILE_NAME, DB_RETENTION_LIMIT
+from .constants import (
+    AUDIT_DIR_NAME,
+    DB_FILE_NAME,
+    DB_RETENTION_LIMIT,
+    DB_WRITER_BATCH_ATTEMPTS,
+    DB_WRITER_BATCH_SIZE,
+    DB_WRITER_FLUSH_INTERVAL_S,
+    DB_WRITER_QUEUE_SIZE,
+    DB_WRITER_RETRY_DELAY_S,
+)
+
+logger = logging.getLogger("fleetroll")
+
+try:  # optional: orjson parses the stored JSON blobs several times faster
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def _loads_json(data: str) -> Any:
+    """Parse a stored JSON data column, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def get_db_path() -> Path:
@@ -93,6 +126,31 @@ def init_db(db_path: Path) -> None:
             )
         """)
 
+        # Latest vault checksum per host, mirrored from host.set_vault audit records.
+        # Rows are keyed by the audit log they index; the table is rebuildable, so
+        # an older layout without log_path is simply dropped.
+        vault_columns = {row[1] for row in conn.execute("PRAGMA table_info(vault_checksums)")}
+        if vault_columns and "log_path" not in vault_columns:
+            conn.execute("DROP TABLE vault_checksums")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS vault_checksums (
+                log_path TEXT NOT NULL,
+                host TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                PRIMARY KEY (log_path, host)
+            )
+        """)
+
+        # Identity (inode) of each indexed audit log and the byte offset indexed so far
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS vault_checksum_sources (
+                log_path TEXT PRIMARY KEY,
+                inode INTEGER NOT NULL,
+                indexed_bytes INTEGER NOT NULL
+            )
+        """)
+
         conn.commit()
     finally:
         conn.close()
@@ -110,6 +168,8 @@ def get_connection(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA busy_timeout=5000")
+    # Safe under WAL (set by init_db): commits skip the per-transaction fsync
+    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 
@@ -133,12 +193,14 @@ def insert_host_observation(
     Raises:
         KeyError: If record is missing required fields
     """
-    host = record["host"]
-    ts = record["ts"]
-    ok = record.get("ok", 0)
-    data_json = json.dumps(record)
+    _insert_host_observation_row(conn, host_observation_row(record), retention_limit)
 
-    # Insert new record
+
+def _insert_host_observation_row(
+    conn: sqlite3.Connection, row: HostObservationRow, retention_limit: int
+) -> None:
+    """Upsert one pre-serialized row, then apply the host's retention policy."""
+    host, ts, ok, data_json = row
     conn.execute(
         """
         INSERT INTO host_observations (host, ts, ok, data)
@@ -147,7 +209,94 @@ def insert_host_observation(
         """,
         (host, ts, ok, data_json, ok, data_json),
     )
+    _apply_host_observation_retention(conn, host, retention_limit)
+
+
+# Column order of a HostObservationRow, as bound by the batch insert path
+HOST_OBSERVATION_COLUMNS = ("host", "ts", "ok", "data")
+HostObservationRow = tuple[str, str, Any, str]
+
+
+@functools.lru_cache(maxsize=256)
+def _host_observations_insert_sql(nrows: int) -> str:
+    """Return a multi-row upsert statement for ``nrows`` host observations."""
+    columns = ", ".join(HOST_OBSERVATION_COLUMNS)
+    group = "(" + ", ".join("?" * len(HOST_OBSERVATION_COLUMNS)) + ")"
+    values = ", ".join([group] * nrows)
+    return (
+        f"INSERT INTO host_observations ({columns}) VALUES {values} "
+        "ON CONFLICT (host, ts) DO UPDATE SET ok=excluded.ok, data=excluded.data"
+    )
+
+
+def host_observation_row(record: dict[str, Any]) -> HostObservationRow:
+    """Serialize a host observation record into a (host, ts, ok, data) row.
+
+    Raises:
+        KeyError: If record is missing required fields
+    """
+    return (record["host"], record["ts"], record.get("ok", 0), json.dumps(record))
+
+
+def insert_host_observations(
+    conn: sqlite3.Connection,
+    records: list[dict[str, Any]],
+    *,
+    retention_limit: int = DB_RETENTION_LIMIT,
+) -> None:
+    """Insert many host observation records with multi-row INSERT statements.
+
+    Rows are bound into as few statements as the connection's variable limit
+    allows, then the retention policy of insert_host_observation() is applied
+    once per distinct host rather than once per record.
+
+    Args:
+        conn: Database connection
+        records: Host observation records (each must have host, ts, ok fields)
+        retention_limit: Number of recent records to keep per host
+
+    Raises:
+        KeyError: If a record is missing required fields
+    """
+    rows = [host_observation_row(r) for r in records]
+    insert_host_observation_rows(conn, rows, retention_limit=retention_limit)
+
+
+def insert_host_observation_rows(
+    conn: sqlite3.Connection,
+    rows: list[HostObservationRow],
+    *,
+    retention_limit: int = DB_RETENTION_LIMIT,
+) -> None:
+    """Insert pre-serialized host observation rows; see insert_host_observations().
+
+    Args:
+        conn: Database connection
+        rows: Rows built by host_observation_row()
+        retention_limit: Number of recent records to keep per host
+    """
+    if len(rows) == 1:
+        # A lone row gains nothing from the multi-row statement
+        _insert_host_observation_row(conn, rows[0], retention_limit)
+        return
+
+    ncols = len(HOST_OBSERVATION_COLUMNS)
+    max_rows = max(1, conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) // ncols)
+    for start in range(0, len(rows), max_rows):
+        chunk = rows[start : start + max_rows]
+        conn.execute(
+            _host_observations_insert_sql(len(chunk)),
+            tuple(itertools.chain.from_iterable(chunk)),
+        )
+
+    for host in dict.fromkeys(row[0] for row in rows):
+        _apply_host_observation_retention(conn, host, retention_limit)
+
 
+def _apply_host_observation_retention(
+    conn: sqlite3.Connection, host: str, retention_limit: int
+) -> None:
+    """Trim a host's observations to the latest N, preserving its last ok=1 record."""
     # Find most recent ok=1 record
     last_ok_row = conn.execute(
         """
@@ -337,6 +486,80 @@ def insert_windows_pool(
     )
 
 
+def _vault_log_key(log_path: Path) -> str:
+    """Return the key vault_checksums rows are stored under for an audit log."""
+    return str(log_path.resolve())
+
+
+def update_vault_checksum(
+    conn: sqlite3.Connection, log_path: Path, host: str, sha256: str, ts: str
+) -> None:
+    """Record the latest vault checksum set on a host.
+
+    Args:
+        conn: Database connection
+        log_path: Audit log the host.set_vault record was written to
+        host: Hostname the vault was written to
+        sha256: SHA256 of the vault contents
+        ts: ISO timestamp of the set operation
+    """
+    conn.execute(
+        """
+        INSERT INTO vault_checksums (log_path, host, sha256, ts)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (log_path, host) DO UPDATE SET sha256=excluded.sha256, ts=excluded.ts
+        """,
+        (_vault_log_key(log_path), host, sha256, ts),
+    )
+
+
+def get_vault_checksums(conn: sqlite3.Connection, log_path: Path) -> dict[str, str]:
+    """Return the latest vault sha256 per host indexed from an audit log.
+
+    Raises:
+        sqlite3.OperationalError: If the vault_checksums table does not exist
+    """
+    rows = conn.execute(
+        "SELECT host, sha256 FROM vault_checksums WHERE log_path = ?",
+        (_vault_log_key(log_path),),
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def get_vault_checksum_source(conn: sqlite3.Connection, log_path: Path) -> tuple[int, int] | None:
+    """Return (inode, indexed byte offset) recorded for an audit log, or None.
+
+    Raises:
+        sqlite3.OperationalError: If the vault_checksum_sources table does not exist
+    """
+    row = conn.execute(
+        "SELECT inode, indexed_bytes FROM vault_checksum_sources WHERE log_path = ?",
+        (_vault_log_key(log_path),),
+    ).fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def set_vault_checksum_source(
+    conn: sqlite3.Connection, log_path: Path, inode: int, offset: int
+) -> None:
+    """Record how far an audit log has been indexed into vault_checksums."""
+    conn.execute(
+        """
+        INSERT INTO vault_checksum_sources (log_path, inode, indexed_bytes)
+        VALUES (?, ?, ?)
+        ON CONFLICT (log_path) DO UPDATE SET inode=excluded.inode, indexed_bytes=excluded.indexed_bytes
+        """,
+        (_vault_log_key(log_path), inode, offset),
+    )
+
+
+def clear_vault_checksums(conn: sqlite3.Connection, log_path: Path) -> None:
+    """Forget everything indexed from an audit log."""
+    key = _vault_log_key(log_path)
+    conn.execute("DELETE FROM vault_checksums WHERE log_path = ?", (key,))
+    conn.execute("DELETE FROM vault_checksum_sources WHERE log_path = ?", (key,))
+
+
 def get_latest_windows_pools(
     conn: sqlite3.Connection,
 ) -> dict[str, dict[str, Any]]:
@@ -359,7 +582,7 @@ def get_latest_windows_pools(
 
     for row in rows:
         pool_name = row["pool_name"]
-        data = json.loads(row["data"])
+        data = _loads_json(row["data"])
         result[pool_name] = data
 
     return result
@@ -406,13 +629,20 @@ def get_latest_host_observations(
 
     for row in rows:
         host = row["host"]
-        data = json.loads(row["data"])
+        data = _loads_json(row["data"])
         latest[host] = data
 
         if data.get("ok"):
             latest_ok[host] = data
 
-    # Get latest ok=1 per host (for hosts that don't have ok=1 as latest)
+    # Get latest ok=1 per host, only for hosts whose latest record failed. Hosts
+    # with an ok latest record are already resolved, and hosts with no records
+    # at all have no ok=1 rows either.
+    failed_hosts = [host for host in latest if host not in latest_ok]
+    if not failed_hosts:
+        return latest, latest_ok
+
+    placeholders = ",".join("?" * len(failed_hosts))
     rows_ok = conn.execute(
         f"""
         SELECT host, data
@@ -424,14 +654,11 @@ def get_latest_host_observations(
             GROUP BY host
         )
         """,
-        hosts,
+        failed_hosts,
     ).fetchall()
 
     for row in rows_ok:
-        host = row["host"]
-        data = json.loads(row["data"])
-        if host not in latest_ok:
-            latest_ok[host] = data
+        latest_ok[row["host"]] = _loads_json(row["data"])
 
     return latest, latest_ok
 
@@ -467,7 +694,7 @@ def get_observations_since(
         [*hosts, after_ts],
     ).fetchall()
 
-    return [json.loads(row["data"]) for row in rows]
+    return [_loads_json(row["data"]) for row in rows]
 
 
 def get_observations_since_rowid(
@@ -503,7 +730,7 @@ def get_observations_since_rowid(
         [*hosts, after_rowid],
     ).fetchall()
 
-    return [(row["rowid"], json.loads(row["data"])) for row in rows]
+    return [(row["rowid"], _loads_json(row["data"])) for row in rows]
 
 
 def get_max_observation_rowid(
@@ -572,7 +799,7 @@ def get_latest_tc_workers(
 
     for row in rows:
         host = row["host"]
-        data = json.loads(row["data"])
+        data = _loads_json(row["data"])
         result[host] = data
 
     return result
@@ -602,7 +829,7 @@ def get_latest_github_refs(
         owner = row["owner"]
         repo = row["repo"]
         branch = row["branch"]
-        data = json.loads(row["data"])
+        data = _loads_json(row["data"])
         key = f"{owner}/{repo}:{branch}"
         result[key] = data
 
@@ -641,3 +868,167 @@ def compact_database(db_path: Path) -> tuple[int, int]:
 
     size_after = db_path.stat().st_size if db_path.exists() else 0
     return size_before, size_after
+
+
+class ObservationWriter:
+    """Batching writer for host observations.
+
+    Audit worker threads enqueue records, which are serialized immediately so
+    callers may keep mutating them; a single background thread owns the SQLite
+    connection and commits them in batches of up to ``batch_size`` records
+    or ``flush_interval_s`` seconds, whichever comes first. A large audit then
+    pays one commit per batch instead of one per host.
+
+    A batch that keeps failing after DB_WRITER_BATCH_ATTEMPTS tries has its
+    records dropped and logged, and later batches are still written. Use as a context
+    manager, or call close() to flush pending records and stop the writer
+    thread. close() re-raises the first write error, unless the with block is
+    already unwinding another exception.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        batch_size: int = DB_WRITER_BATCH_SIZE,
+        flush_interval_s: float = DB_WRITER_FLUSH_INTERVAL_S,
+        queue_size: int = DB_WRITER_QUEUE_SIZE,
+        retention_limit: int = DB_RETENTION_LIMIT,
+    ) -> None:
+        self._db_path = db_path
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._retention_limit = retention_limit
+        self._queue: queue.Queue[HostObservationRow | None] = queue.Queue(maxsize=queue_size)
+        self._error: sqlite3.Error | None = None
+        self._dropped_hosts: list[str] = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="observation-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Don't mask the in-flight exception with a write error
+        with contextlib.suppress(sqlite3.Error):
+            self.close()
+
+    @property
+    def dropped_hosts(self) -> list[str]:
+        """Hosts whose observations could not be written, in write order."""
+        return list(self._dropped_hosts)
+
+    def enqueue(self, record: dict[str, Any]) -> None:
+        """Queue an observation record for writing.
+
+        The record is serialized before this returns. Blocks while the queue is
+        full so producers cannot outrun the writer.
+
+        Raises:
+            RuntimeError: If the writer has been closed
+            KeyError: If record is missing required fields
+        """
+        self.enqueue_row(host_observation_row(record))
+
+    def enqueue_row(self, row: HostObservationRow) -> None:
+        """Queue a row already laid out in HOST_OBSERVATION_COLUMNS order.
+
+        Lets producers that hold the fields as locals skip the record lookups.
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError("ObservationWriter is closed")
+        self._queue.put(row)
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread.
+
+        Raises:
+            sqlite3.Error: The first write error, if any batch was dropped
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _batches(self) -> Iterator[list[HostObservationRow]]:
+        """Yield batches from the queue until the close sentinel is seen."""
+        while True:
+            row = self._queue.get()
+            if row is None:
+                return
+            batch = [row]
+            deadline = time.monotonic() + self._flush_interval_s
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is None:
+                    yield batch
+                    return
+                batch.append(row)
+            yield batch
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[HostObservationRow]) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            insert_host_observation_rows(conn, batch, retention_limit=self._retention_limit)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _drop_batch(self, batch: list[HostObservationRow], error: sqlite3.Error) -> None:
+        hosts = [row[0] for row in batch]
+        logger.error(
+            "Failed to write %d host observation(s) to %s: %s (hosts: %s)",
+            len(batch),
+            self._db_path,
+            error,
+            ", ".join(hosts),
+        )
+        self._dropped_hosts.extend(hosts)
+        if self._error is None:
+            self._error = error
+
+    def _write_batch_with_retry(
+        self, conn: sqlite3.Connection, batch: list[HostObservationRow]
+    ) -> None:
+        for attempt in range(1, DB_WRITER_BATCH_ATTEMPTS + 1):
+            try:
+                self._write_batch(conn, batch)
+                return
+            except sqlite3.Error as e:
+                if attempt == DB_WRITER_BATCH_ATTEMPTS:
+                    self._drop_batch(batch, e)
+                    return
+                logger.warning(
+                    "Retrying write of %d host observation(s) after error: %s", len(batch), e
+                )
+                time.sleep(DB_WRITER_RETRY_DELAY_S)
+
+    def _run(self) -> None:
+        # Keep draining after errors so producers never block on a full queue
+        try:
+            conn = get_connection(self._db_path)
+        except sqlite3.Error as e:
+            for batch in self._batches():
+                self._drop_batch(batch, e)
+            return
+        try:
+            for batch in self._batches():
+                self._write_batch_with_retry(conn, batch)
+        finally:
+            conn.close()
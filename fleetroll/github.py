@@ -6,6 +6,7 @@ import base64
 import logging
 import re
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -23,6 +24,7 @@ from .utils import utc_now_iso
 logger = logging.getLogger(__name__)
 
 GITHUB_FETCH_INTERVAL_S = 3600  # 1 hour
+GITHUB_FETCH_WORKERS = 8  # Concurrent GitHub API requests per fetch
 
 
 def _github_headers(token: str | None = None) -> dict[str, str]:
@@ -256,6 +258,23 @@ def should_fetch(db_conn: sqlite3.Connection) -> bool:
         return True
 
 
+def _store_windows_pool_hashes(
+    db_conn: sqlite3.Connection, pool_hashes: dict[str, str], ts: str
+) -> int:
+    """Insert windows_pool records for fetched pool hashes; return how many were written."""
+    from .db import insert_windows_pool
+
+    for pool_name, hash_val in pool_hashes.items():
+        record = {
+            "type": "windows_pool",
+            "ts": ts,
+            "pool_name": pool_name,
+            "hash": hash_val,
+        }
+        insert_windows_pool(db_conn, record)
+    return len(pool_hashes)
+
+
 def do_github_fetch(*, override_delay: bool = False, quiet: bool = False) -> None:
     """Fetch GitHub branch refs and write to SQLite database.
 
@@ -265,7 +284,7 @@ def do_github_fetch(*, override_delay: bool = False, quiet: bool = False) -> Non
     """
     import click
 
-    from .db import get_connection, get_db_path, init_db, insert_github_ref, insert_windows_pool
+    from .db import get_connection, get_db_path, init_db, insert_github_ref
 
     config = load_config()
     github_token: str | None = config.get("github", {}).get("api_token")
@@ -316,63 +335,70 @@ def do_github_fetch(*, override_delay: bool = False, quiet: bool = False) -> Non
         branches_found = 0
         errors: list[str] = []
 
-        for (owner, repo), branches in repo_branches.items():
-            if not quiet:
-                click.echo(f"Fetching {owner}/{repo}...", nl=False)
-
-            refs = fetch_branch_shas(owner, repo, github_token=github_token)
-
-            if not refs:
-                error_msg = f"No refs returned for {owner}/{repo}"
-                errors.append(error_msg)
+        # Requests run concurrently; results are written and reported in repo order
+        # as soon as each one (and every repo before it) has finished.
+        if not quiet:
+            click.echo(
+                f"Fetching {len(repo_branches)} repo(s) and Windows pool hashes "
+                f"({GITHUB_FETCH_WORKERS} at a time)..."
+            )
+        executor = ThreadPoolExecutor(
+            max_workers=GITHUB_FETCH_WORKERS, thread_name_prefix="fleetroll-gh"
+        )
+        with executor:
+            pool_future = executor.submit(fetch_windows_pool_hashes, github_token=github_token)
+            repo_futures = [
+                executor.submit(fetch_branch_shas, owner, repo, github_token=github_token)
+                for owner, repo in repo_branches
+            ]
+            for ((owner, repo), branches), refs_future in zip(
+                repo_branches.items(), repo_futures, strict=True
+            ):
+                refs = refs_future.result()
                 if not quiet:
-                    click.echo(f" FAILED: {error_msg}")
-                    if not github_token:
-                        click.echo(
-                            "tip: set [github] api_token in ~/.fleetroll/config.toml"
-                            " for higher rate limits"
-                        )
-                continue
+                    click.echo(f"  {owner}/{repo}:", nl=False)
 
-            # Write branch_ref records for branches we care about
-            refs_map = {ref["ref"]: ref["sha"] for ref in refs}
-            matched = 0
-
-            for branch in branches:
-                if branch in refs_map:
-                    record = {
-                        "type": "branch_ref",
-                        "ts": ts,
-                        "owner": owner,
-                        "repo": repo,
-                        "branch": branch,
-                        "sha": refs_map[branch],
-                    }
-                    insert_github_ref(db_conn, record)
-                    branches_found += 1
-                    matched += 1
-                else:
-                    error_msg = f"Branch {branch} not found in {owner}/{repo}"
+                if not refs:
+                    error_msg = f"No refs returned for {owner}/{repo}"
                     errors.append(error_msg)
+                    if not quiet:
+                        click.echo(f" FAILED: {error_msg}")
+                        if not github_token:
+                            click.echo(
+                                "tip: set [github] api_token in ~/.fleetroll/config.toml"
+                                " for higher rate limits"
+                            )
+                    continue
+
+                # Write branch_ref records for branches we care about
+                refs_map = {ref["ref"]: ref["sha"] for ref in refs}
+                matched = 0
+
+                for branch in branches:
+                    if branch in refs_map:
+                        record = {
+                            "type": "branch_ref",
+                            "ts": ts,
+                            "owner": owner,
+                            "repo": repo,
+                            "branch": branch,
+                            "sha": refs_map[branch],
+                        }
+                        insert_github_ref(db_conn, record)
+                        branches_found += 1
+                        matched += 1
+                    else:
+                        error_msg = f"Branch {branch} not found in {owner}/{repo}"
+                        errors.append(error_msg)
 
-            if not quiet:
-                click.echo(f" {matched}/{len(branches)} branch(es) found")
+                if not quiet:
+                    click.echo(f" {matched}/{len(branches)} branch(es) found")
 
-        # Fetch and store Windows pool hashes
+        # Store Windows pool hashes
+        pool_hashes = pool_future.result()
         if not quiet:
-            click.echo("Fetching Windows pool hashes from pools.yml...", nl=False)
-        pool_hashes = fetch_windows_pool_hashes(github_token=github_token)
-        pools_written = 0
-        if pool_hashes:
-            for pool_name, hash_val in pool_hashes.items():
-                record = {
-                    "type": "windows_pool",
-                    "ts": ts,
-                    "pool_name": pool_name,
-                    "hash": hash_val,
-                }
-                insert_windows_pool(db_conn, record)
-                pools_written += 1
+            click.echo("  Windows pool hashes (pools.yml):", nl=False)
+        pools_written = _store_windows_pool_hashes(db_conn, pool_hashes, ts)
         if not quiet:
             if pool_hashes:
                 click.echo(f" {pools_written} pool(s) found")
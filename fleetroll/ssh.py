@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import contextlib
 import fcntl
+import functools
 import logging
 import os
 import pty
@@ -13,13 +14,18 @@ import struct
 import subprocess
 import termios
 import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .constants import (
+    AUDIT_DIR_NAME,
     CONTENT_SENTINEL,
+    SSH_CONTROL_PATH_NAME,
+    SSH_CONTROL_PERSIST_S,
     SSH_PTY_COLS,
     SSH_PTY_ROWS,
     SSH_TIMEOUT_EXIT_CODE,
+    VAULT_CONTENT_KEY,
     WIN_COLLECT_SCRIPT_PATH,
     WIN_METADATA_JSON_PATH,
 )
@@ -133,6 +139,21 @@ def build_ssh_options(args: HasSshOptions) -> list[str]:
     return opts
 
 
+def ssh_mux_options() -> tuple[str, ...]:
+    """Return --ssh-option values that enable OpenSSH connection multiplexing.
+
+    Creates the control socket directory (~/.fleetroll, mode 0700) if needed.
+    """
+    control_dir = Path(os.path.expanduser("~")) / AUDIT_DIR_NAME
+    control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    control_path = shlex.quote(str(control_dir / SSH_CONTROL_PATH_NAME))
+    return (
+        "-o ControlMaster=auto",
+        f"-o ControlPath={control_path}",
+        f"-o ControlPersist={SSH_CONTROL_PERSIST_S}s",
+    )
+
+
 def is_windows_host(hostname: str) -> bool:
     """Return True if hostname identifies a Windows host.
 
@@ -179,6 +200,7 @@ def windows_ssh_host(hostname: str) -> str:
     return f"administrator@{hostname}"
 
 
+@functools.cache
 def remote_windows_audit_script() -> str:
     """Generate remote PowerShell command for auditing a Windows host.
 
@@ -190,18 +212,31 @@ def remote_windows_audit_script() -> str:
     return f"powershell -EncodedCommand {encoded}"
 
 
-def audit_script_body(*, include_content: bool) -> str:
-    """Return the remote shell script body for auditing a host."""
+# The audit scripts are deterministic and shipped to every host in a batch, so
+# each variant is built (and shell-quoted / encoded) once per process.
+@functools.lru_cache(maxsize=4)
+def audit_script_body(*, include_content: bool, include_vault_content: bool = False) -> str:
+    """Return the remote shell script body for auditing a host.
+
+    With include_vault_content, vault.yaml is also emitted base64-encoded on a
+    single VAULT_CONTENT_KEY line, so it needs no second SSH session to fetch.
+    Vault shas passed as the script's arguments are already stored by the
+    controller, so matching content is not sent.
+    """
     # Remote output is line-oriented to make it easy to parse.
     # We intentionally avoid printing arbitrary separators in content output.
     # Content is printed after a sentinel line.
     sentinel = CONTENT_SENTINEL
     include_content_cmd = "true" if include_content else "false"
+    include_vault_cmd = "true" if include_vault_content else "false"
     # Note: use /bin/sh for portability.
     # We use sudo -n everywhere; failures will be visible.
     script = f"""
 set -eu
 
+# Vault shas the controller already has (positional args are reused below)
+known_vault_shas=" $* "
+
 # Detect operating system
 os_type=$(uname -s)
 printf 'OS_TYPE=%s\\n' "$os_type"
@@ -280,6 +315,17 @@ if sudo -n test -e "$vp" 2>/dev/null; then
     fi
     if [ -n "$vsha" ]; then
       printf 'VLT_SHA256=%s\\n' "$vsha"
+      if {include_vault_cmd}; then
+        case "$known_vault_shas" in
+          *" $vsha "*) ;;
+          *)
+            vlt_b64=$(sudo -n cat "$vp" 2>/dev/null | base64 | tr -d '\\n' || true)
+            if [ -n "$vlt_b64" ]; then
+              printf '{VAULT_CONTENT_KEY}=%s\\n' "$vlt_b64"
+            fi
+            ;;
+        esac
+      fi
     fi
   fi
 else
@@ -401,9 +447,22 @@ fi
     return script.strip("\n")
 
 
-def remote_audit_script(*, include_content: bool) -> str:
+@functools.lru_cache(maxsize=4)
+def remote_audit_script(
+    *,
+    include_content: bool,
+    include_vault_content: bool = False,
+    known_vault_shas: tuple[str, ...] = (),
+) -> str:
     """Generate remote shell script for auditing a host."""
-    return "sh -c " + shlex.quote(audit_script_body(include_content=include_content))
+    body = audit_script_body(
+        include_content=include_content, include_vault_content=include_vault_content
+    )
+    script = "sh -c " + shlex.quote(body)
+    if known_vault_shas:
+        # sh -c assigns the first argument to $0; the shas become "$@"
+        script += " sh " + " ".join(map(shlex.quote, known_vault_shas))
+    return script
 
 
 def remote_read_file_script(path: str) -> str:
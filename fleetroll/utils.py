@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import hashlib
 import ipaddress
 import os
@@ -53,7 +54,7 @@ def format_host_preview(hosts: list[str], *, limit: int) -> list[str]:
 
 def utc_now_iso() -> str:
     """Return current UTC time in ISO format without microseconds."""
-    return dt.datetime.now(dt.UTC).replace(microsecond=0).isoformat()
+    return dt.datetime.now(dt.UTC).isoformat(timespec="seconds")
 
 
 def format_elapsed_time(seconds: float) -> str:
@@ -86,6 +87,14 @@ def ensure_parent_dir(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 
 
+@functools.cache
+def fleetroll_version() -> str:
+    """Return the installed fleetroll version, read from package metadata once per process."""
+    from importlib.metadata import version
+
+    return version("fleetroll")
+
+
 def infer_actor() -> str:
     """Infer the actor (user) performing the operation."""
     return (
@@ -156,6 +165,9 @@ def is_host_file(host_arg: str) -> bool:
     return p.exists() and p.is_file()
 
 
+_FQDN_DIRECTIVE_RE = re.compile(r"^#\s*fqdn:\s*(\S+)")
+
+
 def parse_host_list(file_path: Path) -> list[str]:
     """Parse host list file. One host per line, ignore comments (#) and blank lines.
 
@@ -172,7 +184,7 @@ def parse_host_list(file_path: Path) -> list[str]:
             if not line:
                 continue
             if line.startswith("#"):
-                m = re.match(r"^#\s*fqdn:\s*(\S+)", line)
+                m = _FQDN_DIRECTIVE_RE.match(line)
                 if m:
                     fqdn_suffix = m.group(1)
                     if not fqdn_suffix.startswith("."):
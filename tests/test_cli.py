@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import logging.handlers
+import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
-from fleetroll.cli import cli, setup_logging
+from fleetroll.cli import cli, flush_logging, main, setup_logging
 from fleetroll.constants import AUDIT_FILE_NAME, DB_FILE_NAME
+from fleetroll.exceptions import CommandFailureError, FleetRollError, UserError
 
 
 @pytest.fixture
@@ -120,6 +125,48 @@ class TestCliVersion:
         assert "0." in result.output or "1." in result.output
 
 
+class TestCliLazyImports:
+    """Tests for deferred command imports."""
+
+    def test_import_does_not_load_command_modules(self):
+        """Importing the CLI does not pull in command implementations or their helpers."""
+        deferred = (
+            "fleetroll.commands.",
+            "fleetroll.cli_types",
+            "fleetroll.ssh",
+            "fleetroll.utils",
+        )
+        code = (
+            "import sys, fleetroll.cli; "
+            f"print(sorted(m for m in sys.modules if m.startswith({deferred!r})))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_library_import_does_not_build_cli(self):
+        """Importing a library module leaves the click command tree unbuilt."""
+        code = "import sys, fleetroll.db; print('fleetroll.cli' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_package_main_resolves_to_cli_main(self):
+        """fleetroll.main (the console-script target) is the CLI entry point."""
+        import fleetroll
+
+        assert fleetroll.main is main
+
+    def test_commands_package_resolves_lazily(self):
+        """Command entry points are still importable from fleetroll.commands."""
+        from fleetroll.commands import cmd_override_show
+        from fleetroll.commands.override import cmd_override_show as direct
+
+        assert cmd_override_show is direct
+
+
 class TestCliValidation:
     """Tests for CLI argument validation."""
 
@@ -282,6 +329,45 @@ class TestCliCommonOptions:
         result = runner.invoke(cli, ["host-set-vault", "--help"])
         assert "--ssh-option" in result.output
 
+    def test_ssh_mux_enabled_by_default(self, runner: CliRunner):
+        """gather-host appends mux options after user --ssh-option values."""
+        with (
+            patch("fleetroll.ssh.ssh_mux_options", return_value=("-o ControlMaster=auto",)),
+            patch("fleetroll.commands.cmd_host_audit") as mock_audit,
+        ):
+            result = runner.invoke(cli, ["gather-host", "h1", "--ssh-option", "-p 2222"])
+        assert result.exit_code == 0, result.output
+        assert mock_audit.call_args[0][0].ssh_option == ("-p 2222", "-o ControlMaster=auto")
+
+    def test_no_ssh_mux(self, runner: CliRunner):
+        """--no-ssh-mux leaves ssh options untouched."""
+        with patch("fleetroll.commands.cmd_host_audit") as mock_audit:
+            result = runner.invoke(cli, ["gather-host", "h1", "--no-ssh-mux"])
+        assert result.exit_code == 0, result.output
+        assert mock_audit.call_args[0][0].ssh_option is None
+
+    def test_many_workers_without_mux_warns(self, runner: CliRunner):
+        """Unmultiplexed fan-out above sshd MaxStartups logs a warning."""
+        with (
+            patch("fleetroll.commands.cmd_host_audit"),
+            patch("fleetroll.cli.logger.warning") as mock_warning,
+        ):
+            result = runner.invoke(cli, ["gather-host", "h1", "--no-ssh-mux", "--workers", "20"])
+        assert result.exit_code == 0, result.output
+        mock_warning.assert_called_once()
+        assert "MaxStartups" in mock_warning.call_args[0][0]
+
+    def test_many_workers_with_mux_does_not_warn(self, runner: CliRunner):
+        """Multiplexed fan-out does not warn about MaxStartups."""
+        with (
+            patch("fleetroll.ssh.ssh_mux_options", return_value=("-o ControlMaster=auto",)),
+            patch("fleetroll.commands.cmd_host_audit"),
+            patch("fleetroll.cli.logger.warning") as mock_warning,
+        ):
+            result = runner.invoke(cli, ["gather-host", "h1", "--workers", "20"])
+        assert result.exit_code == 0, result.output
+        mock_warning.assert_not_called()
+
     def test_timeout_options_in_all_commands(self, runner: CliRunner):
         """--timeout and --connect-timeout are available in all commands."""
         for cmd in [
@@ -334,7 +420,8 @@ class TestCliLogging:
             stderr_handlers = [
                 h
                 for h in logger.handlers
-                if isinstance(h, logging.StreamHandler) and getattr(h, "stream", None) is sys.stderr
+                if isinstance(h, logging.handlers.MemoryHandler)
+                and getattr(h.target, "stream", None) is sys.stderr
             ]
             assert len(stderr_handlers) == 1
         finally:
@@ -343,6 +430,59 @@ class TestCliLogging:
             for handler in original_handlers:
                 logger.addHandler(handler)
 
+    def test_setup_logging_reuses_handler_and_sets_level(self):
+        """setup_logging installs one shared handler and only updates the level after."""
+        logger = logging.getLogger("fleetroll")
+        original_handlers = list(logger.handlers)
+        original_propagate = logger.propagate
+        try:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+
+            setup_logging(debug=True)
+            first = list(logger.handlers)
+            assert logger.level == logging.DEBUG
+            assert logger.propagate is False
+
+            setup_logging(debug=False)
+            assert logger.handlers == first
+            assert logger.level == logging.WARNING
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            for handler in original_handlers:
+                logger.addHandler(handler)
+            logger.propagate = original_propagate
+
+    def test_debug_records_buffered_until_flush(self):
+        """Debug records are batched; errors and flush_logging write them out."""
+        logger = logging.getLogger("fleetroll")
+        original_handlers = list(logger.handlers)
+        original_propagate = logger.propagate
+        stream = io.StringIO()
+        try:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            with patch.object(sys, "stderr", stream):
+                setup_logging(debug=True)
+                logger.debug("first")
+                assert stream.getvalue() == ""
+                logger.error("boom")
+                assert stream.getvalue() == "DEBUG: first\nERROR: boom\n"
+                logger.debug("second")
+                flush_logging()
+                assert stream.getvalue().endswith("DEBUG: second\n")
+
+                setup_logging(debug=False)
+                logger.warning("now")
+                assert stream.getvalue().endswith("WARNING: now\n")
+        finally:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            for handler in original_handlers:
+                logger.addHandler(handler)
+            logger.propagate = original_propagate
+
 
 class TestCliMissingHelp:
     """--help smoke tests for commands not yet covered."""
@@ -605,3 +745,37 @@ class TestMaintainCommand:
         )
         assert result.exit_code == 0
         assert "1 file(s) rotated" in result.output
+
+
+class TestMainExitHandling:
+    """Tests for main() exception-to-exit-code mapping."""
+
+    @pytest.mark.parametrize(
+        ("exc", "rc", "stderr"),
+        [
+            (CommandFailureError(rc=3), 3, ""),
+            (UserError("bad input", rc=4), 4, "ERROR: bad input\n"),
+            (FleetRollError("boom"), 2, "ERROR: boom\n"),
+            (KeyboardInterrupt(), 130, "ERROR: Interrupted\n"),
+        ],
+    )
+    def test_exit_codes(self, exc: BaseException, rc: int, stderr: str, capsys):
+        """Each handled exception maps to its exit code and message."""
+        with patch("fleetroll.cli.cli", side_effect=exc), pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == rc
+        assert capsys.readouterr().err == stderr
+
+    def test_subclass_uses_nearest_base(self, capsys):
+        """Unlisted subclasses resolve to their nearest handled base class."""
+
+        class CustomUserError(UserError):
+            pass
+
+        with (
+            patch("fleetroll.cli.cli", side_effect=CustomUserError("nope", rc=5)),
+            pytest.raises(SystemExit) as excinfo,
+        ):
+            main()
+        assert excinfo.value.code == 5
+        assert capsys.readouterr().err == "ERROR: nope\n"
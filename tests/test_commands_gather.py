@@ -36,9 +36,9 @@ class TestGatherSkipFlags:
     def _run_gather(self, runner: CliRunner, extra_args: list[str] | None = None):
         args = ["gather", "somehost"] + (extra_args or [])
         with (
-            patch("fleetroll.cli.cmd_host_audit") as mock_host,
-            patch("fleetroll.cli.cmd_tc_fetch") as mock_tc,
-            patch("fleetroll.cli.cmd_gh_fetch") as mock_gh,
+            patch("fleetroll.commands.cmd_host_audit") as mock_host,
+            patch("fleetroll.commands.cmd_tc_fetch") as mock_tc,
+            patch("fleetroll.commands.cmd_gh_fetch") as mock_gh,
         ):
             result = runner.invoke(cli, args)
             return result, mock_host, mock_tc, mock_gh
@@ -86,9 +86,9 @@ class TestGatherArgPassthrough:
 
     def test_quiet_propagates(self, runner: CliRunner):
         with (
-            patch("fleetroll.cli.cmd_host_audit") as mock_host,
-            patch("fleetroll.cli.cmd_tc_fetch") as mock_tc,
-            patch("fleetroll.cli.cmd_gh_fetch") as mock_gh,
+            patch("fleetroll.commands.cmd_host_audit") as mock_host,
+            patch("fleetroll.commands.cmd_tc_fetch") as mock_tc,
+            patch("fleetroll.commands.cmd_gh_fetch") as mock_gh,
         ):
             result = runner.invoke(cli, ["gather", "somehost", "--quiet"])
             assert result.exit_code == 0
@@ -100,9 +100,9 @@ class TestGatherArgPassthrough:
 
     def test_verbose_count_propagates(self, runner: CliRunner):
         with (
-            patch("fleetroll.cli.cmd_host_audit") as mock_host,
-            patch("fleetroll.cli.cmd_tc_fetch") as mock_tc,
-            patch("fleetroll.cli.cmd_gh_fetch"),
+            patch("fleetroll.commands.cmd_host_audit") as mock_host,
+            patch("fleetroll.commands.cmd_tc_fetch") as mock_tc,
+            patch("fleetroll.commands.cmd_gh_fetch"),
         ):
             result = runner.invoke(cli, ["gather", "somehost", "-vv"])
             assert result.exit_code == 0
@@ -113,9 +113,9 @@ class TestGatherArgPassthrough:
 
     def test_host_arg_forwarded(self, runner: CliRunner):
         with (
-            patch("fleetroll.cli.cmd_host_audit") as mock_host,
-            patch("fleetroll.cli.cmd_tc_fetch") as mock_tc,
-            patch("fleetroll.cli.cmd_gh_fetch"),
+            patch("fleetroll.commands.cmd_host_audit") as mock_host,
+            patch("fleetroll.commands.cmd_tc_fetch") as mock_tc,
+            patch("fleetroll.commands.cmd_gh_fetch"),
         ):
             result = runner.invoke(cli, ["gather", "myhost.example.com"])
             assert result.exit_code == 0
@@ -127,9 +127,9 @@ class TestGatherArgPassthrough:
     def test_stop_on_host_failure(self, runner: CliRunner):
         """If gather-host raises, gather-tc and gather-gh are not called."""
         with (
-            patch("fleetroll.cli.cmd_host_audit", side_effect=RuntimeError("ssh failed")),
-            patch("fleetroll.cli.cmd_tc_fetch") as mock_tc,
-            patch("fleetroll.cli.cmd_gh_fetch") as mock_gh,
+            patch("fleetroll.commands.cmd_host_audit", side_effect=RuntimeError("ssh failed")),
+            patch("fleetroll.commands.cmd_tc_fetch") as mock_tc,
+            patch("fleetroll.commands.cmd_gh_fetch") as mock_gh,
         ):
             result = runner.invoke(cli, ["gather", "somehost"])
             assert result.exit_code != 0
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
+from fleetroll.audit import has_content_file, store_content_file
 from fleetroll.cli_types import HostAuditArgs
 from fleetroll.commands.gather_host import (
     aggregate_audit_summary,
+    audit_single_host_with_retry,
     cmd_host_audit,
+    cmd_host_audit_batch,
+    execute_audits_parallel,
     format_single_host_output,
     format_summary_table,
+    select_known_vault_shas,
+    split_vault_content,
 )
+from fleetroll.constants import CONTENT_SENTINEL, VAULT_CONTENT_KEY
 from fleetroll.exceptions import CommandFailureError
+from fleetroll.ssh import remote_audit_script
 
 
 class TestCmdHostAudit:
@@ -54,6 +69,291 @@ class TestCmdHostAudit:
         output = json.loads(capsys.readouterr().out)
         assert output["failed"] > 0
 
+    def test_batch_observation_write_failure_marks_hosts_failed(
+        self, mocker, mock_args_audit: HostAuditArgs, tmp_dir
+    ):
+        """A database write failure fails the affected hosts but still returns the summary."""
+        mocker.patch("fleetroll.db.get_db_path", return_value=tmp_dir / "fleetroll.db")
+        mocker.patch("fleetroll.db.DB_WRITER_RETRY_DELAY_S", 0)
+        mocker.patch(
+            "fleetroll.db.insert_host_observation_rows",
+            side_effect=sqlite3.OperationalError("no such table: host_observations"),
+        )
+        mocker.patch(
+            "fleetroll.commands.gather_host.run_ssh",
+            return_value=(0, "OS_TYPE=Linux\nROLE_PRESENT=0\nOVERRIDE_PRESENT=0\n", ""),
+        )
+        mock_args_audit.quiet = True
+        hosts = ["host1.example.com", "host2.example.com"]
+
+        summary = cmd_host_audit_batch(hosts, mock_args_audit)
+
+        assert summary["total"] == 2
+        assert summary["successful"] == 0
+        assert summary["failed"] == 2
+        for r in summary["results"]:
+            assert r["ok"] is False
+            assert "no such table: host_observations" in r["error"]
+
+
+class TestExecuteAuditsParallel:
+    """Tests for bounded parallel audit submission."""
+
+    def test_bounded_in_flight_and_all_results(self, mocker, mock_args_audit: HostAuditArgs):
+        """Every host gets a result while at most workers*2 audits are queued."""
+        mock_args_audit.workers = 2
+        hosts = [f"host{i}" for i in range(25)]
+        state = {"in_flight": 0, "max_in_flight": 0}
+        lock = threading.Lock()
+        real_submit = ThreadPoolExecutor.submit
+
+        def audit(host, **_kwargs):
+            time.sleep(0.001)
+            if host == "host7":
+                raise RuntimeError("boom")
+            return {"host": host, "ok": True}
+
+        def tracking_submit(executor, fn, *args, **kwargs):
+            with lock:
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            future = real_submit(executor, fn, *args, **kwargs)
+
+            def done(_f):
+                with lock:
+                    state["in_flight"] -= 1
+
+            future.add_done_callback(done)
+            return future
+
+        mocker.patch(
+            "fleetroll.commands.gather_host.audit_single_host_with_retry", side_effect=audit
+        )
+        mocker.patch.object(ThreadPoolExecutor, "submit", tracking_submit)
+
+        results = execute_audits_parallel(
+            hosts,
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            overrides_dir=Path("/nonexistent"),
+            vault_checksums={},
+            vault_dir=Path("/nonexistent"),
+            show_progress=False,
+        )
+
+        assert sorted(r["host"] for r in results) == sorted(hosts)
+        failed = [r for r in results if not r["ok"]]
+        assert [(r["host"], r["error"]) for r in failed] == [("host7", "boom")]
+        assert state["max_in_flight"] <= 4
+
+    def test_progress_label_throttled(self, mocker, mock_args_audit: HostAuditArgs):
+        """Fast batches rebuild the label only at start and for the last host."""
+        mocker.patch(
+            "fleetroll.commands.gather_host.audit_single_host_with_retry",
+            side_effect=lambda host, **_kwargs: {"host": host, "ok": True},
+        )
+        label = mocker.patch(
+            "fleetroll.commands.gather_host.format_progress_label", return_value="label"
+        )
+
+        execute_audits_parallel(
+            [f"host{i}" for i in range(20)],
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            overrides_dir=Path("/nonexistent"),
+            vault_checksums={},
+            vault_dir=Path("/nonexistent"),
+            show_progress=True,
+        )
+
+        assert [c.args[0] for c in label.call_args_list] == [20, 0]
+
+    def test_single_host_skips_thread_pool(self, mocker, mock_args_audit: HostAuditArgs):
+        """One host is audited inline; errors still become failed results."""
+        mocker.patch(
+            "fleetroll.commands.gather_host.audit_single_host_with_retry",
+            side_effect=RuntimeError("boom"),
+        )
+        executor_cls = mocker.patch("fleetroll.commands.gather_host.ThreadPoolExecutor")
+
+        results = execute_audits_parallel(
+            ["host1"],
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            overrides_dir=Path("/nonexistent"),
+            vault_checksums={},
+            vault_dir=Path("/nonexistent"),
+            show_progress=True,
+        )
+
+        executor_cls.assert_not_called()
+        assert [(r["host"], r["ok"], r["error"]) for r in results] == [("host1", False, "boom")]
+
+    def test_workers_capped_at_host_count(self, mocker, mock_args_audit: HostAuditArgs):
+        """Small batches do not start more threads than hosts; threads are named."""
+        mock_args_audit.workers = 32
+        thread_names = set()
+
+        def audit(host, **_kwargs):
+            thread_names.add(threading.current_thread().name)
+            return {"host": host, "ok": True}
+
+        mocker.patch(
+            "fleetroll.commands.gather_host.audit_single_host_with_retry", side_effect=audit
+        )
+        executor_cls = mocker.patch(
+            "fleetroll.commands.gather_host.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        )
+
+        results = execute_audits_parallel(
+            ["host1", "host2"],
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            overrides_dir=Path("/nonexistent"),
+            vault_checksums={},
+            vault_dir=Path("/nonexistent"),
+            show_progress=False,
+        )
+
+        assert len(results) == 2
+        assert executor_cls.call_args.kwargs["max_workers"] == 2
+        assert all(name.startswith("fleetroll-audit") for name in thread_names)
+
+
+class TestInlineVaultContent:
+    """Tests for vault.yaml shipped inline with the audit output."""
+
+    VAULT = b"secret: value\n"
+
+    def _out(self, vault: bytes | None = None, *, override: str = "") -> str:
+        sha = hashlib.sha256(self.VAULT).hexdigest()
+        out = f"OS_TYPE=Linux\nVLT_PRESENT=1\nVLT_SHA256={sha}\n"
+        if vault is not None:
+            out += f"{VAULT_CONTENT_KEY}={base64.b64encode(vault).decode()}\n"
+        out += "ROLE_PRESENT=0\nOVERRIDE_PRESENT=0\n"
+        if override:
+            out += f"{CONTENT_SENTINEL}\n{override}"
+        return out
+
+    def test_select_known_vault_shas(self, tmp_dir: Path):
+        """Only stored shas are returned, most widely deployed first."""
+        other = b"other: value\n"
+        sha = hashlib.sha256(self.VAULT).hexdigest()
+        other_sha = hashlib.sha256(other).hexdigest()
+        store_content_file(self.VAULT, sha, tmp_dir)
+        store_content_file(other, other_sha, tmp_dir)
+        checksums = {"h1": other_sha, "h2": sha, "h3": sha, "h4": "f" * 64}
+        assert select_known_vault_shas(checksums, tmp_dir) == (sha, other_sha)
+
+    def test_split_removes_line_and_decodes(self):
+        out, content = split_vault_content(self._out(self.VAULT))
+        assert content == self.VAULT
+        assert out == self._out()
+
+    def test_split_without_line(self):
+        out = self._out(override=f"\n{VAULT_CONTENT_KEY}=c3Bvb2Y=\n")
+        assert split_vault_content(out) == (out, None)
+
+    def test_split_invalid_base64(self):
+        out = f"OS_TYPE=Linux\n{VAULT_CONTENT_KEY}=!!!\n"
+        assert split_vault_content(out) == (out, None)
+
+    def test_inline_vault_stored_without_second_ssh(
+        self, mocker, tmp_dir: Path, mock_args_audit: HostAuditArgs
+    ):
+        """A host with an unknown vault is audited and fetched in one SSH session."""
+        mock_run_ssh = mocker.patch("fleetroll.commands.gather_host.run_ssh")
+        mock_run_ssh.return_value = (0, self._out(self.VAULT), "")
+        vault_dir = tmp_dir / "vault_yamls"
+
+        result = audit_single_host_with_retry(
+            "test.example.com",
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            vault_checksums={},
+            vault_dir=vault_dir,
+        )
+
+        assert mock_run_ssh.call_count == 1
+        assert mock_run_ssh.call_args[0][1] == remote_audit_script(
+            include_content=False, include_vault_content=True
+        )
+        stored = Path(result["observed"]["vault_file_path"])
+        assert stored.parent == vault_dir
+        assert stored.read_bytes() == self.VAULT
+
+    def test_inline_vault_with_mismatched_sha_not_stored(
+        self, mocker, tmp_dir: Path, mock_args_audit: HostAuditArgs
+    ):
+        """Inline content that does not hash to VLT_SHA256 is not filed under that sha."""
+        mock_run_ssh = mocker.patch("fleetroll.commands.gather_host.run_ssh")
+        mock_run_ssh.return_value = (0, self._out(b"secret: changed\n"), "")
+        vault_dir = tmp_dir / "vault_yamls"
+
+        result = audit_single_host_with_retry(
+            "test.example.com",
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            vault_checksums={},
+            vault_dir=vault_dir,
+        )
+
+        sha = hashlib.sha256(self.VAULT).hexdigest()
+        assert mock_run_ssh.call_count == 1
+        assert not has_content_file(sha, vault_dir)
+        assert "vault_file_path" not in result["observed"]
+        assert "sha256 mismatch" in result["observed"]["vault_fetch_error"]
+
+    def test_known_vault_not_requested_inline(
+        self, mocker, tmp_dir: Path, mock_args_audit: HostAuditArgs
+    ):
+        """Hosts whose last seen vault is already stored use the plain audit script."""
+        vault_dir = tmp_dir / "vault_yamls"
+        sha = hashlib.sha256(self.VAULT).hexdigest()
+        store_content_file(self.VAULT, sha, vault_dir)
+        mock_run_ssh = mocker.patch("fleetroll.commands.gather_host.run_ssh")
+        mock_run_ssh.return_value = (0, self._out(), "")
+
+        result = audit_single_host_with_retry(
+            "test.example.com",
+            args=mock_args_audit,
+            ssh_opts=[],
+            include_content=False,
+            writer=mocker.MagicMock(),
+            actor="tester",
+            deadline=time.monotonic() + 60,
+            vault_checksums={"test.example.com": sha},
+            vault_dir=vault_dir,
+        )
+
+        assert mock_run_ssh.call_count == 1
+        assert mock_run_ssh.call_args[0][1] == remote_audit_script(include_content=False)
+        assert "vault_file_path" not in result["observed"]
+
 
 class TestAggregateAuditSummary:
     """Tests for aggregate_audit_summary helper function."""
@@ -116,6 +416,28 @@ class TestAggregateAuditSummary:
         assert summary["unique_overrides"]["abc123"][1] == ["host1", "host2"]
         assert summary["unique_overrides"]["def456"][1] == ["host3"]
 
+    def test_shares_one_copy_of_duplicate_contents(self):
+        """Hosts with the same override sha end up referencing one content string."""
+        contents = ["".join(["line\n"] * 100) for _ in range(3)]
+        assert contents[0] is not contents[1]
+        results = [
+            {
+                "host": f"host{i}",
+                "ok": True,
+                "observed": {
+                    "override_present": True,
+                    "override_sha256": "abc123",
+                    "override_contents_for_display": content,
+                },
+            }
+            for i, content in enumerate(contents)
+        ]
+
+        summary = aggregate_audit_summary(results, [r["host"] for r in results])
+
+        shared = summary["unique_overrides"]["abc123"][0]
+        assert all(r["observed"]["override_contents_for_display"] is shared for r in results)
+
     def test_ignores_results_without_overrides(self):
         """Should not include results without overrides."""
         hosts = ["host1", "host2"]
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 from fleetroll.cli_types import VaultShowArgs
-from fleetroll.commands.vault import cmd_vault_show, resolve_vault_humanhash
+from fleetroll.commands.vault import cmd_vault_show, resolve_vault_humanhash, resolve_vault_path
 from fleetroll.exceptions import UserError
 from fleetroll.humanhash import humanize
 from fleetroll.utils import sha256_hex
@@ -46,3 +46,11 @@ def test_vault_show_humanhash_ambiguous(tmp_dir: Path, monkeypatch) -> None:
         resolve_vault_humanhash("same-hash", vault_dir=vault_dir)
 
     assert "Ambiguous human-hash" in str(excinfo.value)
+
+
+def test_resolve_vault_path_by_prefix_skips_symlinks(tmp_dir: Path) -> None:
+    vault_dir = tmp_dir / "vault_yamls"
+    sha = _write_vault(vault_dir, "vault: hello\n")
+    (vault_dir / (sha[:8] + "-link")).symlink_to(vault_dir / sha[:12])
+
+    assert resolve_vault_path(sha[:8], vault_dir=vault_dir) == vault_dir / sha[:12]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -55,6 +56,25 @@ def test_init_db_creates_tables(temp_db):
         conn.close()
 
 
+def test_init_db_replaces_unkeyed_vault_checksums(tmp_path):
+    """A vault_checksums table without log_path is dropped and recreated per log."""
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE vault_checksums (host TEXT PRIMARY KEY, sha256 TEXT, ts TEXT)")
+    conn.execute("INSERT INTO vault_checksums VALUES ('host1', 'aaa', 'ts')")
+    conn.commit()
+    conn.close()
+
+    init_db(db_path)
+    conn = get_connection(db_path)
+    try:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(vault_checksums)")]
+        assert columns == ["log_path", "host", "sha256", "ts"]
+        assert conn.execute("SELECT COUNT(*) FROM vault_checksums").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
 def test_init_db_enables_wal_mode(temp_db):
     """Test WAL mode is enabled."""
     conn = get_connection(temp_db)
@@ -448,6 +468,37 @@ def test_get_latest_host_observations_with_failures(temp_db):
         conn.close()
 
 
+def test_get_latest_host_observations_mixed_hosts(temp_db):
+    """Only hosts whose latest record failed fall back to an older ok=1 record."""
+    conn = get_connection(temp_db)
+    try:
+        records = [
+            ("ok.example.com", "2024-01-01T12:00:00+00:00", 0),
+            ("ok.example.com", "2024-01-01T12:05:00+00:00", 1),
+            ("recovering.example.com", "2024-01-01T12:00:00+00:00", 1),
+            ("recovering.example.com", "2024-01-01T12:05:00+00:00", 0),
+            ("never-ok.example.com", "2024-01-01T12:05:00+00:00", 0),
+        ]
+        for host, ts, ok in records:
+            insert_host_observation(conn, {"host": host, "ts": ts, "ok": ok})
+        conn.commit()
+
+        hosts = [
+            "ok.example.com",
+            "recovering.example.com",
+            "never-ok.example.com",
+            "missing.example.com",
+        ]
+        latest, latest_ok = get_latest_host_observations(conn, hosts)
+
+        assert set(latest) == set(hosts[:3])
+        assert set(latest_ok) == {"ok.example.com", "recovering.example.com"}
+        assert latest_ok["ok.example.com"]["ts"] == "2024-01-01T12:05:00+00:00"
+        assert latest_ok["recovering.example.com"]["ts"] == "2024-01-01T12:00:00+00:00"
+    finally:
+        conn.close()
+
+
 def test_get_latest_tc_workers_empty(temp_db):
     """Test getting TC workers from empty database."""
     conn = get_connection(temp_db)
@@ -649,3 +700,245 @@ def test_get_observations_since_empty_hosts_list(temp_db):
         assert result == []
     finally:
         conn.close()
+
+
+def test_observation_writer_flushes_on_close(temp_db):
+    """ObservationWriter commits every queued record by the time close() returns."""
+    from fleetroll.db import ObservationWriter
+
+    with ObservationWriter(temp_db, batch_size=3) as writer:
+        for i in range(7):
+            writer.enqueue({"host": f"host{i}.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+
+    conn = get_connection(temp_db)
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM host_observations").fetchone()[0]
+        assert count == 7
+    finally:
+        conn.close()
+
+
+def test_observation_writer_applies_retention(temp_db):
+    """ObservationWriter keeps the per-host retention policy."""
+    from fleetroll.db import ObservationWriter
+
+    host = "host1.example.com"
+    with ObservationWriter(temp_db, retention_limit=3) as writer:
+        for i in range(6):
+            writer.enqueue({"host": host, "ts": f"2024-01-01T12:{i:02d}:00Z", "ok": 1})
+
+    conn = get_connection(temp_db)
+    try:
+        count = conn.execute(
+            "SELECT COUNT(*) FROM host_observations WHERE host = ?", (host,)
+        ).fetchone()[0]
+        assert count == 3
+    finally:
+        conn.close()
+
+
+def test_observation_writer_reraises_write_error_on_close(tmp_path):
+    """A failed batch is surfaced from close() and the writer stays drainable."""
+    from fleetroll.db import ObservationWriter
+
+    writer = ObservationWriter(tmp_path / "uninitialized.db")  # no tables
+    writer.enqueue({"host": "host1.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+    writer.enqueue({"host": "host2.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+    with pytest.raises(sqlite3.OperationalError):
+        writer.close()
+
+
+def _fail_batches_with_host(monkeypatch, bad_host, *, times=None):
+    """Make the writer's inserts fail for batches containing bad_host."""
+    import fleetroll.db as db_module
+
+    real_insert = db_module.insert_host_observation_rows
+    failures = []
+
+    def flaky_insert(conn, rows, **kwargs):
+        if any(row[0] == bad_host for row in rows) and (times is None or len(failures) < times):
+            failures.append(bad_host)
+            raise sqlite3.OperationalError("database is locked")
+        return real_insert(conn, rows, **kwargs)
+
+    monkeypatch.setattr(db_module, "insert_host_observation_rows", flaky_insert)
+    monkeypatch.setattr(db_module, "DB_WRITER_RETRY_DELAY_S", 0)
+    return failures
+
+
+def _stored_hosts(db_path):
+    conn = get_connection(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT host FROM host_observations")}
+    finally:
+        conn.close()
+
+
+def test_observation_writer_keeps_writing_after_failed_batch(temp_db, monkeypatch):
+    """A batch that keeps failing is dropped, but later batches are still persisted."""
+    from fleetroll.db import ObservationWriter
+
+    _fail_batches_with_host(monkeypatch, "bad.example.com")
+    hosts = ["host1.example.com", "bad.example.com", "host2.example.com", "host3.example.com"]
+    writer = ObservationWriter(temp_db, batch_size=1)
+    for host in hosts:
+        writer.enqueue({"host": host, "ts": "2024-01-01T10:00:00Z", "ok": 1})
+    with pytest.raises(sqlite3.OperationalError):
+        writer.close()
+
+    assert writer.dropped_hosts == ["bad.example.com"]
+    assert _stored_hosts(temp_db) == {"host1.example.com", "host2.example.com", "host3.example.com"}
+
+
+def test_observation_writer_retries_transient_failure(temp_db, monkeypatch):
+    """A batch that fails once is retried and written without surfacing an error."""
+    from fleetroll.db import ObservationWriter
+
+    failures = _fail_batches_with_host(monkeypatch, "host1.example.com", times=1)
+    with ObservationWriter(temp_db) as writer:
+        writer.enqueue({"host": "host1.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+
+    assert failures == ["host1.example.com"]
+    assert writer.dropped_hosts == []
+    assert _stored_hosts(temp_db) == {"host1.example.com"}
+
+
+def test_observation_writer_does_not_mask_inflight_exception(temp_db, monkeypatch):
+    """A write error is not raised over an exception already leaving the with block."""
+    from fleetroll.db import ObservationWriter
+
+    _fail_batches_with_host(monkeypatch, "bad.example.com")
+    writer = ObservationWriter(temp_db)
+
+    def audit() -> None:
+        with writer:
+            writer.enqueue({"host": "bad.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+            raise ValueError("audit failed")
+
+    with pytest.raises(ValueError, match="audit failed"):
+        audit()
+    assert writer.dropped_hosts == ["bad.example.com"]
+
+
+def test_observation_writer_snapshots_record_on_enqueue(temp_db):
+    """Mutating a record after enqueue does not change what is persisted."""
+    from fleetroll.db import ObservationWriter
+
+    record = {"host": "host1.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1, "observed": {}}
+    with ObservationWriter(temp_db) as writer:
+        writer.enqueue(record)
+        record["observed"]["added_later"] = True
+        with pytest.raises(KeyError):
+            writer.enqueue({"ts": "2024-01-01T10:00:00Z", "ok": 1})  # missing host
+
+    conn = get_connection(temp_db)
+    try:
+        latest, _ = get_latest_host_observations(conn, ["host1.example.com"])
+        assert latest["host1.example.com"]["observed"] == {}
+    finally:
+        conn.close()
+
+
+def test_observation_writer_rejects_enqueue_after_close(temp_db):
+    """Enqueueing on a closed writer raises RuntimeError."""
+    from fleetroll.db import ObservationWriter
+
+    writer = ObservationWriter(temp_db)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.enqueue({"host": "host1.example.com", "ts": "2024-01-01T10:00:00Z", "ok": 1})
+
+
+def test_insert_host_observations_batch_upserts_and_applies_retention(temp_db):
+    """Multi-row insert upserts duplicate keys and trims each host once."""
+    from fleetroll.db import insert_host_observations
+
+    conn = get_connection(temp_db)
+    try:
+        records = [
+            {"host": "host1.example.com", "ts": f"2024-01-01T12:{i:02d}:00Z", "ok": 1}
+            for i in range(5)
+        ]
+        records.append({"host": "host2.example.com", "ts": "2024-01-01T12:00:00Z", "ok": 1})
+        # Same (host, ts) as an earlier row: later row wins
+        records.append({"host": "host2.example.com", "ts": "2024-01-01T12:00:00Z", "ok": 0})
+        insert_host_observations(conn, records, retention_limit=3)
+        conn.commit()
+
+        count1 = conn.execute(
+            "SELECT COUNT(*) FROM host_observations WHERE host = ?", ("host1.example.com",)
+        ).fetchone()[0]
+        assert count1 == 3
+        row = conn.execute(
+            "SELECT ok FROM host_observations WHERE host = ?", ("host2.example.com",)
+        ).fetchall()
+        assert [r["ok"] for r in row] == [0]
+    finally:
+        conn.close()
+
+
+def test_insert_host_observations_chunks_to_variable_limit(temp_db):
+    """Batches larger than the bound-variable limit are split across statements."""
+    from fleetroll.db import insert_host_observations
+
+    conn = get_connection(temp_db)
+    try:
+        conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 8)  # two rows per statement
+        records = [
+            {"host": f"host{i}.example.com", "ts": "2024-01-01T12:00:00Z", "ok": 1}
+            for i in range(5)
+        ]
+        insert_host_observations(conn, records)
+        conn.commit()
+
+        count = conn.execute("SELECT COUNT(*) FROM host_observations").fetchone()[0]
+        assert count == 5
+    finally:
+        conn.close()
+
+
+def test_insert_host_observations_single_record_uses_single_row_upsert(temp_db, monkeypatch):
+    """A one-record batch skips the multi-row statement but still upserts and trims."""
+    import fleetroll.db as db_module
+
+    def no_multi_row(nrows):
+        raise AssertionError(f"multi-row statement built for {nrows} row(s)")
+
+    monkeypatch.setattr(db_module, "_host_observations_insert_sql", no_multi_row)
+    conn = get_connection(temp_db)
+    try:
+        for i in range(3):
+            record = {"host": "host1.example.com", "ts": f"2024-01-01T12:0{i}:00Z", "ok": 0}
+            db_module.insert_host_observations(conn, [record], retention_limit=2)
+        # Same (host, ts) as the latest row: the upsert replaces it
+        record = {"host": "host1.example.com", "ts": "2024-01-01T12:02:00Z", "ok": 1}
+        db_module.insert_host_observations(conn, [record], retention_limit=2)
+        conn.commit()
+
+        rows = conn.execute(
+            "SELECT ts, ok FROM host_observations WHERE host = ? ORDER BY ts",
+            ("host1.example.com",),
+        ).fetchall()
+        assert [(r["ts"], r["ok"]) for r in rows] == [
+            ("2024-01-01T12:01:00Z", 0),
+            ("2024-01-01T12:02:00Z", 1),
+        ]
+    finally:
+        conn.close()
+
+
+def test_observation_writer_enqueue_row(temp_db):
+    """Pre-built rows in HOST_OBSERVATION_COLUMNS order are written as-is."""
+    from fleetroll.db import HOST_OBSERVATION_COLUMNS, ObservationWriter
+
+    assert HOST_OBSERVATION_COLUMNS == ("host", "ts", "ok", "data")
+    data = '{"host": "host1.example.com", "ts": "2024-01-01T10:00:00Z", "ok": true}'
+    with ObservationWriter(temp_db) as writer:
+        writer.enqueue_row(("host1.example.com", "2024-01-01T10:00:00Z", True, data))
+
+    conn = get_connection(temp_db)
+    try:
+        row = conn.execute("SELECT host, ok, data FROM host_observations").fetchone()
+        assert (row["host"], row["ok"], row["data"]) == ("host1.example.com", 1, data)
+    finally:
+        conn.close()
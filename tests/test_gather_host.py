@@ -7,15 +7,19 @@ import json
 from pathlib import Path
 
 from fleetroll.audit import (
+    _iso_to_epoch,
     _normalize_na,
     append_jsonl,
+    has_content_file,
     iter_audit_records,
+    load_latest_vault_checksums,
     process_audit_result,
     store_override_file,
 )
 from fleetroll.cli_types import HostAuditArgs
 from fleetroll.constants import CONTENT_SENTINEL
 from fleetroll.db import get_latest_host_observations
+from fleetroll.utils import sha256_hex
 
 
 def _make_pp_state_json_line(**overrides) -> str:
@@ -86,27 +90,37 @@ class TestAppendJsonl:
         content = path.read_text()
         assert content.endswith("\n")
 
+    def test_stdlib_fallback_without_orjson(self, tmp_dir: Path, mocker):
+        """Falls back to stdlib json when orjson is unavailable."""
+        mocker.patch("fleetroll.audit.orjson", None)
+        path = tmp_dir / "test.jsonl"
+        append_jsonl(path, {"z": 1, "a": "é"})
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {"a": "é", "z": 1}
+        assert lines[0].index('"a"') < lines[0].index('"z"')
+
 
 class TestStoreOverrideFile:
     """Tests for store_override_file function."""
 
     def test_stores_new_file(self, tmp_dir: Path):
         """Stores content in new file named by SHA prefix."""
-        content = "test content"
+        content = b"test content"
         sha = "a" * 64  # Fake SHA
         result = store_override_file(content, sha, tmp_dir)
         assert result.exists()
-        assert result.read_text() == content
+        assert result.read_bytes() == content
 
     def test_filename_is_sha_prefix(self, tmp_dir: Path):
         """Filename is SHA256 prefix (12 chars by default)."""
         sha = "testsha_pref_xy" + "z" * 48
-        path = store_override_file("content", sha, tmp_dir)
+        path = store_override_file(b"content", sha, tmp_dir)
         assert path.name == "testsha_pref"
 
     def test_returns_existing_if_same_content(self, tmp_dir: Path):
         """Returns existing file path if content matches (idempotent)."""
-        content = "test content"
+        content = b"test content"
         sha = "b" * 64
         path1 = store_override_file(content, sha, tmp_dir)
         path2 = store_override_file(content, sha, tmp_dir)
@@ -117,8 +131,8 @@ class TestStoreOverrideFile:
         # Create two files with same 12-char prefix but different content
         sha1 = "a" * 12 + "1" * 52
         sha2 = "a" * 12 + "2" * 52
-        path1 = store_override_file("content1", sha1, tmp_dir)
-        path2 = store_override_file("content2", sha2, tmp_dir)
+        path1 = store_override_file(b"content1", sha1, tmp_dir)
+        path2 = store_override_file(b"content2", sha2, tmp_dir)
         # Second file should have longer name due to collision
         assert len(path2.name) > len(path1.name)
         # Both files should exist with correct content
@@ -129,17 +143,63 @@ class TestStoreOverrideFile:
         """Creates overrides directory if it doesn't exist."""
         overrides_dir = tmp_dir / "overrides"
         sha = "c" * 64
-        path = store_override_file("content", sha, overrides_dir)
+        path = store_override_file(b"content", sha, overrides_dir)
         assert overrides_dir.exists()
         assert path.exists()
 
     def test_handles_empty_content(self, tmp_dir: Path):
         """Handles empty string content."""
         sha = "d" * 64
-        path = store_override_file("", sha, tmp_dir)
+        path = store_override_file(b"", sha, tmp_dir)
         assert path.exists()
         assert path.read_text() == ""
 
+    def test_idempotent_for_non_ascii_content(self, tmp_dir: Path):
+        """Re-storing identical non-ASCII content reuses the existing file."""
+        content = "clé: välue ✓\n".encode()
+        sha = sha256_hex(content)
+        path1 = store_override_file(content, sha, tmp_dir)
+        path2 = store_override_file(content, sha, tmp_dir)
+        assert path1 == path2
+        assert path1.read_bytes() == content
+        assert len(list(tmp_dir.iterdir())) == 1
+
+    def test_atomic_write_leaves_no_temp_files(self, tmp_dir: Path):
+        """Stored files are private and no temp files are left behind."""
+        sha = sha256_hex(b"secret: value\n")
+        path = store_override_file(b"secret: value\n", sha, tmp_dir)
+        assert [p.name for p in tmp_dir.iterdir()] == [path.name]
+        assert path.stat().st_mode & 0o777 == 0o600
+
+
+class TestHasContentFile:
+    """Tests for has_content_file function."""
+
+    def test_finds_stored_content(self, tmp_dir: Path):
+        """Finds content stored under its SHA prefix."""
+        sha = sha256_hex(b"vault: data\n")
+        store_override_file(b"vault: data\n", sha, tmp_dir)
+        assert has_content_file(sha, tmp_dir) is True
+
+    def test_missing_dir_or_file(self, tmp_dir: Path):
+        """Returns False when the directory or candidate file is missing."""
+        sha = sha256_hex(b"absent")
+        assert has_content_file(sha, tmp_dir / "nope") is False
+        assert has_content_file(sha, tmp_dir) is False
+
+    def test_follows_collision_chain(self, tmp_dir: Path):
+        """Finds content stored at an extended prefix after a collision."""
+        sha = sha256_hex(b"real content")
+        (tmp_dir / sha[:12]).write_text("different content")
+        (tmp_dir / sha[:16]).write_text("real content")
+        assert has_content_file(sha, tmp_dir) is True
+
+    def test_rejects_prefix_match_with_wrong_content(self, tmp_dir: Path):
+        """A file named by the prefix but holding other content does not match."""
+        sha = sha256_hex(b"real content")
+        (tmp_dir / sha[:12]).write_text("different content")
+        assert has_content_file(sha, tmp_dir) is False
+
 
 class TestProcessAuditResult:
     """Tests for process_audit_result function."""
@@ -650,6 +710,38 @@ PP_SUCCESS=1
         assert result["observed"]["puppet_state_ts"] is None
         assert result["observed"]["puppet_git_sha"] is None
 
+    def test_enqueues_on_writer_without_display_content(self, temp_db: Path):
+        """With a writer, the log record is queued and excludes display-only content."""
+        from fleetroll.db import ObservationWriter
+
+        out = f"""ROLE_PRESENT=1
+ROLE=test-role
+OVERRIDE_PRESENT=1
+{CONTENT_SENTINEL}
+key=value
+"""
+        with ObservationWriter(temp_db) as writer:
+            result = process_audit_result(
+                "test.example.com",
+                rc=0,
+                out=out,
+                err="",
+                actor="test-actor",
+                writer=writer,
+            )
+        assert result["observed"]["override_contents_for_display"] == "key=value\n"
+
+        from fleetroll.db import get_connection
+
+        conn = get_connection(temp_db)
+        try:
+            latest, _ = get_latest_host_observations(conn, ["test.example.com"])
+        finally:
+            conn.close()
+        stored = latest["test.example.com"]
+        assert stored["observed"]["override_sha256"] == result["observed"]["override_sha256"]
+        assert "override_contents_for_display" not in stored["observed"]
+
 
 class TestProcessAuditResultJsonPath:
     """Tests for JSON state parsing (base64-encoded PP_STATE_JSON)."""
@@ -853,6 +945,27 @@ VLT_PRESENT=0
         assert obs["puppet_vault_sha_applied"] is None
 
 
+class TestIsoToEpoch:
+    """Tests for _iso_to_epoch helper."""
+
+    def test_parses_offset_timestamp(self):
+        assert _iso_to_epoch("2024-01-25T00:00:00+00:00") == 1706140800
+
+    def test_invalid_returns_none(self):
+        assert _iso_to_epoch("not a timestamp") is None
+
+    def test_non_string_ts_in_json_state_is_ignored(self, db_conn):
+        """A non-string ts in PP_STATE_JSON leaves the epoch unset instead of raising."""
+        out = f"""ROLE_PRESENT=0
+OVERRIDE_PRESENT=0
+{_make_pp_state_json_line(ts=12345)}
+"""
+        result = process_audit_result(
+            "test.example.com", rc=0, out=out, err="", db_conn=db_conn, actor="test-actor"
+        )
+        assert result["observed"]["puppet_last_run_epoch"] is None
+
+
 class TestNormalizeNa:
     """Tests for _normalize_na helper."""
 
@@ -900,6 +1013,24 @@ PP_STATE_JSON={bad_b64}
         assert result["observed"]["puppet_git_sha"] is None
         assert result["observed"]["puppet_success"] is None
 
+    def test_json_state_invalid_utf8_graceful(self, db_conn):
+        """Valid base64 of non-UTF-8 bytes results in all puppet fields being None."""
+        bad_b64 = base64.b64encode(b'{"ts": "\xff"}').decode("utf-8")
+        out = f"""ROLE_PRESENT=0
+OVERRIDE_PRESENT=0
+PP_STATE_JSON={bad_b64}
+"""
+        result = process_audit_result(
+            "test.example.com",
+            rc=0,
+            out=out,
+            err="",
+            db_conn=db_conn,
+            actor="test-actor",
+        )
+        assert result["observed"]["puppet_state_ts"] is None
+        assert result["observed"]["puppet_success"] is None
+
     def test_json_state_invalid_ts_no_epoch(
         self, tmp_dir: Path, mock_args_audit: HostAuditArgs, db_conn
     ):
@@ -1168,6 +1299,132 @@ class TestIterAuditRecords:
         assert records[1]["key2"] == "value2"
         assert records[2]["key3"] == "value3"
 
+    def test_skips_invalid_utf8_lines(self, tmp_dir: Path):
+        """Lines that are not valid UTF-8 are skipped like invalid JSON."""
+        path = tmp_dir / "test.jsonl"
+        path.write_bytes(b'{"valid": 1}\n{"bad": "\xff"}\n{"also_valid": 2}\n')
+
+        records = list(iter_audit_records(path))
+        assert records == [{"valid": 1}, {"also_valid": 2}]
+
+    def test_stdlib_fallback_without_orjson(self, tmp_dir: Path, mocker):
+        """Parses with stdlib json when orjson is unavailable."""
+        mocker.patch("fleetroll.audit.orjson", None)
+        path = tmp_dir / "test.jsonl"
+        path.write_text('{"valid": "\u00e9"}\nnot json\n', encoding="utf-8")
+
+        assert list(iter_audit_records(path)) == [{"valid": "é"}]
+
+
+class TestLoadLatestVaultChecksums:
+    """Tests for load_latest_vault_checksums function."""
+
+    def _set_vault(self, path: Path, host: str, sha: str, *, ok: bool = True) -> None:
+        append_jsonl(
+            path,
+            {
+                "action": "host.set_vault",
+                "host": host,
+                "ok": ok,
+                "ts": "2024-01-01T00:00:00+00:00",
+                "parameters": {"sha256": sha},
+            },
+        )
+
+    def test_scans_log_for_latest_successful_sha(self, tmp_dir: Path):
+        """Without a connection, the latest ok sha per host comes from the log."""
+        path = tmp_dir / "audit.jsonl"
+        self._set_vault(path, "host1", "aaa")
+        self._set_vault(path, "host1", "bbb")
+        self._set_vault(path, "host1", "ccc", ok=False)
+        self._set_vault(path, "host2", "ddd")
+
+        assert load_latest_vault_checksums(path) == {"host1": "bbb", "host2": "ddd"}
+
+    def test_seeds_table_then_indexes_only_appended_records(
+        self, tmp_dir: Path, db_conn, monkeypatch
+    ):
+        """The first load indexes the whole log; later loads scan only new bytes."""
+        from fleetroll.audit import _scan_vault_checksums
+        from fleetroll.db import get_vault_checksums
+
+        path = tmp_dir / "audit.jsonl"
+        self._set_vault(path, "host1", "aaa")
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "aaa"}
+        assert get_vault_checksums(db_conn, path) == {"host1": "aaa"}
+
+        starts = []
+
+        def tracking_scan(scan_path, *, start=0):
+            starts.append(start)
+            return _scan_vault_checksums(scan_path, start=start)
+
+        monkeypatch.setattr("fleetroll.audit._scan_vault_checksums", tracking_scan)
+        indexed_size = path.stat().st_size
+        self._set_vault(path, "host1", "bbb")
+        self._set_vault(path, "host2", "ccc")
+
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "bbb", "host2": "ccc"}
+        assert starts == [indexed_size]
+
+    def test_rebuilds_when_log_is_replaced(self, tmp_dir: Path, db_conn):
+        """A rotated-away log (new file at the same path) is reindexed from scratch."""
+        path = tmp_dir / "audit.jsonl"
+        self._set_vault(path, "host1", "aaa")
+        self._set_vault(path, "host2", "bbb")
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "aaa", "host2": "bbb"}
+
+        path.replace(tmp_dir / "audit.jsonl.1")
+        self._set_vault(path, "host1", "ccc")
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "ccc"}
+
+    def test_audit_logs_are_indexed_separately(self, tmp_dir: Path, db_conn):
+        """Two audit logs sharing one database each see only their own checksums."""
+        from fleetroll.db import update_vault_checksum
+
+        log_a = tmp_dir / "a.jsonl"
+        log_b = tmp_dir / "b.jsonl"
+        self._set_vault(log_a, "host1", "aaa")
+        self._set_vault(log_b, "host1", "bbb")
+        self._set_vault(log_b, "host2", "ccc")
+
+        assert load_latest_vault_checksums(log_a, conn=db_conn) == {"host1": "aaa"}
+        assert load_latest_vault_checksums(log_b, conn=db_conn) == {"host1": "bbb", "host2": "ccc"}
+
+        # A write mirrored into one log's rows does not leak into the other's
+        update_vault_checksum(db_conn, log_a, "host3", "ddd", "2024-01-02T00:00:00+00:00")
+        db_conn.commit()
+        assert load_latest_vault_checksums(log_b, conn=db_conn) == {"host1": "bbb", "host2": "ccc"}
+        assert load_latest_vault_checksums(log_a, conn=db_conn) == {"host1": "aaa", "host3": "ddd"}
+
+    def test_ignores_partial_trailing_line(self, tmp_dir: Path, db_conn):
+        """A record still being written is indexed once its line is complete."""
+        path = tmp_dir / "audit.jsonl"
+        self._set_vault(path, "host1", "aaa")
+        line = (
+            '{"action": "host.set_vault", "host": "host2", "ok": true, '
+            '"ts": "2024-01-01T00:00:00+00:00", "parameters": {"sha256": "bbb"}}'
+        )
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line[:20])
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "aaa"}
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line[20:] + "\n")
+        assert load_latest_vault_checksums(path, conn=db_conn) == {"host1": "aaa", "host2": "bbb"}
+
+    def test_falls_back_to_scan_without_table(self, tmp_dir: Path):
+        """A database lacking the table falls back to scanning the log."""
+        import sqlite3
+
+        path = tmp_dir / "audit.jsonl"
+        self._set_vault(path, "host1", "aaa")
+        conn = sqlite3.connect(tmp_dir / "empty.db")
+        try:
+            assert load_latest_vault_checksums(path, conn=conn) == {"host1": "aaa"}
+        finally:
+            conn.close()
+
 
 class TestJsonlRoundTrip:
     """Tests for JSONL write/read round-trip."""
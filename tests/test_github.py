@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import Mock, patch
 
 from fleetroll.github import (
@@ -601,3 +602,59 @@ class TestDoGithubFetch:
         out = capsys.readouterr().out
         assert "0 unique repo" in out
         mock_fetch.assert_not_called()
+
+    @patch("fleetroll.github.fetch_windows_pool_hashes", return_value={})
+    @patch("fleetroll.github.collect_repo_branches")
+    @patch("fleetroll.github.fetch_branch_shas")
+    def test_repos_fetched_concurrently(self, mock_fetch, mock_collect, mock_pools, tmp_path):
+        """Repo requests overlap instead of running one after another."""
+        db_path = self._make_db(tmp_path)
+        mock_collect.return_value = {("o", "a"): {"main"}, ("o", "b"): {"main"}}
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(owner, repo, *, github_token=None):
+            barrier.wait()  # Both requests must be in flight at once
+            return [{"ref": "main", "sha": f"sha_{repo}"}]
+
+        mock_fetch.side_effect = fetch
+
+        with patch("fleetroll.db.get_db_path", return_value=db_path):
+            do_github_fetch(quiet=True)
+
+        from fleetroll.db import get_connection
+
+        conn = get_connection(db_path)
+        rows = conn.execute("SELECT repo, sha FROM github_refs ORDER BY repo").fetchall()
+        conn.close()
+        assert [(r["repo"], r["sha"]) for r in rows] == [("a", "sha_a"), ("b", "sha_b")]
+
+    @patch("fleetroll.github.fetch_windows_pool_hashes", return_value={})
+    @patch("fleetroll.github.collect_repo_branches")
+    @patch("fleetroll.github.fetch_branch_shas")
+    def test_progress_announced_before_fetches_and_reported_after(
+        self, mock_fetch, mock_collect, mock_pools, tmp_path
+    ):
+        """The "Fetching" line precedes the requests; each repo is reported once it is done."""
+        db_path = self._make_db(tmp_path)
+        mock_collect.return_value = {("o", "a"): {"main"}, ("o", "b"): {"main"}}
+        events: list[str] = []
+
+        def fetch(owner, repo, *, github_token=None):
+            events.append(f"request {owner}/{repo}")
+            return [{"ref": "main", "sha": f"sha_{repo}"}]
+
+        mock_fetch.side_effect = fetch
+
+        with (
+            patch("fleetroll.db.get_db_path", return_value=db_path),
+            patch(
+                "click.echo",
+                side_effect=lambda message="", **kwargs: events.append(str(message)),
+            ),
+        ):
+            do_github_fetch(quiet=False)
+
+        announce = next(i for i, e in enumerate(events) if e.startswith("Fetching 2 repo(s)"))
+        for repo in ("a", "b"):
+            assert announce < events.index(f"request o/{repo}") < events.index(f"  o/{repo}:")
+        assert not any(e.startswith("Fetching o/") for e in events)
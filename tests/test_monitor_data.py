@@ -4,8 +4,12 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from fleetroll.commands.monitor import load_tc_worker_data_from_db, most_recent_ok_ts
-from fleetroll.db import get_connection, init_db, insert_tc_worker
+from fleetroll.commands.monitor import (
+    AuditLogTailer,
+    load_tc_worker_data_from_db,
+    most_recent_ok_ts,
+)
+from fleetroll.db import get_connection, init_db, insert_host_observation, insert_tc_worker
 
 
 @pytest.fixture
@@ -160,3 +164,25 @@ def test_most_recent_ok_ts_mixed_ts_presence() -> None:
         "host2": {"ok": 1, "ts": "2026-04-23T10:00:00+00:00"},
     }
     assert most_recent_ok_ts(latest_ok) == "2026-04-23T10:00:00+00:00"
+
+
+def test_audit_log_tailer_drains_batch_in_order(db_conn) -> None:
+    """The tailer returns each new observation once, oldest first, then None."""
+    conn = db_conn
+    insert_host_observation(conn, {"host": "host1", "ts": "2026-04-23T08:00:00+00:00", "ok": 1})
+    conn.commit()
+    tailer = AuditLogTailer(conn, hosts=["host1", "host2"])
+
+    for i, host in enumerate(["host1", "host2", "host1"]):
+        ts = f"2026-04-23T09:00:0{i}+00:00"
+        insert_host_observation(conn, {"host": host, "ts": ts, "ok": 1})
+    insert_host_observation(conn, {"host": "other", "ts": "2026-04-23T09:00:09+00:00", "ok": 1})
+    conn.commit()
+
+    polled = [tailer.poll() for _ in range(4)]
+    assert [(r["host"], r["ts"]) for r in polled[:3]] == [
+        ("host1", "2026-04-23T09:00:00+00:00"),
+        ("host2", "2026-04-23T09:00:01+00:00"),
+        ("host1", "2026-04-23T09:00:02+00:00"),
+    ]
+    assert polled[3] is None
@@ -127,6 +127,23 @@ def _worker_type_override_record() -> dict:
     }
 
 
+def test_build_row_values_vault_mnemonic_matches_humanhash() -> None:
+    """The VLT_SHA cell and vlt_mnemonic field both carry the vault SHA's humanhash."""
+    from fleetroll.humanhash import humanize
+
+    vault_sha = "ab" * 32
+    record = {
+        "ok": True,
+        "ts": "2026-01-21T21:52:57+00:00",
+        "observed": {"vault_sha256": vault_sha},
+    }
+    mnemonic = humanize(vault_sha, words=2)
+    for _ in range(2):
+        values = build_row_values("host1", record)
+        assert values["vlt_mnemonic"] == mnemonic
+        assert values["vlt_sha"] == f"{vault_sha[:8]} {mnemonic}"
+
+
 def test_build_row_values_worker_type_override_marker_and_fields() -> None:
     """An override setting WORKER_TYPE_OVERRIDE marks OVR_BCH and sets wt_ovr/pool."""
     from fleetroll.commands.monitor.cache import ShaInfoCache
@@ -217,6 +234,25 @@ def test_compute_columns_drops_sha_columns_when_narrow() -> None:
     assert "sha" not in columns
 
 
+def test_compute_columns_narrow_call_does_not_affect_wide_call() -> None:
+    """Dropped columns and capped widths from one call must not leak into the next."""
+    record = {
+        "ok": True,
+        "ts": "2026-01-21T21:52:57+00:00",
+        "observed": {"role_present": True, "role": "r" * 60},
+    }
+    hosts = ["host1"]
+    narrow_columns, _ = compute_columns_and_widths(
+        hosts=hosts, latest={"host1": record}, max_width=20
+    )
+    wide_columns, wide_widths = compute_columns_and_widths(
+        hosts=hosts, latest={"host1": record}, max_width=0
+    )
+    assert len(narrow_columns) < len(wide_columns)
+    assert "note" in wide_columns
+    assert wide_widths["role"] == 40
+
+
 def test_render_monitor_lines_sorted_and_sliced() -> None:
     record = {
         "ok": True,
@@ -253,6 +289,28 @@ def test_render_monitor_lines_sorted_and_sliced() -> None:
 # Records no longer contain path fields after CLI path arguments were removed
 
 
+def test_render_monitor_lines_builds_each_row_once(monkeypatch) -> None:
+    """Rows built for the width pass should be reused, not rebuilt for output."""
+    from fleetroll.commands.monitor import formatting
+
+    calls: list[str] = []
+    real_build = formatting.build_row_values
+
+    def counting_build(host, *args, **kwargs):
+        calls.append(host)
+        return real_build(host, *args, **kwargs)
+
+    monkeypatch.setattr(formatting, "build_row_values", counting_build)
+    record = {"ok": True, "ts": "2026-01-21T21:52:57+00:00", "observed": {}}
+    hosts = ["host1", "host2", "host3"]
+    _, lines = render_monitor_lines(
+        hosts=hosts, latest=dict.fromkeys(hosts, record), max_width=0, start=1
+    )
+    assert len(lines) == 2
+    assert lines[0].startswith("host2")
+    assert sorted(calls) == hosts
+
+
 def test_quarantine_status_checks_future():
     """TC_QUAR should only show YES if quarantine time is in the future."""
     from datetime import datetime, timedelta
@@ -291,6 +349,45 @@ def test_quarantine_status_checks_future():
     assert values["tc_quar"] == "-"
 
 
+def test_age_seconds_uses_supplied_now() -> None:
+    """age_seconds should measure against the caller's timestamp when given."""
+    now = datetime(2026, 1, 21, 22, 0, 0, tzinfo=UTC)
+    ts = (now - timedelta(seconds=120)).isoformat()
+    assert age_seconds(ts, now=now) == 120
+    assert age_seconds(ts, now=now + timedelta(seconds=30)) == 150
+
+
+def test_build_row_values_precomputed_display_host() -> None:
+    """A precomputed display_host is used for every row status instead of fqdn_suffix."""
+    ok = {"ok": True, "ts": "2026-01-21T21:52:57+00:00", "observed": {}}
+    fail = {"ok": False, "ts": "2026-01-21T21:52:57+00:00", "error": "boom"}
+    host = "host1.example.com"
+    for record, last_ok in ((ok, None), (fail, ok), (fail, None), (None, None)):
+        values = build_row_values(
+            host, record, last_ok=last_ok, fqdn_suffix=".example.com", display_host="h1"
+        )
+        assert values["host"] == "h1"
+    assert build_row_values(host, ok, fqdn_suffix=".example.com")["host"] == "host1"
+
+
+def test_build_row_values_naive_tc_timestamps_treated_as_utc() -> None:
+    """Naive TC timestamps should be read as UTC in every column that uses them."""
+    now = datetime(2026, 1, 21, 22, 0, 0, tzinfo=UTC)
+    record = {"ok": True, "ts": "2026-01-21T21:50:00+00:00", "observed": {}}
+    tc_data = {
+        "ts": "2026-01-21T21:40:00",
+        "last_date_active": "2026-01-21T21:30:00",
+        "quarantine_until": "2026-01-21T23:00:00",
+        "task_started": "2026-01-21T21:35:00",
+        "task_resolved": None,
+    }
+    values = build_row_values("host1", record, tc_data=tc_data, now=now)
+    assert values["tc_quar"] == "YES"
+    assert values["tc_act"] == "30m"
+    assert values["tc_j_sf"] == "5m -"
+    assert values["data"] == "10m/20m"
+
+
 def test_puppet_columns_pp_match_healthy():
     """Test PP_LAST, PP_MATCH, HEALTHY columns with SHA-based logic."""
     from datetime import datetime
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import threading
 import time
 from pathlib import Path
 
@@ -44,11 +43,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert mock_run_ssh.call_count == 1
@@ -70,11 +67,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert mock_run_ssh.call_count == 1
@@ -96,11 +91,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert mock_run_ssh.call_count == 1
@@ -121,11 +114,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert mock_run_ssh.call_count == 1
@@ -146,11 +137,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should not retry on permission denied
@@ -171,11 +160,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should not retry - auth error is not a connection error
@@ -199,11 +186,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should not retry - protocol error is not a connection error
@@ -227,11 +212,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should retry on network unreachable (connection error)
@@ -257,11 +240,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should retry on no route to host (connection error)
@@ -287,11 +268,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert result["ok"] is False
@@ -311,11 +290,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() - 1},  # Already expired
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() - 1,  # Already expired
         )
 
         assert result["ok"] is False
@@ -342,11 +319,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         # Should have made 4 attempts (max retries = 4)
@@ -378,11 +353,9 @@ class TestRetryLogic:
             args=args,
             ssh_opts=[],
             include_content=False,
-            db_path=tmp_dir / "test.db",
+            writer=mocker.MagicMock(),
             actor="test",
-            retry_budget={"deadline": time.time() + 600},
-            lock=threading.Lock(),
-            log_lock=threading.Lock(),
+            deadline=time.monotonic() + 600,
         )
 
         assert "attempts" in result
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import shlex
 from pathlib import Path
 
 from fleetroll.cli_types import HostAuditArgs
-from fleetroll.constants import CONTENT_SENTINEL
+from fleetroll.constants import CONTENT_SENTINEL, VAULT_CONTENT_KEY
 from fleetroll.ssh import (
+    audit_script_body,
     build_ssh_options,
     is_windows_host,
     parse_backup_path,
@@ -15,12 +17,13 @@ from fleetroll.ssh import (
     remote_set_script,
     remote_unset_script,
     remote_windows_audit_script,
+    ssh_mux_options,
     windows_ssh_host,
 )
 
 
 def make_test_args(
-    *, ssh_option: list[str] | None = None, connect_timeout: int = 10
+    *, ssh_option: tuple[str, ...] | None = None, connect_timeout: int = 10
 ) -> HostAuditArgs:
     """Helper to create HostAuditArgs for testing with minimal required fields."""
     return HostAuditArgs(
@@ -58,14 +61,14 @@ class TestBuildSshOptions:
 
     def test_single_ssh_option(self, tmp_audit_log: Path):
         """Single --ssh-option is parsed correctly."""
-        args = make_test_args(ssh_option=["-p 2222"])
+        args = make_test_args(ssh_option=("-p 2222",))
         opts = build_ssh_options(args)
         assert "-p" in opts
         assert "2222" in opts
 
     def test_multiple_ssh_options(self, tmp_audit_log: Path):
         """Multiple --ssh-option flags are parsed correctly."""
-        args = make_test_args(ssh_option=["-p 2222", "-J bastion.example.com"])
+        args = make_test_args(ssh_option=("-p 2222", "-J bastion.example.com"))
         opts = build_ssh_options(args)
         assert "-p" in opts
         assert "2222" in opts
@@ -74,11 +77,34 @@ class TestBuildSshOptions:
 
     def test_complex_option_with_equals(self, tmp_audit_log: Path):
         """Options with = are handled correctly."""
-        args = make_test_args(ssh_option=["-o UserKnownHostsFile=/dev/null"])
+        args = make_test_args(ssh_option=("-o UserKnownHostsFile=/dev/null",))
         opts = build_ssh_options(args)
         assert "UserKnownHostsFile=/dev/null" in opts
 
 
+class TestSshMuxOptions:
+    """Tests for ssh_mux_options function."""
+
+    def test_options_parse_into_control_settings(self, tmp_path: Path, monkeypatch):
+        """Mux options survive build_ssh_options and point into ~/.fleetroll."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home dir"))
+        opts = build_ssh_options(make_test_args(ssh_option=ssh_mux_options()))
+        assert "ControlMaster=auto" in opts
+        assert "ControlPersist=60s" in opts
+        control_dir = tmp_path / "home dir" / ".fleetroll"
+        assert f"ControlPath={control_dir}/cm-%C" in opts
+        assert control_dir.is_dir()
+        assert control_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_user_options_come_first(self, tmp_path: Path, monkeypatch):
+        """Explicit --ssh-option values precede mux options so they take effect."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        opts = build_ssh_options(
+            make_test_args(ssh_option=("-o ControlMaster=no", *ssh_mux_options()))
+        )
+        assert opts.index("ControlMaster=no") < opts.index("ControlMaster=auto")
+
+
 class TestRemoteAuditScript:
     """Tests for remote_audit_script function."""
 
@@ -102,6 +128,33 @@ class TestRemoteAuditScript:
         # The include_content_cmd variable should be "false"
         assert "if false" in script
 
+    def test_script_is_cached_per_variant(self):
+        """Each include_content variant is built once and matches the quoted body."""
+        assert remote_audit_script(include_content=True) is remote_audit_script(
+            include_content=True
+        )
+        for include_content in (True, False):
+            body = audit_script_body(include_content=include_content)
+            expected = "sh -c " + shlex.quote(body)
+            assert remote_audit_script(include_content=include_content) == expected
+
+    def test_include_vault_content(self):
+        """include_vault_content switches on the inline vault line."""
+        body = audit_script_body(include_content=False, include_vault_content=True)
+        assert f"{VAULT_CONTENT_KEY}=" in body
+        assert 'if true; then\n        case "$known_vault_shas"' in body
+        plain = audit_script_body(include_content=False)
+        assert 'if false; then\n        case "$known_vault_shas"' in plain
+
+    def test_known_vault_shas_passed_as_arguments(self):
+        """Known vault shas follow the quoted body as the script's arguments."""
+        shas = ("a" * 64, "b" * 64)
+        script = remote_audit_script(
+            include_content=False, include_vault_content=True, known_vault_shas=shas
+        )
+        plain = remote_audit_script(include_content=False, include_vault_content=True)
+        assert script == f"{plain} sh {shas[0]} {shas[1]}"
+
     def test_outputs_role_present(self):
         """Script outputs ROLE_PRESENT marker."""
         script = remote_audit_script(include_content=True)
@@ -0,0 +1,352 @@
+"""Tests for the example Taskcluster client (examples/tc_client.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("taskcluster")
+pytest.importorskip("aiohttp")
+requests = pytest.importorskip("requests")
+
+_TC_CLIENT_PATH = Path(__file__).resolve().parents[1] / "examples" / "tc_client.py"
+
+
+@pytest.fixture(scope="module")
+def tc_client():
+    """Load examples/tc_client.py as a module."""
+    spec = importlib.util.spec_from_file_location("tc_client", _TC_CLIENT_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(tc_client, tmp_path: Path):
+    """A TaskclusterClient with dummy credentials and no network access."""
+    creds = tmp_path / "tc_token"
+    creds.write_text(json.dumps({"clientId": "test-client", "accessToken": "test-token"}))
+    with tc_client.TaskclusterClient("https://tc.example.com", credentials_path=str(creds)) as c:
+        yield c
+
+
+def _response(status: int, body: bytes, headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(body)
+    response.url = "https://tc.example.com/graphql"
+    return response
+
+
+WORKER = ("proj-releng", "gecko-t-linux", "mdc1", "worker-1")
+
+
+class TestGetQuarantineDetailsGraphql:
+    """Tests for TaskclusterClient.get_quarantine_details_graphql."""
+
+    def test_http_error_logs_response_body(self, client, monkeypatch, caplog):
+        """A failed request returns None and logs the server's error body."""
+        posts = []
+
+        def post(body):
+            posts.append(body)
+            return _response(500, b'{"errors": [{"message": "boom"}]}')
+
+        monkeypatch.setattr(client, "_post_graphql", post)
+        with caplog.at_level(logging.DEBUG, logger="tc_client"):
+            assert client.get_quarantine_details_graphql(*WORKER) is None
+
+        assert len(posts) == 2  # persisted-query attempt, then the full query
+        assert "Failed to fetch quarantine details for worker-1" in caplog.text
+        assert "GraphQL error response: {'errors': [{'message': 'boom'}]}" in caplog.text
+
+    def test_http_error_with_non_json_body(self, client, monkeypatch, caplog):
+        """An unparseable error body is still reported as a failed fetch."""
+        monkeypatch.setattr(client, "_post_graphql", lambda body: _response(502, b"<html>"))
+        with caplog.at_level(logging.DEBUG, logger="tc_client"):
+            assert client.get_quarantine_details_graphql(*WORKER) is None
+
+        assert "Failed to fetch quarantine details for worker-1" in caplog.text
+        assert "GraphQL error response" not in caplog.text
+
+    def test_httpx_status_error_is_handled(self, client, tc_client, monkeypatch, caplog):
+        """raise_for_status() from the HTTP/2 client takes the same error path."""
+        if tc_client.httpx is None:
+            pytest.skip("httpx[http2] not installed")
+        httpx = tc_client.httpx
+        request = httpx.Request("POST", client.graphql_url)
+        monkeypatch.setattr(
+            client,
+            "_post_graphql",
+            lambda body: httpx.Response(500, content=b'{"errors": []}', request=request),
+        )
+        with caplog.at_level(logging.DEBUG, logger="tc_client"):
+            assert client.get_quarantine_details_graphql(*WORKER) is None
+        assert "GraphQL error response: {'errors': []}" in caplog.text
+
+    def test_results_are_cached_until_invalidated(self, client, monkeypatch):
+        """Repeat lookups are served from the cache; invalidation forces a refetch."""
+        details = [{"quarantineInfo": "maintenance", "updatedAt": "2024-01-01T00:00:00Z"}]
+        body = json.dumps({"data": {"worker": {"quarantineDetails": details}}}).encode()
+        posts = []
+
+        def post(payload):
+            posts.append(payload)
+            return _response(200, body)
+
+        monkeypatch.setattr(client, "_post_graphql", post)
+        assert client.get_quarantine_details_graphql(*WORKER) == details
+        assert client.get_quarantine_details_graphql(*WORKER) == details
+        assert len(posts) == 1
+
+        client.invalidate_quarantine("worker-1")
+        assert client.get_quarantine_details_graphql(*WORKER) == details
+        assert len(posts) == 2
+
+
+class TestGraphqlBatch:
+    """Tests for TaskclusterClient._graphql_batch support detection."""
+
+    def _payloads(self, client, n=2):
+        return [client._view_worker_payload(*WORKER[:3], f"worker-{i}") for i in range(n)]
+
+    def test_transient_failure_keeps_confirmed_batching(self, client, monkeypatch):
+        """A 503 after batching is confirmed skips that chunk but keeps batching on."""
+        ok = json.dumps([{"data": {"worker": None}}] * 2).encode()
+        responses = iter([_response(200, ok), _response(503, b"unavailable"), _response(200, ok)])
+        monkeypatch.setattr(client, "_post_graphql", lambda body: next(responses))
+        payloads = self._payloads(client)
+
+        assert client._graphql_batch(payloads) is not None
+        assert client._graphql_batch_supported is True
+        assert client._graphql_batch(payloads) is None
+        assert client._graphql_batch_supported is True
+        assert client._graphql_batch(payloads) is not None
+
+    def test_transient_failure_before_detection_leaves_it_open(self, client, monkeypatch):
+        """A 500 on the first batch does not decide that batching is unsupported."""
+        monkeypatch.setattr(client, "_post_graphql", lambda body: _response(500, b"oops"))
+        assert client._graphql_batch(self._payloads(client)) is None
+        assert client._graphql_batch_supported is None
+
+    @pytest.mark.parametrize(
+        ("status", "body"),
+        [(400, b'{"errors": [{"message": "bad request"}]}'), (200, b'{"data": null}')],
+    )
+    def test_rejection_disables_batching(self, client, monkeypatch, status, body):
+        """A 4xx or a non-list 2xx body on first use turns batching off."""
+        monkeypatch.setattr(client, "_post_graphql", lambda body_: _response(status, body))
+        assert client._graphql_batch(self._payloads(client)) is None
+        assert client._graphql_batch_supported is False
+
+
+class TestPostGraphqlThrottling:
+    """Tests for TaskclusterClient._post_graphql retries on 429/503."""
+
+    def test_throttled_request_is_retried_with_capped_delay(self, client, tc_client, monkeypatch):
+        """A 429 with a huge Retry-After is retried after the capped delay, outside the slot."""
+        responses = iter([_response(429, b"", {"Retry-After": "86400"}), _response(200, b"{}")])
+        posts = []
+
+        def post(url, headers, data):
+            posts.append(data)
+            return next(responses)
+
+        semaphore = threading.BoundedSemaphore(1)
+        sleeps = []
+
+        def sleep(delay):
+            # The concurrency slot must be free while waiting out the throttle
+            assert semaphore.acquire(blocking=False)
+            semaphore.release()
+            sleeps.append(delay)
+
+        monkeypatch.setattr(client, "_graphql_client", None)
+        monkeypatch.setattr(client._session, "post", post)
+        monkeypatch.setattr(client, "_gql_semaphore", semaphore)
+        monkeypatch.setattr(tc_client.time, "sleep", sleep)
+
+        response = client._post_graphql(b"{}")
+
+        assert response.status_code == 200
+        assert len(posts) == 2
+        assert sleeps == [tc_client.GRAPHQL_MAX_RETRY_AFTER_S]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("2", 2.0), ("Fri, 31 Dec 9999 23:59:59 GMT", None), (None, 1.0)],
+    )
+    def test_retry_after_seconds(self, tc_client, value, expected):
+        """Delta-seconds are used as-is, far-future dates are capped, and absent uses back-off."""
+        if expected is None:
+            expected = tc_client.GRAPHQL_MAX_RETRY_AFTER_S
+        assert tc_client._retry_after_seconds(value, 0) == expected
+
+
+def _details(worker_id: str) -> list[dict[str, str]]:
+    return [{"quarantineInfo": f"reason {worker_id}", "updatedAt": "2024-01-01T00:00:00Z"}]
+
+
+def _fake_graphql(*, batching: bool):
+    """Build a _post_graphql stand-in that answers ViewWorker operations."""
+    posts = []
+
+    def answer(op):
+        worker_id = op["variables"]["workerId"]
+        return {"data": {"worker": {"quarantineDetails": _details(worker_id)}}}
+
+    def post(body):
+        op = json.loads(body)
+        posts.append(op)
+        if isinstance(op, list):
+            if not batching:
+                return _response(400, b'{"errors": [{"message": "batching disabled"}]}')
+            return _response(200, json.dumps([answer(o) for o in op]).encode())
+        return _response(200, json.dumps(answer(op)).encode())
+
+    return post, posts
+
+
+def _fake_list_workers(pages: list[list[dict]]):
+    """Build a session.get stand-in serving listWorkers pages with continuation tokens."""
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        calls.append((url, dict(params)))
+        index = int(params.get("continuationToken", 0))
+        page = {"workers": pages[index]}
+        if index + 1 < len(pages):
+            page["continuationToken"] = str(index + 1)
+        return _response(200, json.dumps(page).encode())
+
+    return get, calls
+
+
+# Two listWorkers pages holding seven workers
+PAGES = [
+    [{"workerId": f"w{i}", "workerGroup": "mdc1"} for i in range(4)],
+    [{"workerId": f"w{i}", "workerGroup": "mdc1"} for i in range(4, 7)],
+]
+
+
+class TestListWorkers:
+    """Tests for REST listWorkers paging and the quarantined-workers fan-out."""
+
+    def test_list_all_workers_follows_continuation_tokens(self, client, tc_client, monkeypatch):
+        """Every page is requested at the maximum size until no token is returned."""
+        get, calls = _fake_list_workers(PAGES)
+        monkeypatch.setattr(client._session, "get", get)
+
+        workers = client.list_all_workers("proj-releng", "gecko-t-linux")
+
+        assert [w["workerId"] for w in workers] == [f"w{i}" for i in range(7)]
+        url = "https://tc.example.com/api/queue/v1/provisioners/proj-releng/worker-types/gecko-t-linux/workers"
+        limit = str(tc_client.LIST_WORKERS_PAGE_LIMIT)
+        assert calls == [(url, {"limit": limit}), (url, {"limit": limit, "continuationToken": "1"})]
+
+    @pytest.mark.parametrize("batching", [True, False])
+    def test_fetch_details_returns_every_worker(self, client, monkeypatch, batching):
+        """Details fetched alongside pagination land on every worker, batched or not."""
+        get, calls = _fake_list_workers(PAGES)
+        post, posts = _fake_graphql(batching=batching)
+        monkeypatch.setattr(client._session, "get", get)
+        monkeypatch.setattr(client, "_post_graphql", post)
+
+        workers = client.list_quarantined_workers(
+            "proj-releng", "gecko-t-linux", fetch_details=True, max_workers=3, batch_size=2
+        )
+
+        assert [w["workerId"] for w in workers] == [f"w{i}" for i in range(7)]
+        for w in workers:
+            assert w["quarantineInfo"] == f"reason {w['workerId']}"
+            assert w["quarantineDetailsHistory"] == _details(w["workerId"])
+        assert all(params["quarantined"] == "true" for _url, params in calls)
+        assert client._graphql_batch_supported is batching
+        if batching:
+            assert all(isinstance(op, list) for op in posts)
+            assert sum(len(op) for op in posts) == 7
+
+    def test_inline_quarantine_details_skip_graphql(self, client, monkeypatch):
+        """A listing that already carries quarantineDetails sends no GraphQL requests."""
+        pages = [
+            [{"workerId": f"w{i}", "workerGroup": "mdc1", "quarantineDetails": _details(f"w{i}")}]
+            for i in range(2)
+        ]
+        get, _calls = _fake_list_workers(pages)
+
+        def post(body):
+            raise AssertionError("unexpected GraphQL request")
+
+        monkeypatch.setattr(client._session, "get", get)
+        monkeypatch.setattr(client, "_post_graphql", post)
+
+        workers = client.list_quarantined_workers(
+            "proj-releng", "gecko-t-linux", fetch_details=True
+        )
+
+        assert [w["quarantineInfo"] for w in workers] == ["reason w0", "reason w1"]
+        assert client._listworkers_has_qd is True
+
+
+class TestPersistedQueries:
+    """Tests for the automatic persisted query path of ViewWorker."""
+
+    def test_unknown_hash_is_registered_with_full_query(self, client, tc_client, monkeypatch):
+        """PersistedQueryNotFound makes the client resend the hash with the full query."""
+        details = _details("worker-1")
+        responses = iter(
+            [
+                _response(200, b'{"errors": [{"message": "PersistedQueryNotFound"}]}'),
+                _response(
+                    200, json.dumps({"data": {"worker": {"quarantineDetails": details}}}).encode()
+                ),
+            ]
+        )
+        posts = []
+
+        def post(body):
+            posts.append(json.loads(body))
+            return next(responses)
+
+        monkeypatch.setattr(client, "_post_graphql", post)
+
+        assert client.get_quarantine_details_graphql(*WORKER) == details
+
+        sha = tc_client._QUERY_HASHES[tc_client._VIEW_WORKER_QUERY]
+        first, second = posts
+        assert "query" not in first
+        assert first["extensions"]["persistedQuery"]["sha256Hash"] == sha
+        assert second["query"] == tc_client._VIEW_WORKER_QUERY
+        assert second["extensions"]["persistedQuery"]["sha256Hash"] == sha
+        assert client._apq_supported is None
+
+    def test_unsupported_persisted_queries_stop_hash_attempts(self, client, monkeypatch):
+        """PersistedQueryNotSupported turns APQ off so later lookups send the query directly."""
+        details = _details("worker-1")
+        ok = _response(
+            200, json.dumps({"data": {"worker": {"quarantineDetails": details}}}).encode()
+        )
+        responses = iter(
+            [_response(200, b'{"errors": [{"message": "PersistedQueryNotSupported"}]}'), ok]
+        )
+        posts = []
+
+        def post(body):
+            posts.append(json.loads(body))
+            return next(responses)
+
+        monkeypatch.setattr(client, "_post_graphql", post)
+
+        assert client.get_quarantine_details_graphql(*WORKER) == details
+        assert client._apq_supported is False
+        assert "extensions" not in posts[-1]
+        assert "query" in posts[-1]
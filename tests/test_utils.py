@@ -12,6 +12,7 @@ from fleetroll.utils import (
     ensure_host_or_file,
     ensure_parent_dir,
     expand_hostname,
+    fleetroll_version,
     format_host_preview,
     infer_actor,
     is_host_file,
@@ -388,6 +389,23 @@ class TestInferActor:
         assert infer_actor() == "unknown"
 
 
+class TestFleetrollVersion:
+    """Tests for fleetroll_version function."""
+
+    def test_matches_metadata_and_is_cached(self, mocker):
+        """Version comes from package metadata and is read only once."""
+        from importlib.metadata import version
+
+        fleetroll_version.cache_clear()
+        spy = mocker.patch("importlib.metadata.version", side_effect=version)
+        try:
+            assert fleetroll_version() == version("fleetroll")
+            assert fleetroll_version() == version("fleetroll")
+            assert spy.call_count == 1
+        finally:
+            fleetroll_version.cache_clear()
+
+
 class TestDefaultAuditLogPath:
     """Tests for default_audit_log_path function."""
 